@@ -0,0 +1,60 @@
+# f1_analysis_dashboard/benchmarks/bench_lap_cleaning.py
+"""
+Compares the single-pass lap cleaning mask with the previous step-by-step filtering.
+
+Run from the directory containing the package:
+    python -m f1_analysis_dashboard.benchmarks.bench_lap_cleaning --drivers 40 --laps 5000
+"""
+import argparse
+import logging
+import timeit
+
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.utils import lap_cleaning
+
+
+def stepwise_filter(laps: pd.DataFrame) -> pd.DataFrame:
+    """The filter chain formerly duplicated in pace_analysis; each step materialises a new frame."""
+    laps = laps[laps[config.COL_LAP_NUMBER] >= config.MIN_LAP_NUMBER_PACE]
+    laps = laps[laps[config.COL_IS_ACCURATE]]
+    laps = laps.dropna(subset=[config.COL_LAP_TIME_SECONDS])
+    cutoff_time = laps[config.COL_LAP_TIME_SECONDS].median() * config.PACE_FILTER_THRESHOLD
+    return laps[laps[config.COL_LAP_TIME_SECONDS] <= cutoff_time]
+
+
+def single_pass_filter(laps: pd.DataFrame) -> pd.DataFrame:
+    mask, _ = lap_cleaning.clean_laps(laps, strategy='median', scope='global')
+    return laps[mask]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--drivers", type=int, default=40)
+    parser.add_argument("--laps", type=int, default=5000, help="Laps per driver")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO) # Keep per-call log lines out of the timings
+
+    laps = synthetic.make_laps(args.drivers, args.laps)
+    laps[config.COL_LAP_TIME_SECONDS] = laps[config.COL_LAP_TIME].dt.total_seconds()
+    assert stepwise_filter(laps).index.equals(single_pass_filter(laps).index)
+
+    print(f"{len(laps):,} laps ({args.drivers} drivers x {args.laps} laps), best of {args.repeat}:")
+    cases = {
+        'step-by-step (median, global)': lambda: stepwise_filter(laps),
+        'single pass  (median, global)': lambda: single_pass_filter(laps),
+    }
+    for strategy in lap_cleaning.OUTLIER_STRATEGIES:
+        for scope in ('driver', 'team'):
+            cases[f'single pass  ({strategy}, {scope})'] = \
+                lambda strategy=strategy, scope=scope: laps[lap_cleaning.clean_laps(laps, strategy, scope)[0]]
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"  {name + ':':32} {best * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# f1_analysis_dashboard/benchmarks/bench_suite.py
+"""
+Times every analysis and plotting entry point on synthetic sessions of several sizes.
+
+Run from the directory containing the package:
+    python -m f1_analysis_dashboard.benchmarks.bench_suite --save baseline.json
+    python -m f1_analysis_dashboard.benchmarks.bench_suite --compare baseline.json
+"""
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+import timeit
+import warnings
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import matplotlib
+matplotlib.use('Agg') # Never open windows while timing plots
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import (degradation_analysis, lap_analysis, pace_analysis, position_analysis,
+                                                race_trace_analysis, results_analysis, telemetry_analysis)
+from f1_analysis_dashboard.src.plotting import palette, plot_generator
+from f1_analysis_dashboard.src.utils import helpers
+
+# Size tiers: (drivers, laps per driver)
+TIERS: Dict[str, tuple] = {
+    'small': (20, 50),
+    'medium': (20, 78),
+    'large': (30, 200),
+    'xlarge': (40, 500),
+}
+
+# Relative slowdown against the baseline reported as a regression
+DEFAULT_TOLERANCE: float = 0.25
+
+
+def build_cases(session: synthetic.SyntheticSession) -> Dict[str, Callable[[], object]]:
+    """Benchmark cases for one session; plot inputs are computed once up front. Telemetry cases need car data."""
+    session_info = {'Year': session.event.year, 'EventName': session.event['EventName'], 'SessionName': session.name}
+    driver_fastest = lap_analysis.get_driver_fastest_laps(session)
+    constructor_pace = pace_analysis.get_constructor_race_pace(session)
+    race_laps = pace_analysis.get_driver_race_laps(session)
+    tyre_degradation = degradation_analysis.get_tyre_degradation(session)
+    race_trace = race_trace_analysis.get_race_trace(session)
+    position_changes = position_analysis.get_position_changes(session)
+    laps_without_team = session.laps.drop(columns=[config.COL_TEAM])
+
+    cases = {
+        'get_overall_fastest_lap': lambda: lap_analysis.get_overall_fastest_lap(session),
+        'get_driver_fastest_laps': lambda: lap_analysis.get_driver_fastest_laps(session),
+        'get_constructor_race_pace': lambda: pace_analysis.get_constructor_race_pace(session),
+        'get_driver_race_laps': lambda: pace_analysis.get_driver_race_laps(session),
+        'get_official_results': lambda: results_analysis.get_official_results(session),
+        'get_tyre_degradation': lambda: degradation_analysis.get_tyre_degradation(session),
+        'get_race_trace': lambda: race_trace_analysis.get_race_trace(session),
+        'get_position_changes': lambda: position_analysis.get_position_changes(session),
+        'ensure_team_info': lambda: helpers.ensure_team_info(laps_without_team.copy(), session),
+        'prepare_laps': lambda: helpers.prepare_laps(session),
+        'plot_driver_fastest_lap_deltas': lambda: plot_generator.plot_driver_fastest_lap_deltas(driver_fastest, session_info, session),
+        'plot_constructor_pace_deltas': lambda: plot_generator.plot_constructor_pace_deltas(constructor_pace, session_info, session),
+        'plot_driver_pace_distribution': lambda: plot_generator.plot_driver_pace_distribution(race_laps, session_info, session),
+        'plot_tyre_degradation': lambda: plot_generator.plot_tyre_degradation(tyre_degradation, session_info, session),
+        'plot_gap_to_leader': lambda: plot_generator.plot_gap_to_leader(race_trace, session_info, session),
+        'plot_interval_heatmap': lambda: plot_generator.plot_interval_heatmap(race_trace, session_info, session),
+        'plot_position_per_lap': lambda: plot_generator.plot_position_per_lap(race_trace, session_info, session),
+        'plot_position_changes': lambda: plot_generator.plot_position_changes(position_changes, session_info, session),
+    }
+    if session.car_data:
+        traces = telemetry_analysis.get_fastest_lap_telemetry(session)
+        cases.update({
+            'get_fastest_lap_telemetry': lambda: telemetry_analysis.get_fastest_lap_telemetry(session),
+            'minisector_dominance': lambda: telemetry_analysis.minisector_dominance(traces),
+            'plot_telemetry_comparison': lambda: plot_generator.plot_telemetry_comparison(traces, session_info, session),
+            'plot_minisector_dominance': lambda: plot_generator.plot_minisector_dominance(traces, session_info, session),
+        })
+    return cases
+
+
+def cache_fixed_palette(session: synthetic.SyntheticSession):
+    """
+    Caches fixed team colors as the session's palette.
+
+    The real lookup fetches the driver list of the session from the F1 API;
+    benchmarks must neither need network access nor time it.
+    """
+    session_info = {'Year': session.event.year, 'EventName': session.event['EventName'], 'SessionName': session.name}
+    palette.restore(session_info, {
+        'drivers': {driver: None for driver in session.laps[config.COL_DRIVER].unique()}, # Team color instead
+        'teams': {team: f"#{(i * 0x19a3f1) % 0xffffff:06x}" for i, team in enumerate(synthetic.TEAM_NAMES)},
+    })
+
+
+def run_tier(n_drivers: int, n_laps: int, repeat: int, telemetry: bool) -> Dict[str, float]:
+    """Best-of-`repeat` seconds per case for one size tier."""
+    session = synthetic.make_session(n_drivers, n_laps, telemetry=telemetry)
+    cache_fixed_palette(session)
+    timings = {}
+    for name, func in build_cases(session).items():
+        func() # Warm-up (imports, caches such as the colour palette)
+        timings[name] = min(timeit.repeat(func, number=1, repeat=repeat))
+    return timings
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Prints the ratio to the baseline per case and returns the cases slower than the tolerance."""
+    regressions = []
+    for tier, timings in results.items():
+        for name, seconds in timings.items():
+            reference = baseline.get(tier, {}).get(name)
+            if not reference:
+                continue
+            ratio = seconds / reference
+            flag = ''
+            if ratio > 1 + tolerance:
+                flag = '  <-- regression'
+                regressions.append(f"{tier}/{name}")
+            print(f"  {tier + '/' + name + ':':50} {reference * 1000:9.2f} ms -> {seconds * 1000:9.2f} ms ({ratio:5.2f}x){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tiers", nargs='+', default=list(TIERS), choices=TIERS.keys())
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--telemetry", action="store_true",
+                        help="Attach telemetry-scale car data to the synthetic sessions and time the telemetry cases.")
+    parser.add_argument("--save", type=Path, default=None, help="Write the timings to this JSON file.")
+    parser.add_argument("--compare", type=Path, default=None, help="Compare against a JSON file written by --save.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed relative slowdown before a case counts as a regression (default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING) # Keep per-call log lines out of the timings
+    warnings.simplefilter('ignore', FutureWarning) # Library deprecation notices repeat on every call
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        config.OUTPUT_DIR = Path(output_dir)
+        config.PLOT_SHOW = False
+        config.PLOT_FORCE_REPLOT = True # Time the rendering, not the unchanged-plot skip
+        config.TELEMETRY_STORE_ENABLED = False # Synthetic telemetry is read from the session's car data
+        palette.clear_cache()
+        for tier in args.tiers:
+            n_drivers, n_laps = TIERS[tier]
+            print(f"{tier}: {n_drivers} drivers x {n_laps} laps, best of {args.repeat}")
+            results[tier] = run_tier(n_drivers, n_laps, args.repeat, args.telemetry)
+            for name, seconds in results[tier].items():
+                print(f"  {name + ':':34} {seconds * 1000:9.2f} ms")
+
+    if args.save:
+        report = {
+            'meta': {
+                'python': platform.python_version(), 'platform': platform.platform(),
+                'numpy': np.__version__, 'pandas': pd.__version__,
+                'repeat': args.repeat, 'telemetry': args.telemetry,
+            },
+            'results': results,
+        }
+        args.save.write_text(json.dumps(report, indent=2))
+        print(f"Timings written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f"Compared with {args.compare}:")
+        regressions = compare(results, baseline.get('results', {}), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regressions: {', '.join(regressions)}")
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# f1_analysis_dashboard/benchmarks/synthetic.py
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from f1_analysis_dashboard import config
+
+TEAM_NAMES = [
+    'Red Bull Racing', 'Ferrari', 'Mercedes', 'McLaren', 'Aston Martin',
+    'Alpine', 'Williams', 'Haas F1 Team', 'Kick Sauber', 'RB',
+]
+
+
+def driver_codes(n_drivers: int) -> list:
+    """Unique three-letter driver codes ('AAA', 'AAB', ...)."""
+    letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    return [letters[i // 676 % 26] + letters[i // 26 % 26] + letters[i % 26] for i in range(n_drivers)]
+
+
+def make_laps(n_drivers: int = 20, n_laps: int = 57, seed: int = 0) -> pd.DataFrame:
+    """
+    Builds a realistic race laps frame (one row per driver and lap) without network access.
+
+    Includes a slow first lap, pit-stop laps, occasional inaccurate or
+    missing lap times and tyre stints, with the columns the analyses use.
+    """
+    rng = np.random.default_rng(seed)
+    drivers = driver_codes(n_drivers)
+    n_rows = n_drivers * n_laps
+
+    driver_col = np.repeat(drivers, n_laps)
+    lap_number = np.tile(np.arange(1, n_laps + 1), n_drivers).astype(float)
+    team_col = np.repeat([TEAM_NAMES[i // 2 % len(TEAM_NAMES)] for i in range(n_drivers)], n_laps)
+
+    driver_pace = np.repeat(rng.normal(92.0, 0.6, n_drivers), n_laps)
+    stint_length = max(n_laps // 3, 1)
+    tyre_life = (lap_number - 1) % stint_length + 1
+    seconds = driver_pace + 0.05 * tyre_life + rng.normal(0, 0.35, n_rows)
+    seconds[lap_number == 1] += 8.0
+    pit_laps = (lap_number % stint_length == 0) & (lap_number < n_laps)
+    seconds[pit_laps] += 21.0
+
+    lap_time = pd.to_timedelta(seconds, unit='s')
+    lap_time = lap_time.where(rng.random(n_rows) > 0.01) # ~1% missing times
+    sector_share = rng.uniform(0.3, 0.36, (3, n_rows))
+    sector_share /= sector_share.sum(axis=0)
+    session_time = pd.to_timedelta(np.cumsum(seconds.reshape(n_drivers, n_laps), axis=1).ravel(), unit='s')
+
+    return pd.DataFrame({
+        config.COL_DRIVER: driver_col,
+        'DriverNumber': np.repeat([str(i + 1) for i in range(n_drivers)], n_laps),
+        config.COL_TEAM: team_col,
+        config.COL_LAP_NUMBER: lap_number,
+        config.COL_LAP_TIME: lap_time,
+        config.COL_SECTOR1: pd.to_timedelta(seconds * sector_share[0], unit='s'),
+        config.COL_SECTOR2: pd.to_timedelta(seconds * sector_share[1], unit='s'),
+        config.COL_SECTOR3: pd.to_timedelta(seconds * sector_share[2], unit='s'),
+        config.COL_COMPOUND: np.where(lap_number <= stint_length, 'SOFT', np.where(lap_number <= 2 * stint_length, 'MEDIUM', 'HARD')),
+        config.COL_TYRE_LIFE: tyre_life,
+        config.COL_IS_ACCURATE: rng.random(n_rows) > 0.05,
+        config.COL_TIME: session_time,
+    })
+
+
+def make_results(laps: pd.DataFrame) -> pd.DataFrame:
+    """Builds a session results frame (one row per driver) matching a synthetic laps frame."""
+    finish = laps.groupby(config.COL_DRIVER, sort=False).agg(
+        team=(config.COL_TEAM, 'first'),
+        number=('DriverNumber', 'first'),
+        laps=(config.COL_LAP_NUMBER, 'max'),
+        total=(config.COL_TIME, 'max'),
+    ).sort_values('total')
+    n_drivers = len(finish)
+    points_table = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+    return pd.DataFrame({
+        'DriverNumber': finish['number'].to_numpy(),
+        config.COL_ABBREVIATION: finish.index.to_numpy(),
+        config.COL_FULL_NAME: [f"Driver {code}" for code in finish.index],
+        config.COL_TEAM_NAME: finish['team'].to_numpy(),
+        config.COL_POSITION: np.arange(1, n_drivers + 1, dtype=float),
+        'GridPosition': np.arange(n_drivers, 0, -1, dtype=float),
+        config.COL_STATUS: 'Finished',
+        config.COL_TIME: (finish['total'] - finish['total'].iloc[0]).where(np.arange(n_drivers) > 0, finish['total']).to_numpy(),
+        config.COL_POINTS: [float(points_table[i]) if i < len(points_table) else 0.0 for i in range(n_drivers)],
+        'Laps': finish['laps'].to_numpy(),
+    })
+
+
+def make_telemetry(laps: pd.DataFrame, frequency_hz: float = 4.0, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    """
+    Builds car telemetry frames at roughly FastF1's sample rate, keyed by driver number.
+
+    A 57-lap race of 20 drivers at 4 Hz gives ~450k samples in total, the
+    scale of a real session's car data.
+    """
+    rng = np.random.default_rng(seed)
+    telemetry = {}
+    for driver_number, driver_laps in laps.groupby('DriverNumber', sort=False):
+        end = driver_laps[config.COL_TIME].max().total_seconds()
+        session_time = np.arange(0.0, end, 1.0 / frequency_hz)
+        n_samples = len(session_time)
+        speed = np.clip(220 + 80 * np.sin(session_time / 7.0) + rng.normal(0, 5, n_samples), 60, 340)
+        telemetry[str(driver_number)] = pd.DataFrame({
+            'SessionTime': pd.to_timedelta(session_time, unit='s'),
+            'Speed': speed,
+            'RPM': speed * 40 + 2000,
+            'nGear': np.clip(speed // 45, 1, 8).astype(int),
+            'Throttle': np.clip((speed - 100) / 2.4, 0, 100),
+            'Brake': np.gradient(speed) < -2,
+            'DRS': np.zeros(n_samples, dtype=int),
+            'Distance': np.cumsum(speed / 3.6 / frequency_hz),
+            'X': 3000 * np.cos(session_time / 14.0),
+            'Y': 2000 * np.sin(session_time / 14.0),
+        })
+    return telemetry
+
+
+class SyntheticSession:
+    """
+    Session-like object with the attributes the analyses and plots read.
+
+    `event` mirrors the fields of a FastF1 Event used for reporting and colour
+    lookups; `car_data` is only populated when telemetry was requested.
+    """
+
+    def __init__(self, laps: pd.DataFrame, results: pd.DataFrame, year: int = 2023,
+                 event_name: str = 'Synthetic Grand Prix', name: str = 'Race',
+                 car_data: Optional[Dict[str, pd.DataFrame]] = None):
+        self.laps = laps
+        self.results = results
+        self.name = name
+        self.event = pd.Series({'EventName': event_name, 'RoundNumber': 1,
+                                'EventDate': pd.Timestamp(f'{year}-06-01')})
+        self.event.year = year
+        self.car_data = car_data or {}
+
+
+def make_session(n_drivers: int = 20, n_laps: int = 57, telemetry: bool = False,
+                 seed: int = 0) -> SyntheticSession:
+    """Builds a complete synthetic race session (laps, results and optional telemetry)."""
+    laps = make_laps(n_drivers, n_laps, seed)
+    car_data = make_telemetry(laps, seed=seed) if telemetry else None
+    return SyntheticSession(laps, make_results(laps), car_data=car_data)
@@ -1,6 +1,7 @@
 # f1_analysis_dashboard/config.py
 import os
 from pathlib import Path
+from typing import Optional, Tuple
 
 # --- Core Settings ---
 # Default values, can be overridden by command-line arguments in main.py
@@ -13,21 +14,100 @@ DEFAULT_EVENT: str = 'Jeddah' # Use GP name or Round Number or City
 # CACHE_DIR: Path = Path(os.getenv('FF1_CACHE_PATH', '/tmp/ff1_cache')) # Example using env var or default tmp
 CACHE_DIR: Path = Path(__file__).parent.parent / '.ff1_cache' # Cache inside project dir
 CACHE_ENABLED: bool = True
+# Second cache tier: already-parsed laps/results stored as typed columnar .npz files,
+# so repeat runs skip FastF1 parsing. Only used when CACHE_ENABLED is True.
+SESSION_STORE_ENABLED: bool = True
+SESSION_STORE_DIR: Path = CACHE_DIR / 'parsed_sessions'
+# Telemetry store: per-driver car/position channels as fixed-dtype .npy files that are
+# memory-mapped on read. When a store exists, telemetry is not re-loaded through FastF1.
+TELEMETRY_STORE_ENABLED: bool = True
+TELEMETRY_STORE_DIR: Path = CACHE_DIR / 'telemetry'
+
+# Third cache tier: analysis results of completed sessions, keyed by session, analysis,
+# relevant settings and code version. A run whose analyses are all cached skips loading.
+RESULT_CACHE_ENABLED: bool = True
+RESULT_CACHE_DIR: Path = CACHE_DIR / 'results'
+# Least recently used results are deleted once the directory exceeds this size
+RESULT_CACHE_MAX_BYTES: int = 64 * 2**20
 
 # --- Data Loading Settings ---
 # What data aspects to load by default. Can be memory intensive.
 LOAD_CONFIG = {
     'laps': True,
-    'telemetry': False, # Telemetry is very large, keep False unless needed
+    'telemetry': False, # Telemetry is very large, keep False unless needed (see TELEMETRY_STORE_ENABLED)
     'weather': False,
     'messages': False
 }
 
+# Opt-in compact dtypes applied at load time (categorical strings, small ints,
+# float32-second times). Reduces memory for season-scale aggregation.
+COMPACT_DTYPES: bool = False
+
 # --- Analysis Settings ---
 # Threshold for filtering outlier laps (e.g., 1.15 means keep laps within 115% of median)
 PACE_FILTER_THRESHOLD: float = 1.15
 # Minimum lap number to consider for pace analysis (ignores formation/first lap)
 MIN_LAP_NUMBER_PACE: int = 2
+# Outlier cutoff for pace analysis: 'median' (PACE_FILTER_THRESHOLD x median), 'mad' or 'iqr'
+PACE_OUTLIER_STRATEGY: str = 'median'
+# Compute the outlier statistics over all laps ('global') or per 'driver' / 'team'
+PACE_OUTLIER_SCOPE: str = 'global'
+# 'mad': keep laps within this many (normal-scaled) median absolute deviations of the median
+PACE_MAD_THRESHOLD: float = 3.0
+# 'iqr': keep laps within [Q1 - k*IQR, Q3 + k*IQR]
+PACE_IQR_FACTOR: float = 1.5
+# Tyre degradation: polynomial degree of the lap time vs. tyre life fit per stint (1 linear, 2 quadratic)
+DEGRADATION_FIT_DEGREE: int = 1
+# Stints with fewer pace-valid laps than this are not fitted
+DEGRADATION_MIN_STINT_LAPS: int = 5
+# Telemetry comparison: spacing in metres of the shared distance axis of the fastest-lap traces
+TELEMETRY_DISTANCE_STEP: float = 5.0
+# Number of equal-length mini-sectors for the fastest-driver (dominance) map
+TELEMETRY_MINI_SECTORS: int = 25
+# Fastest N drivers overlaid in the telemetry trace plot
+TELEMETRY_PLOT_DRIVERS: int = 5
+# Position changes are also summarised over windows of this many laps
+POSITION_LAP_WINDOW: int = 10
+
+# --- Console Output ---
+# Print each session's results as a JSON document instead of the text report (--json)
+OUTPUT_JSON: bool = False
+
+# --- Profiling ---
+# Print per-stage wall/CPU timings and write a JSON timing report per session (--profile)
+PROFILE_ENABLED: bool = False
+# Additionally write a cProfile .prof file per session (--profile-cprofile)
+PROFILE_CPROFILE: bool = False
+
+# --- Metrics Export ---
+# File the run's counters and histograms are written to at exit (None: not exported)
+METRICS_FILE: Optional[Path] = None
+# 'prometheus' (textfile collector format) or 'jsonl'; None picks by file extension
+METRICS_FORMAT: Optional[str] = None
+
+# --- Cache Prefetch (prefetch.py) ---
+# Concurrent page downloads when warming the cache for a season
+PREFETCH_WORKERS: int = 8
+# Retries per page after a connection error, timeout, 429 or 5xx, with exponential backoff
+PREFETCH_RETRIES: int = 3
+PREFETCH_BACKOFF_SECONDS: float = 0.5
+PREFETCH_TIMEOUT_SECONDS: float = 30.0
+# Livetiming API base URLs tried in order; None uses FastF1's API and its mirror
+PREFETCH_BASE_URLS: Optional[Tuple[str, ...]] = None
+
+# --- Async API (src/async_api.py) ---
+# Worker threads running blocking loads and analyses for the asyncio facade
+ASYNC_WORKERS: int = 4
+
+# --- Live Mode (live.py) ---
+# Default TCP port of the feed stand-in (live.py --serve)
+LIVE_FEED_PORT: int = 8051
+
+# --- Analysis Server (server.py) ---
+SERVER_HOST: str = '127.0.0.1'
+SERVER_PORT: int = 8050
+# Approximate memory budget for analysed sessions kept in memory; least recently used are evicted
+SERVER_CACHE_MAX_BYTES: int = 1024 * 2**20
 
 # --- Plotting Settings ---
 OUTPUT_DIR: Path = Path(__file__).parent.parent / 'output'
@@ -35,6 +115,10 @@ PLOT_FORMAT: str = 'png'
 PLOT_DPI: int = 150
 PLOT_SHOW: bool = False # Set to True to display plots interactively
 PLOT_SAVE: bool = True # Set to True to save plots to OUTPUT_DIR
+# False skips all plotting; the plotting stack (matplotlib, seaborn) is then never imported
+PLOT_ENABLED: bool = True
+# Re-render plots even if their inputs and settings match the hash recorded for the saved file
+PLOT_FORCE_REPLOT: bool = False
 
 # --- FastF1 Plotting Style ---
 # Options: 'fastf1', None, etc.
@@ -64,10 +148,11 @@ COL_IS_ACCURATE = 'IsAccurate'
 COL_ABBREVIATION = 'Abbreviation'
 COL_TEAM_NAME = 'TeamName' # From results
 COL_POSITION = 'Position'
+COL_GRID_POSITION = 'GridPosition' # From results; 0 for a pit-lane start
 COL_FULL_NAME = 'FullName'
 COL_STATUS = 'Status'
 COL_TIME = 'Time'
 COL_POINTS = 'Points'
 
-print(f"Config loaded. Cache directory set to: {CACHE_DIR.resolve()}")
-print(f"Output directory set to: {OUTPUT_DIR.resolve()}")
\ No newline at end of file
+# Paths are reported by the entry points (main.py logs them at startup); importing
+# config stays silent so text/JSON output is not interleaved with it.
\ No newline at end of file
@@ -0,0 +1,211 @@
+# f1_analysis_dashboard/live.py
+import argparse
+import json
+import logging
+import math
+import socket
+import socketserver
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.analysis.live_analysis import LiveLapAnalysis
+from f1_analysis_dashboard.src.utils import formatting, logging_setup
+
+logger = logging.getLogger(__name__)
+
+# A feed is a JSON-lines stream with one completed lap per line, in the order the
+# laps were completed. Lap times are in seconds; missing values are null.
+FEED_COLUMNS = [config.COL_DRIVER, config.COL_TEAM, config.COL_LAP_NUMBER, config.COL_LAP_TIME,
+                config.COL_IS_ACCURATE, config.COL_COMPOUND, config.COL_TYRE_LIFE, config.COL_TIME]
+
+
+# --- Argument Parsing ---
+def parse_arguments() -> argparse.Namespace:
+    """Parses command-line arguments for live mode."""
+    parser = argparse.ArgumentParser(description="Update fastest laps and constructor pace lap by lap from a lap feed.")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--feed", type=Path, help="Replay a JSON-lines lap feed from a file.")
+    mode.add_argument("--connect", metavar="HOST:PORT", help="Read the lap feed from a TCP socket.")
+    mode.add_argument("--record", type=Path, help="Write the laps of a completed session (-y/-e/-s) as a feed file.")
+    mode.add_argument("--serve", type=Path, help="Stream a feed file to TCP clients (a stand-in for a live source).")
+    parser.add_argument(
+        "-y", "--year", type=int, default=config.DEFAULT_YEAR,
+        help=f"Championship year for --record (default: {config.DEFAULT_YEAR})"
+    )
+    parser.add_argument(
+        "-e", "--event", type=str, default=config.DEFAULT_EVENT,
+        help=f"Event for --record (default: '{config.DEFAULT_EVENT}')"
+    )
+    parser.add_argument(
+        "-s", "--session", default='R', choices=config.SESSION_TYPES.keys(),
+        help="Session type for --record (default: R)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=config.LIVE_FEED_PORT,
+        help=f"Port for --serve (default: {config.LIVE_FEED_PORT})"
+    )
+    parser.add_argument(
+        "--lap-interval", type=float, default=0.0,
+        help="With --serve, seconds to wait before each new race lap is streamed (default: 0)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10,
+        help="Number of drivers shown in each update (default: 10)"
+    )
+    return parser.parse_args()
+
+
+# --- Feeds ---
+def _feed_value(value: Any) -> Any:
+    """JSON-compatible feed value: Timedeltas in seconds, NaN/NaT as null, NumPy scalars as Python values."""
+    if isinstance(value, pd.Timedelta):
+        return None if pd.isna(value) else value.total_seconds()
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def record_feed(laps: pd.DataFrame, path: Path) -> int:
+    """
+    Writes laps as a feed, ordered by the session time each lap was completed.
+
+    Returns:
+        The number of laps written.
+    """
+    columns = [column for column in FEED_COLUMNS if column in laps.columns]
+    order = [config.COL_TIME, config.COL_LAP_NUMBER] if config.COL_TIME in laps.columns else [config.COL_LAP_NUMBER]
+    ordered = laps.sort_values(order, kind='stable', na_position='last')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in ordered[columns].to_dict('records'):
+            f.write(json.dumps({column: _feed_value(value) for column, value in row.items()}) + '\n')
+    logger.info(f"Wrote {len(ordered)} laps to feed {path}")
+    return len(ordered)
+
+
+def _parse_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as e:
+            logger.warning(f"Skipping malformed feed line: {e}")
+
+
+def read_feed(path: Path) -> Iterator[Dict[str, Any]]:
+    """Lap rows from a feed file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from _parse_lines(f)
+
+
+def read_socket(host: str, port: int, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+    """Lap rows from a TCP feed, until the sender closes the connection."""
+    with socket.create_connection((host, port), timeout=timeout) as connection:
+        with connection.makefile('r', encoding='utf-8') as stream:
+            yield from _parse_lines(stream)
+
+
+def make_feed_server(path: Path, host: str, port: int, lap_interval: float = 0.0) -> socketserver.ThreadingTCPServer:
+    """
+    A TCP server replaying a feed file to every client that connects (not yet serving).
+
+    With `lap_interval`, the server waits that long before the first lap of
+    each new race lap, to mimic laps arriving during a session.
+    """
+    class FeedHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            current_lap = None
+            for line in path.read_text(encoding='utf-8').splitlines():
+                lap_number = json.loads(line).get(config.COL_LAP_NUMBER) if line.strip() else None
+                if lap_interval and lap_number is not None and current_lap is not None and lap_number > current_lap:
+                    time.sleep(lap_interval)
+                if lap_number is not None:
+                    current_lap = max(current_lap or lap_number, lap_number)
+                try:
+                    self.wfile.write(line.encode('utf-8') + b'\n')
+                except OSError:
+                    return # Client went away
+
+    server = socketserver.ThreadingTCPServer((host, port), FeedHandler)
+    server.daemon_threads = True
+    return server
+
+
+# --- Replay ---
+def run_live(rows: Iterable[Dict[str, Any]], engine: LiveLapAnalysis,
+             on_update: Callable[[LiveLapAnalysis], None]) -> LiveLapAnalysis:
+    """
+    Feeds lap rows into the engine and calls `on_update` each time the leader completes a lap.
+
+    Laps completed by the rest of the field after the leader's last lap are
+    reported in one final update at the end of the feed.
+    """
+    pending = False
+    for row in rows:
+        leader_lap = engine.last_lap_number
+        engine.ingest((row,))
+        pending = True
+        if engine.last_lap_number > leader_lap:
+            on_update(engine)
+            pending = False
+    if pending:
+        on_update(engine)
+    return engine
+
+
+def print_update(engine: LiveLapAnalysis, top: int = 10):
+    """Prints the current fastest laps and constructor pace."""
+    print(f"\n--- Lap {engine.last_lap_number} ({engine.laps_ingested} laps received) ---")
+    fastest = engine.driver_fastest_laps()
+    if fastest is not None:
+        print(fastest[[config.COL_DRIVER, config.COL_TEAM, 'LapTimeStr', config.COL_LAP_NUMBER]]
+              .head(top).to_string(index=False))
+    pace = engine.constructor_pace()
+    if pace is not None:
+        print("Constructor median pace:")
+        for team, seconds in pace.items():
+            print(f"  {team}: {formatting.format_timedelta(pd.Timedelta(seconds=seconds))}")
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def main():
+    """Entry point: `python -m f1_analysis_dashboard.live --feed jeddah.jsonl`."""
+    args = parse_arguments()
+    logging_setup.setup_logging()
+    if args.record:
+        session = data_loader.load_session_data(args.year, args.event, config.SESSION_TYPES[args.session],
+                                                load_config={'laps': True, 'telemetry': False,
+                                                             'weather': False, 'messages': False})
+        if session is None:
+            logger.error("Could not load the session to record.")
+            return
+        record_feed(session.laps, args.record)
+        return
+    if args.serve:
+        server = make_feed_server(args.serve, '127.0.0.1', args.port, args.lap_interval)
+        logger.info(f"Streaming {args.serve} on 127.0.0.1:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return
+
+    rows = read_feed(args.feed) if args.feed else read_socket(*_parse_address(args.connect))
+    run_live(rows, LiveLapAnalysis(), lambda engine: print_update(engine, args.top))
+
+
+if __name__ == "__main__":
+    main()
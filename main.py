@@ -1,10 +1,13 @@
 # f1_analysis_dashboard/main.py
 import argparse
+import json
 import logging
 import sys
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from fastf1.ergast.interface import ErgastError
-from typing import List, Union, Optional, Dict, Any
+from typing import List, Union, Optional, Dict, Any, Sequence
 
 # Set up project structure for imports
 # Ensure the project root is discoverable if running main.py directly
@@ -16,25 +19,12 @@ import os
 # Or install the package in editable mode `pip install -e .`
 
 from f1_analysis_dashboard import config
-from f1_analysis_dashboard.src import data_loader
-from f1_analysis_dashboard.src.analysis import lap_analysis, pace_analysis, results_analysis
-from f1_analysis_dashboard.src.plotting import plot_generator
+from f1_analysis_dashboard.src import data_loader, result_cache
+from f1_analysis_dashboard.src.analysis import (degradation_analysis, lap_analysis, pace_analysis, position_analysis,
+                                                race_trace_analysis, results_analysis, telemetry_analysis)
+from f1_analysis_dashboard.src.plotting import render_pool # No matplotlib import; see _plot_generator()
 from f1_analysis_dashboard.src.utils import formatting # For printing summaries
-
-# --- Logging Configuration ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[
-        logging.StreamHandler(sys.stdout) # Output logs to console
-        # Optionally add FileHandler here
-        # logging.FileHandler("f1_analysis.log")
-    ]
-)
-# Silence excessive matplotlib/fastf1 logs if desired
-logging.getLogger('matplotlib').setLevel(logging.WARNING)
-logging.getLogger('fastf1').setLevel(logging.INFO) # Keep FastF1 INFO for loading status
+from f1_analysis_dashboard.src.utils import helpers, logging_setup, metrics, profiling
 
 logger = logging.getLogger(__name__) # Get logger for this module
 
@@ -59,23 +49,153 @@ def parse_arguments() -> argparse.Namespace:
         "--no-cache", action="store_true",
         help="Disable FastF1 caching for this run."
     )
+    parser.add_argument(
+        "--no-result-cache", action="store_true",
+        help="Recompute every analysis instead of reusing cached results of completed sessions."
+    )
     parser.add_argument(
         "--show-plots", action="store_true",
         help="Show plots interactively after generation (default: save only)."
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "-a", "--analyses", nargs='+', default=None, choices=list(ANALYSES),
+        help="Analyses to run; only the session data they need is loaded. Default: all except telemetry_comparison"
+    )
+    parser.add_argument(
+        "--telemetry", action="store_true",
+        help="Always load telemetry, even if no selected analysis needs it (kept in the memory-mapped telemetry store between runs)."
+    )
+    parser.add_argument(
+        "--compact-dtypes", action="store_true",
+        help="Load laps/results with the compact dtype schema and log the memory saved."
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="Number of sessions to load and analyse concurrently (default: 1, serial). Logs and reports are still written session by session, in order."
+    )
+    parser.add_argument(
+        "--force-replot", action="store_true",
+        help="Re-render every plot, even if its data and plot settings are unchanged since it was saved."
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Time every stage (load, analyses, plots, printing), print a summary per session and write a JSON timing report to the output directory."
+    )
+    parser.add_argument(
+        "--profile-cprofile", action="store_true",
+        help="With --profile, also write a cProfile .prof file per session (sessions then run serially)."
+    )
+    parser.add_argument(
+        "--metrics-file", type=Path, default=None,
+        help="At the end of the run, write load/filter/stage/plot metrics to this file (Prometheus textfile, or JSON lines if it ends in .jsonl)."
+    )
+    parser.add_argument(
+        "--metrics-format", choices=metrics.METRICS_FORMATS, default=None,
+        help="Format of --metrics-file (default: from the file extension)."
+    )
+    parser.add_argument(
+        "--no-plots", action="store_true",
+        help="Skip all plots. The plotting libraries are then never imported, which makes startup much faster."
+    )
+    parser.add_argument(
+        "--json", action="store_true",
+        help="Print each session's analysis results as one JSON document instead of the text report."
+    )
+    parser.add_argument(
+        "--render-workers", type=int, default=0,
+        help="Render and save plots in N headless worker processes while analysis continues (default: 0, render inline)."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.render_workers < 0:
+        parser.error("--render-workers must not be negative")
+    if args.metrics_format and not args.metrics_file:
+        parser.error("--metrics-format requires --metrics-file")
+    return args
 
 # --- Main Analysis Orchestration ---
-def run_session_analysis(year: int, event: Union[str, int], session_type: str):
-    """Loads data and runs all analyses for a single session."""
+# Analyses selectable with --analyses; the result key matches the analysis name
+ANALYSES = {
+    'overall_fastest': lap_analysis.get_overall_fastest_lap,
+    'driver_fastest': lap_analysis.get_driver_fastest_laps,
+    'constructor_pace': pace_analysis.get_constructor_race_pace,
+    'official_results': results_analysis.get_official_results,
+    'tyre_degradation': degradation_analysis.get_tyre_degradation,
+    'telemetry_comparison': telemetry_analysis.get_fastest_lap_telemetry,
+    'race_trace': race_trace_analysis.get_race_trace,
+    'position_changes': position_analysis.get_position_changes,
+}
+# Analyses that only make sense for Race sessions
+RACE_ONLY_ANALYSES = {'constructor_pace', 'race_trace', 'position_changes'}
+# Analyses that need telemetry run only when selected with --analyses (telemetry is large)
+OPT_IN_ANALYSES = {'telemetry_comparison'}
+
+
+def analyse_session(year: int, event: Union[str, int], session_type: str,
+                    analyses: Optional[List[str]] = None,
+                    extra_components: Sequence[str] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Loads data and runs the selected analyses for a single session without printing or plotting.
+
+    Only the session components the selected analyses declare are loaded.
+    This stage does no matplotlib work, so it is safe to run in a worker thread.
+
+    Args:
+        year, event, session_type: Session to analyse.
+        analyses: Names from ANALYSES to run (default: all except OPT_IN_ANALYSES).
+        extra_components: Session components to load even if no analysis needs them.
+
+    Returns:
+        A dict with the session, its metadata and every analysis result
+        (None for analyses not run), or None if the session could not be loaded.
+    """
+    label = f"{year}_{str(event).replace(' ', '')}_{session_type}"
+    with metrics.session_scope(label):
+        return _analyse_session(year, event, session_type, analyses, extra_components, label)
+
+
+def _analyse_session(year: int, event: Union[str, int], session_type: str,
+                     analyses: Optional[List[str]], extra_components: Sequence[str],
+                     label: str) -> Optional[Dict[str, Any]]:
     logger.info(f"===== Starting Analysis for {year} {event} - {session_type} =====")
+    timer = profiling.StageTimer(label, cprofile=config.PROFILE_CPROFILE)
 
     session_identifier = config.SESSION_TYPES.get(session_type, session_type) # Get 'R', 'Q' etc.
-    session = data_loader.load_session_data(year, event, session_identifier)
+    selected = [name for name in (analyses or [name for name in ANALYSES if name not in OPT_IN_ANALYSES])
+                if name not in RACE_ONLY_ANALYSES or session_identifier == config.SESSION_TYPES['R']]
+    selected_analyses = {name: ANALYSES[name] for name in selected}
+
+    load_config = data_loader.required_load_config(selected_analyses.values())
+    for component in extra_components:
+        load_config[component] = True
+    with timer.stage('load'):
+        # Completed sessions whose selected analyses are all cached are not loaded at all
+        cached = None
+        if result_cache.is_enabled() and not extra_components:
+            cached = result_cache.load_results(year, event, session_identifier, selected_analyses)
+            if cached is not None and config.PLOT_ENABLED and 'colors' not in cached[0]:
+                cached = None # Plot colors were never recorded; they need the session
+        if cached is None:
+            session = data_loader.load_session_data(year, event, session_identifier, load_config=load_config)
+
+    if cached is not None:
+        session_meta, results = cached
+        timer.label = _session_label(session_meta['session_info'])
+        analysis = {
+            "year": year, "event": event, "session_type": session_type,
+            "session_identifier": session_identifier,
+            "session": None, "session_info": session_meta['session_info'], "timer": timer,
+            "metrics_session": label, "cached_colors": session_meta.get('colors'),
+        }
+        for name in ANALYSES:
+            analysis[name] = results.get(name)
+        return analysis
 
     if session is None:
         logger.error(f"Failed to load data for {session_type}. Skipping analysis.")
-        return # Stop analysis for this session
+        finish_session_timing(timer)
+        return None # Stop analysis for this session
 
     # Prepare session metadata for reporting and plotting
     session_info = {
@@ -83,12 +203,140 @@ def run_session_analysis(year: int, event: Union[str, int], session_type: str):
         "EventName": session.event.get('EventName', str(event)), # Use dict.get for safety
         "SessionName": getattr(session, 'name', session_type)
     }
-    print(f"\n--- Analysis for {session_info['EventName']} {session_info['SessionName']} ({session_info['Year']}) ---")
 
+    timer.label = _session_label(session_info)
+
+    # Copy the laps, fill team info and derive lap seconds once for all analyses
+    prepared_laps = None
+    if load_config['laps']:
+        with timer.stage('prepare_laps'):
+            prepared_laps = helpers.prepare_laps(session)
 
     # --- Run Analyses ---
+    analysis = {
+        "year": year, "event": event, "session_type": session_type,
+        "session_identifier": session_identifier,
+        "session": session, "session_info": session_info, "timer": timer,
+        "metrics_session": label, "cached_colors": None,
+    }
+    for name, analysis_func in ANALYSES.items():
+        if name not in selected:
+            analysis[name] = None
+            continue
+        with timer.stage(f'analysis:{name}'):
+            if 'laps' in getattr(analysis_func, 'required_components', ()):
+                analysis[name] = analysis_func(session, prepared_laps)
+            else:
+                analysis[name] = analysis_func(session)
+    if result_cache.is_enabled():
+        result_cache.save_results(session, year, event, session_identifier, session_info,
+                                  selected_analyses, analysis)
+    return analysis
+
+
+def _session_label(session_info: Dict[str, Any]) -> str:
+    return f"{session_info['Year']}_{str(session_info['EventName']).replace(' ', '')}_{session_info['SessionName']}"
+
+
+def finish_session_timing(timer: profiling.StageTimer):
+    """With --profile, prints the stage summary and writes the timing report (and .prof file) next to the plots."""
+    if not config.PROFILE_ENABLED:
+        return
+    print(f"\n--- Stage Timings ({timer.label}) ---")
+    print(timer.summary_table())
+    timer.write_report(config.OUTPUT_DIR / f"{timer.label}_timings.json")
+    timer.dump_stats(config.OUTPUT_DIR / f"{timer.label}.prof")
+
+
+def _plot_generator():
+    """Imports the plotting stack on first use, so runs without plots never load matplotlib."""
+    from f1_analysis_dashboard.src.plotting import plot_generator
+    return plot_generator
+
+
+def analysis_to_json(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-serialisable copy of an analysis dict: session metadata plus every analysis result."""
+    document = {"session": json.loads(json.dumps(analysis["session_info"], default=str))}
+    for name in ANALYSES:
+        result = analysis[name]
+        if result is None:
+            document[name] = None
+        elif isinstance(result, pd.DataFrame):
+            document[name] = json.loads(result.to_json(orient='records', date_format='iso'))
+        else: # Series: a single lap (overall_fastest) or a per-team value
+            document[name] = json.loads(result.to_json(date_format='iso'))
+    return document
+
+
+def report_session_analysis(analysis: Dict[str, Any]):
+    """
+    Prints the console summary (text or JSON) and generates plots for an analysed session.
+
+    Plotting uses pyplot, so this must run on the main thread.
+    """
+    with metrics.session_scope(analysis["metrics_session"]), analysis["timer"].stage('report'):
+        if config.OUTPUT_JSON:
+            print(json.dumps(analysis_to_json(analysis)))
+        else:
+            _print_report(analysis)
+        _plot(analysis)
+    logger.info(f"===== Finished Analysis for {analysis['year']} {analysis['event']} - {analysis['session_type']} =====")
+
+
+def restore_cached_colors(analysis: Dict[str, Any]):
+    """For results served from the result cache, plots use the colors recorded when the session was loaded."""
+    if analysis["cached_colors"]:
+        from f1_analysis_dashboard.src.plotting import palette
+        palette.restore(analysis["session_info"], analysis["cached_colors"])
+
+
+def _plot(analysis: Dict[str, Any]):
+    """Generates the plots of an analysed session (unless plotting is disabled)."""
+    if not config.PLOT_ENABLED:
+        return
+    timer, session_info, session = analysis["timer"], analysis["session_info"], analysis["session"]
+    restore_cached_colors(analysis)
+    plotted = False
+    if analysis["driver_fastest"] is not None:
+        with timer.stage('plot:driver_fastest'):
+            _plot_generator().plot_driver_fastest_lap_deltas(analysis["driver_fastest"], session_info, session)
+        plotted = True
+    if analysis["constructor_pace"] is not None:
+        with timer.stage('plot:constructor_pace'):
+            _plot_generator().plot_constructor_pace_deltas(analysis["constructor_pace"], session_info, session)
+        plotted = True
+    if analysis["tyre_degradation"] is not None:
+        with timer.stage('plot:tyre_degradation'):
+            _plot_generator().plot_tyre_degradation(analysis["tyre_degradation"], session_info, session)
+    if analysis["telemetry_comparison"] is not None:
+        with timer.stage('plot:telemetry_comparison'):
+            _plot_generator().plot_telemetry_comparison(analysis["telemetry_comparison"], session_info, session)
+        with timer.stage('plot:minisector_dominance'):
+            _plot_generator().plot_minisector_dominance(analysis["telemetry_comparison"], session_info, session)
+        plotted = True
+    if analysis["race_trace"] is not None:
+        for plot in ('gap_to_leader', 'interval_heatmap', 'position_per_lap'):
+            with timer.stage(f'plot:{plot}'):
+                getattr(_plot_generator(), f'plot_{plot}')(analysis["race_trace"], session_info, session)
+        plotted = True
+    if analysis["position_changes"] is not None:
+        with timer.stage('plot:position_changes'):
+            _plot_generator().plot_position_changes(analysis["position_changes"], session_info, session)
+        plotted = True
+    if plotted and session is not None and result_cache.is_enabled():
+        from f1_analysis_dashboard.src.plotting import palette
+        result_cache.save_colors(analysis["year"], analysis["event"], analysis["session_identifier"],
+                                 palette.get_palette(session, session_info).colors())
+
+
+def _print_report(analysis: Dict[str, Any]):
+    """Prints the text report of an analysed session."""
+    session_info = analysis["session_info"]
+    session_identifier = analysis["session_identifier"]
+    print(f"\n--- Analysis for {session_info['EventName']} {session_info['SessionName']} ({session_info['Year']}) ---")
+
     # 1. Overall Fastest Lap
-    overall_fastest = lap_analysis.get_overall_fastest_lap(session)
+    overall_fastest = analysis["overall_fastest"]
     if overall_fastest is not None:
         print("\n--- Overall Fastest Lap ---")
         print(f"Driver: {overall_fastest.get(config.COL_DRIVER, 'N/A')} ({overall_fastest.get(config.COL_TEAM, 'N/A')})")
@@ -101,14 +349,12 @@ def run_session_analysis(year: int, event: Union[str, int], session_type: str):
 
 
     # 2. Driver Fastest Laps
-    driver_fastest = lap_analysis.get_driver_fastest_laps(session)
+    driver_fastest = analysis["driver_fastest"]
     if driver_fastest is not None:
         print(f"\n--- Driver Fastest Laps ({session_info['SessionName']}) ---")
         # Limit printing to top N or use pandas string representation for console
         with pd.option_context('display.max_rows', 10, 'display.width', 100): # Show top 10
              print(driver_fastest[[config.COL_DRIVER, config.COL_TEAM, 'LapTimeStr', config.COL_COMPOUND]].to_string(index=False))
-        # Plotting for driver fastest laps
-        plot_generator.plot_driver_fastest_lap_deltas(driver_fastest, session_info, session)
     else:
          # Still try plotting if get_practice_pace_comparison is called, as it uses the same func
          if session_identifier in ['FP1', 'FP2', 'FP3']: # Check if it was a practice session
@@ -118,57 +364,175 @@ def run_session_analysis(year: int, event: Union[str, int], session_type: str):
               # For now, if df is None, we don't plot.
 
     # 3. Constructor Race Pace (Only for Race Sessions ideally)
-    if session_identifier == config.SESSION_TYPES['R']:
-        constructor_pace = pace_analysis.get_constructor_race_pace(session)
-        if constructor_pace is not None:
-            print("\n--- Constructor Race Pace (Median Lap Time) ---")
-            print("Median Lap Time per Constructor (Lower is better):")
-            for team, pace_seconds in constructor_pace.items():
-                pace_str = formatting.format_timedelta(pd.Timedelta(seconds=pace_seconds))
-                print(f"  {team}: {pace_str}")
-            # Plotting for constructor pace
-            plot_generator.plot_constructor_pace_deltas(constructor_pace, session_info, session)
+    constructor_pace = analysis["constructor_pace"]
+    if constructor_pace is not None:
+        print("\n--- Constructor Race Pace (Median Lap Time) ---")
+        print("Median Lap Time per Constructor (Lower is better):")
+        for team, pace_seconds in constructor_pace.items():
+            pace_str = formatting.format_timedelta(pd.Timedelta(seconds=pace_seconds))
+            print(f"  {team}: {pace_str}")
 
     # 4. Official Results
-    official_results = results_analysis.get_official_results(session)
+    official_results = analysis["official_results"]
     if official_results is not None:
          print(f"\n--- Official Results ({session_info['SessionName']}) ---")
          # Use pandas string representation for clean console output
          with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', 120):
              print(official_results.to_string(index=False))
-    
+
+    # 5. Tyre Degradation
+    tyre_degradation = analysis["tyre_degradation"]
+    if tyre_degradation is not None:
+        print("\n--- Tyre Degradation per Stint (seconds per lap of tyre life) ---")
+        with pd.option_context('display.max_rows', None, 'display.width', 120):
+            print(tyre_degradation[[config.COL_DRIVER, 'Stint', config.COL_COMPOUND, 'FirstLap', 'LastLap', 'Laps', 'DegRate']]
+                  .to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+
+    # 6. Fastest Lap Telemetry: mini-sectors won per driver
+    telemetry_comparison = analysis["telemetry_comparison"]
+    if telemetry_comparison is not None:
+        dominance = telemetry_analysis.minisector_dominance(telemetry_comparison)
+        if dominance is not None:
+            print(f"\n--- Mini-Sector Dominance ({len(dominance)} mini-sectors, fastest laps) ---")
+            for driver, count in dominance[config.COL_DRIVER].value_counts().items():
+                print(f"  {driver}: {count}")
+
+    # 7. Race Trace: final gaps
+    race_trace = analysis["race_trace"]
+    if race_trace is not None:
+        final = race_trace[race_trace[config.COL_LAP_NUMBER] == race_trace[config.COL_LAP_NUMBER].max()]
+        print(f"\n--- Race Trace (Lap {int(final[config.COL_LAP_NUMBER].max())}) ---")
+        with pd.option_context('display.max_rows', None, 'display.width', 120):
+            print(final[[config.COL_POSITION, config.COL_DRIVER, config.COL_TEAM, 'GapToLeader', 'Interval', 'LapsDown']]
+                  .to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+
+    # 8. Position Changes: per driver, then on-track passes per lap window
+    position_changes = analysis["position_changes"]
+    if position_changes is not None:
+        summary = position_analysis.summarize_position_changes(position_changes)
+        print("\n--- Position Changes (grid to last completed lap) ---")
+        with pd.option_context('display.max_rows', None, 'display.width', 120):
+            print(summary.to_string(index=False))
+        windows = position_analysis.summarize_position_changes(position_changes, config.POSITION_LAP_WINDOW)
+        print(f"Passes per {config.POSITION_LAP_WINDOW}-lap window:")
+        for (start, end), totals in windows.groupby(['LapStart', 'LapEnd'])[['OnTrackGained', 'PitCycleGained']].sum().iterrows():
+            print(f"  Laps {start}-{end}: {totals['OnTrackGained']} on track, {totals['PitCycleGained']} pit cycle")
+
     # --- Add other analyses as needed ---
     # Example: If it's a practice session, maybe call a specific practice summary
     # if session_identifier in ['FP1', 'FP2', 'FP3']:
     #     get_practice_summary(session) # Assuming such a function exists
 
 
-    logger.info(f"===== Finished Analysis for {year} {event} - {session_type} =====")
+def run_session_analysis(year: int, event: Union[str, int], session_type: str,
+                         analyses: Optional[List[str]] = None,
+                         extra_components: Sequence[str] = ()) -> bool:
+    """Loads data and runs the selected analyses (default: all) for a single session. Returns True on success."""
+    analysis = analyse_session(year, event, session_type, analyses, extra_components)
+    if analysis is None:
+        return False
+    report_session_analysis(analysis)
+    finish_session_timing(analysis["timer"])
+    return True
+
+
+def run_sessions_parallel(year: int, event: Union[str, int], session_types: List[str], jobs: int,
+                          analyses: Optional[List[str]] = None, extra_components: Sequence[str] = ()):
+    """
+    Loads and analyses several sessions concurrently in a thread pool.
+
+    Loading is dominated by I/O and parsing, so the sessions overlap in the
+    pool. Each worker's log records are held back and written on the main
+    thread together with the session's report, in the requested session
+    order, so console output and saved plots match a serial run.
+    """
+    logger.info(f"Analysing {len(session_types)} sessions with {jobs} worker threads.")
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="session") as pool:
+        futures = [pool.submit(_analyse_session_buffered, year, event, session_type, analyses, extra_components)
+                   for session_type in session_types]
+        for future in futures:
+            analysis, records = future.result()
+            logging_setup.replay_logs(records)
+            if analysis is not None:
+                report_session_analysis(analysis)
+                finish_session_timing(analysis["timer"])
+
+
+def _analyse_session_buffered(year: int, event: Union[str, int], session_type: str,
+                              analyses: Optional[List[str]], extra_components: Sequence[str]):
+    """analyse_session for a worker thread: returns the analysis and the log records it held back."""
+    with logging_setup.buffer_thread_logs() as records:
+        try:
+            analysis = analyse_session(year, event, session_type, analyses, extra_components)
+        except Exception as e:
+            logger.error(f"Unexpected error analysing {session_type}: {e}", exc_info=True)
+            analysis = None
+    return analysis, records
 
 
 def main():
     """Main entry point for the F1 Analysis script."""
     args = parse_arguments()
+    # With --json, keep stdout machine-readable: only the JSON documents go there
+    logging_setup.setup_logging(sys.stderr if args.json else sys.stdout)
     logger.info("Starting F1 Analysis Dashboard script...")
-    logger.info(f"Arguments: Year={args.year}, Event='{args.event}', Sessions={args.sessions}")
+    logger.info(f"Arguments: Year={args.year}, Event='{args.event}', Sessions={args.sessions}, Jobs={args.jobs}")
+    logger.info(f"Cache directory: {config.CACHE_DIR.resolve()}")
 
     # --- Apply settings from arguments ---
     if args.no_cache:
         config.CACHE_ENABLED = False
         logger.info("Cache explicitly disabled via command line.")
+    extra_components = ('telemetry',) if args.telemetry else ()
+    if args.telemetry:
+        logger.info("Telemetry loading enabled via command line.")
+    if args.no_result_cache:
+        config.RESULT_CACHE_ENABLED = False
+    if args.compact_dtypes:
+        config.COMPACT_DTYPES = True
     config.PLOT_SHOW = args.show_plots
+    if args.no_plots:
+        config.PLOT_ENABLED = False
+        logger.info("Plotting disabled via command line.")
+    config.OUTPUT_JSON = args.json
+    if args.force_replot:
+        config.PLOT_FORCE_REPLOT = True
+    if args.metrics_file:
+        config.METRICS_FILE = args.metrics_file
+        config.METRICS_FORMAT = args.metrics_format
+    if args.profile or args.profile_cprofile:
+        config.PROFILE_ENABLED = True
+        config.PROFILE_CPROFILE = args.profile_cprofile
+    if config.PROFILE_CPROFILE and args.jobs > 1:
+        logger.warning("cProfile can only follow one session at a time. Running sessions serially.")
+        args.jobs = 1
     if config.PLOT_SHOW:
          logger.info("Interactive plot display enabled.")
 
     # --- Setup ---
-    plot_generator.setup_plotting_style()
+    # Enabled once here: the session loads (possibly in worker threads) reuse it
+    if config.CACHE_ENABLED and not data_loader.setup_fastf1_cache():
+        logger.warning("Cache setup failed. Proceeding without cache, but errors might occur.")
+    if config.PLOT_ENABLED:
+        logger.info(f"Output directory: {config.OUTPUT_DIR.resolve()}")
+        _plot_generator().setup_plotting_style()
+        if args.render_workers:
+            render_pool.start(args.render_workers)
 
     # --- Run Analysis for each requested session ---
-    for session_type in args.sessions:
-        run_session_analysis(args.year, args.event, session_type)
+    try:
+        if args.jobs > 1 and len(args.sessions) > 1:
+            run_sessions_parallel(args.year, args.event, args.sessions, args.jobs, args.analyses, extra_components)
+        else:
+            for session_type in args.sessions:
+                run_session_analysis(args.year, args.event, session_type, args.analyses, extra_components)
+    finally:
+        render_pool.shutdown() # Waits for queued plots to be written
+        if config.METRICS_FILE:
+            metrics.export(Path(config.METRICS_FILE), config.METRICS_FORMAT)
 
     logger.info("--- Analysis Complete ---")
-    if config.PLOT_SAVE:
+    if config.PLOT_ENABLED and config.PLOT_SAVE:
         logger.info(f"Plots saved to: {config.OUTPUT_DIR.resolve()}")
 
 
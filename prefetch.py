@@ -0,0 +1,424 @@
+# f1_analysis_dashboard/prefetch.py
+import argparse
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import fastf1 as ff1
+import fastf1._api
+import fastf1.ergast
+import requests
+from fastf1.req import RateLimitExceededError
+from requests.adapters import HTTPAdapter
+
+from f1_analysis_dashboard import config, season
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.utils import logging_setup, metrics
+
+logger = logging.getLogger(__name__)
+
+# Livetiming pages (keys of fastf1._api.pages) requested by Session.load for each
+# component. Session info and the driver list are always loaded.
+SESSION_PAGES = ('session_info', 'driver_list')
+COMPONENT_PAGES: Dict[str, tuple] = {
+    'laps': ('timing_data', 'timing_app_data', 'session_status', 'track_status', 'lap_count',
+             'race_control_messages'),
+    'telemetry': ('car_data', 'position'),
+    'weather': ('weather_data',),
+    'messages': ('race_control_messages',),
+}
+
+# Wrapped FastF1 parser (fastf1._api) of each page. Calling it after the download
+# writes the parsed page to FastF1's stage-2 cache, which Session.load reads for as
+# long as the FastF1 version matches; the raw HTTP cache entries expire after 12 hours.
+PAGE_PARSERS: Dict[str, str] = {
+    'session_info': 'session_info',
+    'driver_list': 'driver_info',
+    'timing_data': '_extended_timing_data',
+    'timing_app_data': 'timing_app_data',
+    'session_status': 'session_status_data',
+    'track_status': 'track_status_data',
+    'lap_count': 'lap_count',
+    'race_control_messages': 'race_control_messages',
+    'car_data': 'car_data',
+    'position': 'position_data',
+    'weather_data': 'weather_data',
+}
+# Ergast responses are only held in FastF1's HTTP cache, which expires them after this long
+ERGAST_CACHE_HOURS = 12
+
+# FastF1 sends 'Connection: close'; headers are not part of the HTTP cache key, so
+# prefetching with keep-alive fills the same cache entries FastF1 reads later.
+PREFETCH_HEADERS = {**fastf1._api.headers, 'Connection': 'keep-alive'}
+# Transient upstream responses that are retried with backoff
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Outcomes of a single page request
+STATUS_HIT = 'hit'          # Served from the FastF1 HTTP cache
+STATUS_MISS = 'miss'        # Downloaded and stored in the cache
+STATUS_MISSING = 'missing'  # The page does not exist upstream (e.g. 404)
+STATUS_FAILED = 'failed'    # Gave up after all retries
+STATUS_SKIPPED = 'skipped'  # Not attempted because the rate limit was reached
+STATUSES = (STATUS_HIT, STATUS_MISS, STATUS_MISSING, STATUS_FAILED, STATUS_SKIPPED)
+
+# Outcomes of storing a parsed page (or the Ergast data) of a session
+PARSE_CACHED = 'cached'  # Already in the FastF1 cache
+PARSE_STORED = 'stored'  # Parsed (or requested) and stored
+PARSE_FAILED = 'failed'
+PARSE_STATUSES = (PARSE_CACHED, PARSE_STORED, PARSE_FAILED)
+
+
+class PrefetchSession(NamedTuple):
+    """A session whose pages are prefetched."""
+    label: str         # e.g. '2023 R2 R'
+    year: int
+    round_number: int
+    name: str          # FastF1 session name, e.g. 'Race'
+    api_path: str
+
+
+class PrefetchTarget(NamedTuple):
+    """One livetiming page of one session, relative to the API base URL."""
+    label: str  # e.g. '2023 R2 R timing_data'
+    path: str   # Session.api_path + page file name
+    page: str = ''  # Key of fastf1._api.pages
+    session: Optional[PrefetchSession] = None
+
+
+class FetchResult(NamedTuple):
+    target: PrefetchTarget
+    status: str
+    bytes: int = 0
+    attempts: int = 0
+
+
+class ParseResult(NamedTuple):
+    label: str  # Page target label, or '<session label> ergast'
+    status: str
+
+
+# --- Argument Parsing ---
+def parse_arguments() -> argparse.Namespace:
+    """Parses command-line arguments for a cache prefetch run."""
+    parser = argparse.ArgumentParser(description="Warm the FastF1 cache for the sessions of a season. Livetiming pages are stored "
+                                                 "as FastF1 parses them and stay valid; Ergast results are only "
+                                                 f"kept for {ERGAST_CACHE_HOURS} hours.")
+    parser.add_argument(
+        "-y", "--year", type=int, default=config.DEFAULT_YEAR,
+        help=f"Championship year (default: {config.DEFAULT_YEAR})"
+    )
+    parser.add_argument(
+        "--first-round", type=int, default=1,
+        help="First round to prefetch (default: 1)"
+    )
+    parser.add_argument(
+        "--last-round", type=int, default=None,
+        help="Last round to prefetch (default: final round of the season)"
+    )
+    parser.add_argument(
+        "-s", "--sessions", nargs='+', default=['R'],
+        choices=config.SESSION_TYPES.keys(),
+        help="Session types to prefetch for every round. Default: R"
+    )
+    parser.add_argument(
+        "-c", "--components", nargs='+', choices=COMPONENT_PAGES.keys(),
+        default=[name for name, enabled in config.LOAD_CONFIG.items() if enabled],
+        help="Data components to prefetch (default: those enabled in config.LOAD_CONFIG)"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=config.PREFETCH_WORKERS,
+        help=f"Number of concurrent downloads (default: {config.PREFETCH_WORKERS})"
+    )
+    parser.add_argument(
+        "--retries", type=int, default=config.PREFETCH_RETRIES,
+        help=f"Retries per page after a transient error (default: {config.PREFETCH_RETRIES})"
+    )
+    parser.add_argument(
+        "--base-url", nargs='+', default=None,
+        help="Livetiming API base URL(s), tried in order (default: FastF1's API and its mirror)"
+    )
+    parser.add_argument(
+        "--metrics-file", type=Path, default=None,
+        help="Write the prefetch metrics to this file (Prometheus textfile, or JSON lines if it ends in .jsonl)."
+    )
+    parser.add_argument(
+        "--no-ergast", action="store_true",
+        help=f"Do not request the Ergast results. FastF1 keeps those only in its HTTP cache, which expires "
+             f"them after {ERGAST_CACHE_HOURS} hours; livetiming pages are stored parsed and do not expire."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.retries < 0:
+        parser.error("--retries must not be negative")
+    return args
+
+
+# --- Planning ---
+def session_targets(label: str, api_path: str, components: Iterable[str],
+                    session: Optional[PrefetchSession] = None) -> List[PrefetchTarget]:
+    """The pages FastF1 requests when loading `components` of the session at `api_path`."""
+    page_names = list(SESSION_PAGES)
+    for component in components:
+        page_names.extend(page for page in COMPONENT_PAGES[component] if page not in page_names)
+    return [PrefetchTarget(f"{label} {page}", api_path + fastf1._api.pages[page], page, session)
+            for page in page_names]
+
+
+def plan_prefetch(year: int, session_types: List[str], components: Iterable[str],
+                  first_round: int = 1, last_round: Optional[int] = None) -> List[PrefetchTarget]:
+    """
+    Builds the page requests for every requested session of a season.
+
+    The event schedule is read (and cached) through FastF1; sessions that do
+    not exist for an event are skipped as in a season run.
+    """
+    components = list(components)
+    targets: List[PrefetchTarget] = []
+    for round_number, session_type in season.plan_season_jobs(year, session_types, first_round, last_round):
+        label = f"{year} R{round_number} {session_type}"
+        try:
+            session = ff1.get_session(year, round_number, config.SESSION_TYPES.get(session_type, session_type))
+            prefetch_session = PrefetchSession(label, year, round_number, session.name, session.api_path)
+        except Exception as e:
+            logger.warning(f"Cannot resolve the API path of {year} round {round_number} {session_type}: {e}")
+            continue
+        targets.extend(session_targets(label, prefetch_session.api_path, components, prefetch_session))
+    return targets
+
+
+# --- Fetching ---
+def _backoff_delay(attempt: int, backoff: float, response: Optional[requests.Response] = None) -> float:
+    """Exponential backoff with jitter; a numeric Retry-After header takes precedence."""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return backoff * 2 ** attempt + random.uniform(0, backoff)
+
+
+def fetch_target(http: requests.Session, target: PrefetchTarget, base_urls: Sequence[str],
+                 retries: int, backoff: float, timeout: float) -> FetchResult:
+    """
+    Requests one page through `http`, retrying transient errors with backoff.
+
+    Base URLs are tried in order, like FastF1 falls back to its mirror, until
+    one returns the page. RateLimitExceededError from FastF1's rate limiter is
+    not handled here; it ends the whole prefetch run.
+    """
+    attempts = 0
+    gave_up = False # True if some base URL only answered with transient errors
+    for base_url in base_urls:
+        url = base_url + target.path
+        for attempt in range(retries + 1):
+            attempts += 1
+            response = None
+            try:
+                response = http.get(url, headers=PREFETCH_HEADERS, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.debug(f"{target.label}: {type(e).__name__} on attempt {attempt + 1}: {e}")
+            else:
+                if response.status_code == 200:
+                    status = STATUS_HIT if getattr(response, 'from_cache', False) else STATUS_MISS
+                    return FetchResult(target, status, len(response.content), attempts)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    logger.debug(f"{target.label}: HTTP {response.status_code} from {base_url}")
+                    break # Not transient; try the next base URL
+                logger.debug(f"{target.label}: HTTP {response.status_code} on attempt {attempt + 1}")
+            if attempt == retries:
+                gave_up = True
+            else:
+                time.sleep(_backoff_delay(attempt, backoff, response))
+    if gave_up:
+        logger.warning(f"Giving up on {target.label} after {attempts} attempts.")
+        return FetchResult(target, STATUS_FAILED, 0, attempts)
+    return FetchResult(target, STATUS_MISSING, 0, attempts)
+
+
+def _configure_connection_pool(http: requests.Session, workers: int):
+    """Lets every worker keep its own persistent connection to each API host."""
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=workers)
+    http.mount('https://', adapter)
+    http.mount('http://', adapter)
+
+
+def prefetch(targets: List[PrefetchTarget], http: Optional[requests.Session] = None,
+             base_urls: Optional[Sequence[str]] = None, workers: int = config.PREFETCH_WORKERS,
+             retries: int = config.PREFETCH_RETRIES, backoff: float = config.PREFETCH_BACKOFF_SECONDS,
+             timeout: float = config.PREFETCH_TIMEOUT_SECONDS) -> List[FetchResult]:
+    """
+    Downloads the given pages with at most `workers` concurrent requests.
+
+    Args:
+        targets: Pages to fetch, e.g. from plan_prefetch().
+        http: Session the requests go through. Defaults to FastF1's cached HTTP
+              session, so the downloads land in its cache (and respect its rate
+              limits); the FastF1 cache must be enabled first.
+        base_urls: API base URLs tried in order (default: config.PREFETCH_BASE_URLS,
+                   or FastF1's API and mirror).
+
+    Returns:
+        One FetchResult per target. If FastF1's hourly rate limit is reached,
+        the remaining targets are reported as skipped.
+    """
+    http = http or ff1.Cache._requests_session_cached
+    if http is None:
+        logger.error("The FastF1 cache is not enabled; there is nothing to prefetch into.")
+        return []
+    base_urls = base_urls or config.PREFETCH_BASE_URLS or (fastf1._api.base_url, fastf1._api.base_url_mirror)
+    _configure_connection_pool(http, workers)
+    stop = threading.Event()
+
+    def run(target: PrefetchTarget) -> FetchResult:
+        if stop.is_set():
+            return FetchResult(target, STATUS_SKIPPED)
+        start = time.perf_counter()
+        try:
+            result = fetch_target(http, target, base_urls, retries, backoff, timeout)
+        except RateLimitExceededError as e:
+            if not stop.is_set():
+                logger.error(f"{e} Stopping; run the prefetch again later to fetch the rest.")
+            stop.set()
+            return FetchResult(target, STATUS_SKIPPED)
+        metrics.observe('prefetch_request_seconds', time.perf_counter() - start, result=result.status)
+        return result
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='prefetch') as pool:
+        futures = [pool.submit(run, target) for target in targets]
+        for future in as_completed(futures):
+            result = future.result()
+            metrics.inc('prefetch_requests_total', result=result.status)
+            metrics.inc('prefetch_bytes_total', result.bytes, result=result.status)
+            results.append(result)
+    return results
+
+
+# --- Storing parsed data ---
+def _parse_page(target: PrefetchTarget) -> str:
+    """Runs a downloaded page through its wrapped FastF1 parser, writing the stage-2 cache file."""
+    parser = getattr(fastf1._api, PAGE_PARSERS[target.page])
+    if os.path.isfile(ff1.Cache._get_cache_file_path(target.session.api_path, parser.__name__)):
+        return PARSE_CACHED
+    try:
+        parser(target.session.api_path) # Reads the page from the HTTP cache filled by prefetch()
+    except SystemExit: # FastF1 exits when a parser returns no data; skip the page instead
+        logger.warning(f"{target.label}: FastF1 returned no data to store.")
+        return PARSE_FAILED
+    except RateLimitExceededError:
+        raise
+    except Exception as e:
+        logger.warning(f"{target.label}: cannot parse the page: {e}")
+        return PARSE_FAILED
+    return PARSE_STORED
+
+
+def _request_ergast(session: PrefetchSession) -> Optional[str]:
+    """Requests the Ergast data Session.load uses for this session (held by the HTTP cache only)."""
+    ergast = fastf1.ergast.Ergast()
+    try:
+        if session.name == 'Race':
+            ergast.get_race_results(session.year, session.round_number)
+            ergast.get_lap_times(session.year, session.round_number, lap_number=1) # First lap times
+        elif session.name == 'Qualifying':
+            ergast.get_qualifying_results(session.year, session.round_number)
+        elif session.name == 'Sprint' or (session.name == 'Sprint Qualifying' and session.year < 2024):
+            # Before 2024, 'Sprint Qualifying' was the race-like sprint
+            ergast.get_sprint_results(session.year, session.round_number)
+        elif session.name.startswith('Practice'):
+            ergast.get_race_results(session.year, session.round_number) # Driver list of the event
+        else: # Sprint qualifying/shootout results are not on Ergast
+            return None
+    except RateLimitExceededError:
+        raise
+    except Exception as e:
+        logger.warning(f"{session.label}: Ergast request failed: {e}")
+        return PARSE_FAILED
+    return PARSE_STORED
+
+
+def store_parsed(results: List[FetchResult], ergast: bool = True) -> List[ParseResult]:
+    """
+    Stores the downloaded pages as FastF1 parses them, so Session.load finds them later.
+
+    Raw responses in FastF1's HTTP cache expire after 12 hours; the parsed
+    stage-2 cache files written by the wrapped fastf1._api functions do not
+    (they are only invalidated by a FastF1 version change). Pages are parsed
+    one at a time in the calling thread; parsing is CPU-bound. With `ergast`,
+    the Ergast results of every session are requested as well; those stay in
+    the HTTP cache only (ERGAST_CACHE_HOURS).
+
+    Returns:
+        One ParseResult per downloaded page (and per session for Ergast). If
+        FastF1's rate limit is reached, the remaining work is skipped.
+    """
+    parsed: List[ParseResult] = []
+    downloaded = [result.target for result in results
+                  if result.status in (STATUS_HIT, STATUS_MISS) and result.target.session is not None]
+    sessions = list(dict.fromkeys(target.session for target in downloaded))
+    try:
+        for target in downloaded:
+            parsed.append(ParseResult(target.label, _parse_page(target)))
+        for session in sessions if ergast else ():
+            status = _request_ergast(session)
+            if status is not None:
+                parsed.append(ParseResult(f"{session.label} ergast", status))
+    except RateLimitExceededError as e:
+        logger.error(f"{e} Stopping; run the prefetch again later to store the rest.")
+    for result in parsed:
+        metrics.inc('prefetch_parsed_total', result=result.status)
+    return parsed
+
+
+def summarize(results: List[FetchResult]) -> Dict[str, Dict[str, int]]:
+    """Request count and bytes per outcome."""
+    summary = {status: {'requests': 0, 'bytes': 0} for status in STATUSES}
+    for result in results:
+        summary[result.status]['requests'] += 1
+        summary[result.status]['bytes'] += result.bytes
+    return summary
+
+
+def print_summary(results: List[FetchResult], elapsed: float, parsed: Sequence[ParseResult] = ()):
+    summary = summarize(results)
+    print(f"\n--- Prefetch Summary ({len(results)} pages in {elapsed:.1f} s) ---")
+    for status, counts in summary.items():
+        print(f"{status:<8} {counts['requests']:>6}  {counts['bytes'] / 1e6:10.2f} MB")
+    for result in results:
+        if result.status == STATUS_FAILED:
+            print(f"  failed: {result.target.label}")
+    if parsed:
+        counts = {status: sum(result.status == status for result in parsed) for status in PARSE_STATUSES}
+        print("Stored for Session.load: " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+        for result in parsed:
+            if result.status == PARSE_FAILED:
+                print(f"  not stored: {result.label}")
+        if any(result.label.endswith(' ergast') for result in parsed):
+            print(f"Note: Ergast results expire from the FastF1 cache after {ERGAST_CACHE_HOURS} hours; "
+                  "livetiming data is stored parsed and does not expire.")
+
+
+def main():
+    """Entry point: `python -m f1_analysis_dashboard.prefetch -y 2023 -s Q R -c laps telemetry`."""
+    args = parse_arguments()
+    logging_setup.setup_logging()
+    if not config.CACHE_ENABLED or not data_loader.setup_fastf1_cache():
+        logger.error("Prefetching requires the FastF1 cache (config.CACHE_ENABLED).")
+        return
+
+    start = time.perf_counter()
+    targets = plan_prefetch(args.year, args.sessions, args.components, args.first_round, args.last_round)
+    logger.info(f"Prefetching {len(targets)} pages with {args.jobs} concurrent downloads.")
+    results = prefetch(targets, base_urls=args.base_url, workers=args.jobs, retries=args.retries)
+    parsed = store_parsed(results, ergast=not args.no_ergast)
+    print_summary(results, time.perf_counter() - start, parsed)
+    if args.metrics_file:
+        metrics.export(args.metrics_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# f1_analysis_dashboard/season.py
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import fastf1 as ff1
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.utils import logging_setup, metrics
+
+logger = logging.getLogger(__name__)
+
+# A job is one (round number, session type) pair of the requested season
+Job = Tuple[int, str]
+
+
+# --- Argument Parsing ---
+def parse_arguments() -> argparse.Namespace:
+    """Parses command-line arguments for a season-wide batch run."""
+    parser = argparse.ArgumentParser(description="Run the F1 Analysis Dashboard for a whole season.")
+    parser.add_argument(
+        "-y", "--year", type=int, default=config.DEFAULT_YEAR,
+        help=f"Championship year (default: {config.DEFAULT_YEAR})"
+    )
+    parser.add_argument(
+        "--first-round", type=int, default=1,
+        help="First round to analyse (default: 1)"
+    )
+    parser.add_argument(
+        "--last-round", type=int, default=None,
+        help="Last round to analyse (default: final round of the season)"
+    )
+    parser.add_argument(
+        "-s", "--sessions", nargs='+', default=['R'],
+        choices=config.SESSION_TYPES.keys(),
+        help="Session types to analyze for every round. Default: R"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--manifest", type=Path, default=None,
+        help="Manifest file recording completed jobs (default: OUTPUT_DIR/season_<year>_manifest.json)"
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="Ignore an existing manifest and re-run every job."
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Disable FastF1 caching for this run."
+    )
+    parser.add_argument(
+        "--metrics-file", type=Path, default=None,
+        help="Write the metrics of all jobs to this file at the end (Prometheus textfile, or JSON lines if it ends in .jsonl)."
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
+# --- Manifest Handling ---
+def _job_key(job: Job) -> str:
+    return f"{job[0]}:{job[1]}"
+
+
+def load_manifest(path: Path) -> Set[str]:
+    """
+    Reads the set of completed job keys ('<round>:<session>') from a manifest.
+
+    Returns an empty set if the manifest does not exist or cannot be read.
+    """
+    if not path.exists():
+        return set()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return set(json.load(f).get('completed', []))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read manifest '{path}': {e}. Starting from scratch.")
+        return set()
+
+
+def write_manifest(path: Path, year: int, completed: Set[str]):
+    """Atomically writes the completed job keys to the manifest file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'year': year, 'completed': sorted(completed)}, f, indent=2)
+    os.replace(tmp_path, path) # Never leaves a half-written manifest behind
+
+
+# --- Job Planning ---
+def plan_season_jobs(year: int, session_types: List[str], first_round: int = 1,
+                     last_round: Optional[int] = None) -> List[Job]:
+    """
+    Builds the (round, session) jobs for a season from the FastF1 event schedule.
+
+    Sessions that do not exist for an event (e.g. a Sprint at a regular
+    weekend) are skipped.
+    """
+    schedule = ff1.get_event_schedule(year, include_testing=False)
+    jobs: List[Job] = []
+    for round_number in sorted(int(r) for r in schedule['RoundNumber']):
+        if round_number < first_round or (last_round is not None and round_number > last_round):
+            continue
+        event = schedule.get_event_by_round(round_number)
+        for session_type in session_types:
+            try:
+                event.get_session_name(config.SESSION_TYPES.get(session_type, session_type))
+            except ValueError:
+                logger.debug(f"Round {round_number} has no '{session_type}' session. Skipping.")
+                continue
+            jobs.append((round_number, session_type))
+    return jobs
+
+
+# --- Worker Process ---
+def _init_worker(cache_enabled: bool):
+    """Configures a worker process once: logging, headless backend, cache flag and plot style."""
+    logging_setup.setup_logging() # Spawned workers start without the parent's logging handlers
+    import matplotlib
+    matplotlib.use('Agg') # Workers never show plots
+    from f1_analysis_dashboard.src.plotting import plot_generator
+
+    config.CACHE_ENABLED = cache_enabled
+    config.PLOT_SHOW = False
+    plot_generator.setup_plotting_style()
+
+
+def _run_job(year: int, job: Job) -> Tuple[Job, bool, str, Dict[str, Any]]:
+    """Runs one session analysis in a worker, capturing its console report and metrics."""
+    from f1_analysis_dashboard.main import run_session_analysis
+
+    round_number, session_type = job
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            ok = run_session_analysis(year, round_number, session_type)
+    except Exception as e:
+        logger.error(f"Unexpected error in job {_job_key(job)}: {e}", exc_info=True)
+        ok = False
+    return job, ok, buffer.getvalue(), metrics.take()
+
+
+# --- Main Season Orchestration ---
+def run_season(year: int, session_types: List[str], first_round: int = 1,
+               last_round: Optional[int] = None, jobs: int = 1,
+               manifest_path: Optional[Path] = None, restart: bool = False) -> Tuple[int, int]:
+    """
+    Analyses every requested session of a season across a process pool.
+
+    Completed jobs are recorded in the manifest as they finish, so an
+    interrupted run skips them when started again.
+
+    Returns:
+        A tuple of (succeeded, failed) job counts for this run.
+    """
+    manifest_path = manifest_path or Path(config.OUTPUT_DIR) / f"season_{year}_manifest.json"
+    if config.CACHE_ENABLED and not data_loader.setup_fastf1_cache():
+        logger.warning("Cache setup failed. Proceeding without cache, but errors might occur.")
+    completed = set() if restart else load_manifest(manifest_path)
+
+    all_jobs = plan_season_jobs(year, session_types, first_round, last_round)
+    pending = [job for job in all_jobs if _job_key(job) not in completed]
+    logger.info(f"Season {year}: {len(all_jobs)} jobs planned, {len(all_jobs) - len(pending)} already completed, "
+                f"{len(pending)} to run with {jobs} workers.")
+    if not pending:
+        return 0, 0
+
+    succeeded = failed = 0
+    # 'spawn' keeps workers independent of any threads started by FastF1 in this process
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(config.CACHE_ENABLED,)) as pool:
+        futures = [pool.submit(_run_job, year, job) for job in pending]
+        for future in as_completed(futures):
+            job, ok, report, job_metrics = future.result()
+            metrics.merge(job_metrics)
+            if report:
+                print(report, end='') # Each job's console output is printed as one block
+            if ok:
+                succeeded += 1
+                completed.add(_job_key(job))
+                write_manifest(manifest_path, year, completed)
+            else:
+                failed += 1
+                logger.error(f"Job {_job_key(job)} failed; it will be retried on the next run.")
+
+    logger.info(f"Season {year}: {succeeded} jobs succeeded, {failed} failed. Manifest: {manifest_path}")
+    return succeeded, failed
+
+
+def main():
+    """Entry point: `python -m f1_analysis_dashboard.season -y 2023 -s Q R`."""
+    args = parse_arguments()
+    logging_setup.setup_logging()
+    if args.no_cache:
+        config.CACHE_ENABLED = False
+        logger.info("Cache explicitly disabled via command line.")
+
+    run_season(args.year, args.sessions, args.first_round, args.last_round,
+               args.jobs, args.manifest, args.restart)
+    if args.metrics_file:
+        metrics.export(args.metrics_file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+# f1_analysis_dashboard/server.py
+import argparse
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard import main as dashboard
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.utils import logging_setup, metrics
+
+logger = logging.getLogger(__name__)
+
+# Plots served by the API: name -> (plot_generator function, analysis result it draws).
+# Results of opt-in analyses (main.OPT_IN_ANALYSES) are computed on their first request.
+PLOTS = {
+    'driver_fastest': ('plot_driver_fastest_lap_deltas', 'driver_fastest'),
+    'constructor_pace': ('plot_constructor_pace_deltas', 'constructor_pace'),
+    'tyre_degradation': ('plot_tyre_degradation', 'tyre_degradation'),
+    'telemetry_comparison': ('plot_telemetry_comparison', 'telemetry_comparison'),
+    'minisector_dominance': ('plot_minisector_dominance', 'telemetry_comparison'),
+    'gap_to_leader': ('plot_gap_to_leader', 'race_trace'),
+    'interval_heatmap': ('plot_interval_heatmap', 'race_trace'),
+    'position_per_lap': ('plot_position_per_lap', 'race_trace'),
+    'position_changes': ('plot_position_changes', 'position_changes'),
+}
+CONTENT_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf', 'jpg': 'image/jpeg'}
+
+# A cached session: (year, event, session type) as requested
+SessionKey = Tuple[int, str, str]
+
+# pyplot is not thread-safe; plots are rendered one at a time
+_plot_lock = threading.Lock()
+
+
+# --- Argument Parsing ---
+def parse_arguments() -> argparse.Namespace:
+    """Parses command-line arguments for the analysis server."""
+    parser = argparse.ArgumentParser(description="Serve F1 Analysis Dashboard results over HTTP.")
+    parser.add_argument(
+        "--host", default=config.SERVER_HOST,
+        help=f"Interface to listen on (default: {config.SERVER_HOST})"
+    )
+    parser.add_argument(
+        "--port", type=int, default=config.SERVER_PORT,
+        help=f"Port to listen on (default: {config.SERVER_PORT})"
+    )
+    parser.add_argument(
+        "--cache-mb", type=int, default=config.SERVER_CACHE_MAX_BYTES // 2**20,
+        help=f"Approximate memory budget of the loaded sessions in MiB (default: {config.SERVER_CACHE_MAX_BYTES // 2**20})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Disable the FastF1 disk cache."
+    )
+    args = parser.parse_args()
+    if args.cache_mb < 1:
+        parser.error("--cache-mb must be at least 1")
+    return args
+
+
+# --- Session Cache ---
+def estimate_bytes(value: Any) -> int:
+    """Approximate in-memory size of a DataFrame/Series (including string contents), or of a dict of them."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, dict):
+        return sum(estimate_bytes(item) for item in value.values())
+    if isinstance(value, bytes):
+        return len(value)
+    return 0
+
+
+def estimate_analysis_bytes(analysis: Dict[str, Any]) -> int:
+    """Approximate memory held by an analysed session: its loaded data and every analysis result."""
+    total = sum(estimate_bytes(analysis[name]) for name in dashboard.ANALYSES)
+    session = analysis['session']
+    for attribute in ('laps', 'results', 'car_data', 'pos_data', 'weather_data', 'race_control_messages'):
+        try:
+            total += estimate_bytes(getattr(session, attribute))
+        except Exception: # Components that were not loaded raise DataNotLoadedError
+            continue
+    return total
+
+
+class CachedSession:
+    """An analysed session plus the responses already rendered from it."""
+
+    def __init__(self, analysis: Dict[str, Any]):
+        self.analysis = analysis
+        self.document = dashboard.analysis_to_json(analysis)
+        self.responses: Dict[str, bytes] = {} # e.g. 'json', 'plot:driver_fastest'
+        self.nbytes = estimate_analysis_bytes(analysis)
+        self.opt_in_run: Set[str] = set() # Opt-in analyses already attempted for this session
+        self.opt_in_lock = threading.Lock()
+
+
+class SessionCache:
+    """
+    Keeps recently used analysed sessions in memory, evicting by approximate size.
+
+    Sessions are loaded and analysed once (through main.analyse_session) and
+    kept until the total estimated size exceeds `max_bytes`; the least recently
+    used sessions are evicted first. A session larger than the budget on its
+    own is still served, but evicts everything else. Concurrent requests for
+    a session that is not cached yet wait for a single load.
+    """
+
+    def __init__(self, max_bytes: int = config.SERVER_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._entries: 'OrderedDict[SessionKey, CachedSession]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[SessionKey, threading.Lock] = {}
+
+    def get(self, year: int, event: str, session_type: str) -> Optional[CachedSession]:
+        """Returns the analysed session, loading it on a miss. None if it cannot be loaded."""
+        key = (year, event.lower(), session_type)
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry
+        with self._lock:
+            load_lock = self._loading.setdefault(key, threading.Lock())
+        with load_lock:
+            entry = self._lookup(key) # Another request may have loaded it meanwhile
+            if entry is not None:
+                return entry
+            with self._lock:
+                self.misses += 1
+            metrics.inc('server_cache_requests_total', result='miss')
+            analysis = dashboard.analyse_session(year, event, session_type)
+            if analysis is None:
+                with self._lock:
+                    self._loading.pop(key, None)
+                return None
+            entry = CachedSession(analysis)
+            with self._lock:
+                self._entries[key] = entry
+                self.total_bytes += entry.nbytes
+                self._evict()
+                self._loading.pop(key, None)
+            logger.info(f"Cached {year} {event} {session_type} (~{entry.nbytes / 2**20:.1f} MiB, "
+                        f"{self.total_bytes / 2**20:.1f} of {self.max_bytes / 2**20:.0f} MiB used)")
+            return entry
+
+    def ensure_analysis(self, entry: CachedSession, name: str):
+        """
+        Runs an opt-in analysis (main.OPT_IN_ANALYSES) of a cached session on its first request.
+
+        The default analyses do not load telemetry, so e.g. telemetry_comparison
+        is computed from a separate load of the session with only what it
+        needs. Its result (not the extra session data) is added to the entry
+        and counts towards the budget. A failed analysis is not retried.
+        """
+        with entry.opt_in_lock:
+            if name in entry.opt_in_run:
+                return
+            entry.opt_in_run.add(name)
+            analysis = entry.analysis
+            extra = dashboard.analyse_session(analysis['year'], analysis['event'], analysis['session_type'], [name])
+            if extra is None or extra[name] is None:
+                logger.warning(f"Opt-in analysis '{name}' is not available for {analysis['year']} "
+                               f"{analysis['event']} {analysis['session_type']}.")
+                return
+            analysis[name] = extra[name]
+            entry.document[name] = dashboard.analysis_to_json(extra)[name]
+            added = estimate_bytes(extra[name])
+            with self._lock:
+                stale = entry.responses.pop('json', b'') # The full document now includes the result
+                entry.nbytes += added - len(stale)
+                if any(cached is entry for cached in self._entries.values()):
+                    self.total_bytes += added - len(stale)
+                    self._evict()
+
+    def add_response(self, entry: CachedSession, name: str, body: bytes):
+        """Memoises a rendered response of a cached session; its size counts towards the budget."""
+        with self._lock:
+            if name in entry.responses:
+                return
+            entry.responses[name] = body
+            entry.nbytes += len(body)
+            if any(cached is entry for cached in self._entries.values()):
+                self.total_bytes += len(body)
+                self._evict()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_bytes': self.max_bytes, 'total_bytes': self.total_bytes,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'sessions': [{'year': key[0], 'event': key[1], 'session': key[2], 'bytes': entry.nbytes}
+                             for key, entry in self._entries.items()],
+            }
+
+    def _lookup(self, key: SessionKey) -> Optional[CachedSession]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key) # Most recently used
+                self.hits += 1
+        if entry is not None:
+            metrics.inc('server_cache_requests_total', result='hit')
+        return entry
+
+    def _evict(self):
+        """Drops least recently used sessions until the budget is met (caller holds the lock)."""
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.nbytes
+            self.evictions += 1
+            metrics.inc('server_cache_evictions_total')
+            logger.info(f"Evicted {key[0]} {key[1]} {key[2]} (~{entry.nbytes / 2**20:.1f} MiB) from the session cache.")
+
+
+# --- Responses ---
+def render_plot(entry: CachedSession, plot: str) -> Optional[bytes]:
+    """Renders (or reuses the saved file of) one plot of a cached session and returns the image bytes."""
+    from f1_analysis_dashboard.src.plotting import plot_generator
+
+    function_name, result_name = PLOTS[plot]
+    analysis = entry.analysis
+    if analysis[result_name] is None:
+        return None
+    with _plot_lock:
+        dashboard.restore_cached_colors(analysis)
+        path = getattr(plot_generator, function_name)(analysis[result_name], analysis['session_info'], analysis['session'])
+    if path is None:
+        return None
+    try:
+        return path.read_bytes()
+    except OSError as e:
+        logger.error(f"Could not read plot '{path}': {e}")
+        return None
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        GET /sessions/<year>/<event>/<session>                      all analyses as JSON
+        GET /sessions/<year>/<event>/<session>/analyses/<analysis>  one analysis as JSON
+        GET /sessions/<year>/<event>/<session>/plots/<plot>         plot image bytes
+        GET /cache                                                  session cache statistics
+        GET /metrics                                                metrics in Prometheus text format
+    """
+
+    server_version = 'F1AnalysisDashboard/1.0'
+    cache: SessionCache # Set on the handler class by make_server()
+
+    def do_GET(self):
+        start = time.perf_counter()
+        parts = [unquote(part) for part in urlsplit(self.path).path.strip('/').split('/') if part]
+        route = parts[0] if parts else ''
+        try:
+            if parts == ['cache']:
+                self._send_json(self.cache.stats())
+            elif parts == ['metrics']:
+                self._send(200, metrics.to_prometheus().encode('utf-8'), 'text/plain; version=0.0.4')
+            elif route == 'sessions' and len(parts) in (4, 6):
+                self._session_route(parts[1:])
+            else:
+                self._send_error(404, f"Unknown route '{self.path}'")
+        except Exception as e:
+            logger.error(f"Error handling '{self.path}': {e}", exc_info=True)
+            self._send_error(500, 'Internal server error')
+        finally:
+            metrics.observe('server_request_seconds', time.perf_counter() - start, route=route or 'root')
+
+    def _session_route(self, parts: list):
+        year, event, session_type = parts[:3]
+        if not year.isdigit():
+            return self._send_error(400, f"Invalid year '{year}'")
+        if session_type not in config.SESSION_TYPES:
+            return self._send_error(400, f"Unknown session type '{session_type}'. Choose from {list(config.SESSION_TYPES)}")
+        event = int(event) if event.isdigit() else event # Round number or event name
+        if len(parts) == 5 and parts[3] not in ('analyses', 'plots'):
+            return self._send_error(404, f"Unknown route '{self.path}'")
+        if len(parts) == 5 and parts[3] == 'analyses' and parts[4] not in dashboard.ANALYSES:
+            return self._send_error(404, f"Unknown analysis '{parts[4]}'. Choose from {list(dashboard.ANALYSES)}")
+        if len(parts) == 5 and parts[3] == 'plots' and parts[4] not in PLOTS:
+            return self._send_error(404, f"Unknown plot '{parts[4]}'. Choose from {list(PLOTS)}")
+
+        entry = self.cache.get(int(year), str(event), session_type)
+        if entry is None:
+            return self._send_error(404, f"Session {year} {event} {session_type} could not be loaded")
+        if len(parts) == 5:
+            result_name = parts[4] if parts[3] == 'analyses' else PLOTS[parts[4]][1]
+            if result_name in dashboard.OPT_IN_ANALYSES:
+                self.cache.ensure_analysis(entry, result_name)
+
+        if len(parts) == 3:
+            body = entry.responses.get('json')
+            if body is None:
+                body = json.dumps(entry.document).encode('utf-8')
+                self.cache.add_response(entry, 'json', body)
+            return self._send(200, body, 'application/json')
+        if parts[3] == 'analyses':
+            return self._send_json(entry.document[parts[4]])
+
+        name = f"plot:{parts[4]}"
+        body = entry.responses.get(name)
+        if body is None:
+            body = render_plot(entry, parts[4])
+            if body is None:
+                return self._send_error(404, f"Plot '{parts[4]}' is not available for this session")
+            self.cache.add_response(entry, name, body)
+        self._send(200, body, CONTENT_TYPES.get(config.PLOT_FORMAT, 'application/octet-stream'))
+
+    def _send_json(self, document: Any):
+        self._send(200, json.dumps(document).encode('utf-8'), 'application/json')
+
+    def _send_error(self, code: int, message: str):
+        self._send(code, json.dumps({'error': message}).encode('utf-8'), 'application/json')
+
+    def _send(self, code: int, body: bytes, content_type: str):
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+def make_server(host: str, port: int, cache: Optional[SessionCache] = None) -> ThreadingHTTPServer:
+    """Creates the HTTP server (not yet serving); each request is handled in its own thread."""
+    handler = type('Handler', (AnalysisRequestHandler,), {'cache': cache or SessionCache()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    """Entry point: `python -m f1_analysis_dashboard.server --port 8050`."""
+    import matplotlib
+    matplotlib.use('Agg') # Plots are only ever written to files
+
+    args = parse_arguments()
+    logging_setup.setup_logging()
+    if args.no_cache:
+        config.CACHE_ENABLED = False
+        logger.info("Cache explicitly disabled via command line.")
+    config.PLOT_SHOW = False
+    config.PLOT_SAVE = True # Plot responses are read back from the saved files
+    if config.CACHE_ENABLED and not data_loader.setup_fastf1_cache():
+        logger.warning("Cache setup failed. Proceeding without cache, but errors might occur.")
+    dashboard._plot_generator().setup_plotting_style()
+
+    server = make_server(args.host, args.port, SessionCache(args.cache_mb * 2**20))
+    logger.info(f"Serving on http://{args.host}:{server.server_address[1]} "
+                f"(session cache: {args.cache_mb} MiB, plots in {config.OUTPUT_DIR.resolve()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# f1_analysis_dashboard/src/analysis/degradation_analysis.py
+import pandas as pd
+import numpy as np
+import fastf1 as ff1
+import logging
+from typing import Optional, Sequence
+
+from f1_analysis_dashboard.src.utils import helpers, metrics
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+COL_STINT = 'Stint'
+
+
+def assign_stints(laps: pd.DataFrame) -> pd.Series:
+    """
+    Stint number of every lap, aligned to ``laps.index``.
+
+    Uses FastF1's 'Stint' column where it is filled. Otherwise a new stint
+    starts on a driver's first lap, when the compound changes or when the
+    tyre life drops (a fresh set of the same compound).
+
+    Args:
+        laps: Laps DataFrame with Driver, LapNumber, Compound and TyreLife.
+
+    Returns:
+        An integer Series of stint numbers (1 = first stint of the driver).
+    """
+    if COL_STINT in laps.columns and laps[COL_STINT].notna().all():
+        return laps[COL_STINT].astype(int)
+
+    ordered = laps.sort_values([config.COL_DRIVER, config.COL_LAP_NUMBER], kind='stable')
+    driver = ordered[config.COL_DRIVER].astype(str).to_numpy()
+    compound = ordered[config.COL_COMPOUND].astype(str).to_numpy()
+    tyre_life = ordered[config.COL_TYRE_LIFE].to_numpy(dtype=float)
+
+    # Vectorized change points; NaN tyre life never starts a stint on its own
+    new_stint = np.ones(len(ordered), dtype=bool)
+    new_stint[1:] = ((driver[1:] != driver[:-1]) | (compound[1:] != compound[:-1])
+                     | (tyre_life[1:] < tyre_life[:-1]))
+    stint_start = np.cumsum(new_stint) # Running stint id over all drivers
+    driver_start = np.maximum.accumulate(np.where(np.r_[True, driver[1:] != driver[:-1]], stint_start, 0))
+    stints = pd.Series(stint_start - driver_start + 1, index=ordered.index, name=COL_STINT)
+    return stints.reindex(laps.index)
+
+
+def fit_stint_models(group_ids: np.ndarray, tyre_life: np.ndarray, lap_seconds: np.ndarray,
+                     n_groups: int, degree: int = 1) -> dict:
+    """
+    Least-squares polynomial fit of lap time vs. tyre life for many groups at once.
+
+    Tyre life is centred on each group's mean, the normal equations of every
+    group are assembled from per-group power sums (np.bincount) and solved
+    in one stacked np.linalg.solve call - no Python loop over groups. With
+    centring, the linear coefficient is the degradation rate at the
+    stint's mean tyre life, for both the linear and the quadratic model.
+
+    Args:
+        group_ids: Group (stint) index 0..n_groups-1 of every lap.
+        tyre_life: Tyre life of every lap, in laps.
+        lap_seconds: Lap time of every lap, in seconds.
+        n_groups: Number of groups.
+        degree: 1 (linear) or 2 (quadratic).
+
+    Returns:
+        A dict of per-group arrays: 'laps', 'mean_tyre_life', 'coefficients'
+        ((n_groups, degree + 1), NaN where the fit is underdetermined) and
+        'rmse'.
+    """
+    terms = degree + 1
+    counts = np.bincount(group_ids, minlength=n_groups)
+    mean_tyre_life = np.bincount(group_ids, weights=tyre_life, minlength=n_groups) / np.maximum(counts, 1)
+    centred = tyre_life - mean_tyre_life[group_ids]
+
+    powers = centred[:, None] ** np.arange(2 * degree + 1) # x^0 .. x^2d per lap
+    power_sums = np.stack([np.bincount(group_ids, weights=powers[:, k], minlength=n_groups)
+                           for k in range(2 * degree + 1)], axis=1)
+    normal_matrix = power_sums[:, np.add.outer(np.arange(terms), np.arange(terms))] # (groups, terms, terms)
+    rhs = np.stack([np.bincount(group_ids, weights=powers[:, k] * lap_seconds, minlength=n_groups)
+                    for k in range(terms)], axis=1)
+
+    coefficients = np.full((n_groups, terms), np.nan)
+    solvable = counts >= terms
+    if solvable.any():
+        solvable[solvable] = np.linalg.matrix_rank(normal_matrix[solvable]) == terms # Enough distinct tyre ages
+    if solvable.any():
+        coefficients[solvable] = np.linalg.solve(normal_matrix[solvable], rhs[solvable][..., None])[..., 0]
+
+    predicted = (coefficients[group_ids] * powers[:, :terms]).sum(axis=1)
+    residual_sums = np.bincount(group_ids, weights=(lap_seconds - predicted) ** 2, minlength=n_groups)
+    rmse = np.sqrt(residual_sums / np.maximum(counts, 1))
+    rmse[~solvable] = np.nan
+    return {'laps': counts, 'mean_tyre_life': mean_tyre_life, 'coefficients': coefficients, 'rmse': rmse}
+
+
+def fit_degradation(laps: pd.DataFrame, group_columns: Sequence[str] = (config.COL_DRIVER,),
+                    degree: Optional[int] = None, min_laps: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """
+    Fits the degradation model of every stint in a laps frame.
+
+    Works on a single session or on laps of many sessions concatenated
+    (e.g. a season, with group_columns=('EventName', 'Driver')); every stint
+    is fitted in the same batched solve.
+
+    Args:
+        laps: Pace-valid laps with LapTimeSeconds, TyreLife, Compound and a Stint column.
+        group_columns: Columns identifying a driver; stints are numbered per driver.
+        degree: Polynomial degree (default: config.DEGRADATION_FIT_DEGREE).
+        min_laps: Minimum laps per stint (default: config.DEGRADATION_MIN_STINT_LAPS).
+
+    Returns:
+        One row per fitted stint with DegRate (seconds per lap of tyre life),
+        Curvature (quadratic term, NaN for the linear model), MeanLapTimeSeconds
+        at the stint's mean tyre life and RMSE. None if no stint could be fitted.
+    """
+    degree = config.DEGRADATION_FIT_DEGREE if degree is None else degree
+    min_laps = config.DEGRADATION_MIN_STINT_LAPS if min_laps is None else min_laps
+    if degree not in (1, 2):
+        logger.error(f"Unsupported degradation model degree {degree}; use 1 (linear) or 2 (quadratic).")
+        return None
+
+    keys = list(group_columns) + [COL_STINT, config.COL_COMPOUND]
+    usable = laps.dropna(subset=keys + [config.COL_LAP_NUMBER, config.COL_TYRE_LIFE, config.COL_LAP_TIME_SECONDS])
+    if usable.empty:
+        return None
+    grouped = usable.groupby(keys, observed=True, sort=True)
+    group_ids = grouped.ngroup().to_numpy()
+    fit = fit_stint_models(group_ids, usable[config.COL_TYRE_LIFE].to_numpy(dtype=float),
+                           usable[config.COL_LAP_TIME_SECONDS].to_numpy(dtype=float),
+                           grouped.ngroups, degree)
+
+    aggregations = {'FirstLap': (config.COL_LAP_NUMBER, 'min'), 'LastLap': (config.COL_LAP_NUMBER, 'max'),
+                    'TyreLifeStart': (config.COL_TYRE_LIFE, 'min'), 'TyreLifeEnd': (config.COL_TYRE_LIFE, 'max')}
+    if config.COL_TEAM in usable.columns and config.COL_TEAM not in keys:
+        aggregations[config.COL_TEAM] = (config.COL_TEAM, 'first')
+    stints = grouped.agg(**aggregations).reset_index()
+    for column in ('FirstLap', 'LastLap', 'TyreLifeStart', 'TyreLifeEnd'):
+        stints[column] = stints[column].astype(int)
+    stints['Laps'] = fit['laps']
+    stints['MeanLapTimeSeconds'] = fit['coefficients'][:, 0]
+    stints['DegRate'] = fit['coefficients'][:, 1]
+    stints['Curvature'] = fit['coefficients'][:, 2] if degree == 2 else np.nan
+    stints['RMSE'] = fit['rmse']
+    for column in keys + [config.COL_TEAM]:
+        if column in stints.columns and isinstance(stints[column].dtype, pd.CategoricalDtype):
+            stints[column] = stints[column].astype(str) # Compact schema: plain labels in the result
+
+    fitted = stints[(stints['Laps'] >= min_laps) & stints['DegRate'].notna()]
+    metrics.record_rows('tyre_degradation:stints', len(stints), len(fitted))
+    if fitted.empty:
+        return None
+    return fitted.reset_index(drop=True)
+
+
+@helpers.requires_components('laps')
+@helpers.uses_config('DEGRADATION_FIT_DEGREE', 'DEGRADATION_MIN_STINT_LAPS')
+def get_tyre_degradation(session: ff1.core.Session,
+                         prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
+    """
+    Calculates the tyre degradation rate of every driver's stints.
+
+    Laps are split into stints, then lap time is fitted against tyre life
+    per stint (config.DEGRADATION_FIT_DEGREE) using the pace-valid laps
+    only, so in/out laps and other outliers do not skew the slope. Rates
+    include the fuel burn-off effect.
+
+    Args:
+        session: The loaded FastF1 Session object (must include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
+
+    Returns:
+        A pandas DataFrame with one row per stint (Driver, Team, Stint,
+        Compound, lap range, DegRate in seconds per lap, ...), sorted by
+        compound and degradation rate. Returns None if calculation fails.
+    """
+    session_name = getattr(session, 'name', 'Unknown Session')
+    logger.info(f"Calculating tyre degradation for {session_name}...")
+
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
+        logger.warning("Laps data not available for tyre degradation analysis.")
+        return None
+
+    laps = prepared.laps
+    required = [config.COL_DRIVER, config.COL_LAP_NUMBER, config.COL_COMPOUND, config.COL_TYRE_LIFE]
+    missing = [column for column in required if column not in laps.columns]
+    if missing:
+        logger.error(f"Cannot analyse tyre degradation: missing columns {missing}.")
+        return None
+
+    try:
+        # Stints are segmented on all laps; pit laps are removed by the pace mask afterwards
+        stints = assign_stints(laps)
+        pace_laps = laps.loc[prepared.pace_mask, [config.COL_DRIVER, config.COL_TEAM, config.COL_LAP_NUMBER,
+                                                  config.COL_COMPOUND, config.COL_TYRE_LIFE,
+                                                  config.COL_LAP_TIME_SECONDS]]
+        pace_laps = pace_laps.assign(**{COL_STINT: stints[prepared.pace_mask]})
+
+        degradation = fit_degradation(pace_laps)
+        if degradation is None:
+            logger.warning("No stint had enough valid laps to fit a degradation model.")
+            return None
+
+        degradation = degradation.sort_values([config.COL_COMPOUND, 'DegRate'], kind='stable').reset_index(drop=True)
+        logger.info(f"Fitted tyre degradation for {len(degradation)} stints of "
+                    f"{degradation[config.COL_DRIVER].nunique()} drivers.")
+        return degradation
+
+    except KeyError as e:
+        logger.error(f"Missing expected column for tyre degradation analysis: {e}", exc_info=True)
+        return None
+    except Exception as e:
+        logger.error(f"Error calculating tyre degradation: {e}", exc_info=True)
+        return None
@@ -5,28 +5,32 @@ import fastf1 as ff1
 import logging
 from typing import Optional, Tuple
 
-from f1_analysis_dashboard.src.utils import formatting, helpers
+from f1_analysis_dashboard.src.utils import compact_schema, formatting, helpers, metrics
 from f1_analysis_dashboard import config
 
 logger = logging.getLogger(__name__)
 
-def get_overall_fastest_lap(session: ff1.core.Session) -> Optional[pd.Series]:
+@helpers.requires_components('laps')
+def get_overall_fastest_lap(session: ff1.core.Session,
+                            prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.Series]:
     """
     Identifies the single fastest lap across all drivers in the session.
 
     Args:
         session: The loaded FastF1 Session object (must include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
 
     Returns:
         A pandas Series containing the data for the fastest lap, or None if unavailable.
     """
     logger.info(f"Calculating overall fastest lap for {session.name}...")
-    if not hasattr(session, 'laps') or session.laps is None or session.laps.empty:
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
         logger.warning("Laps data not available for fastest lap analysis.")
         return None
 
-    laps = session.laps.copy()
-    laps = helpers.ensure_team_info(laps, session) # Ensure team data is present
+    laps = prepared.laps # Shared, team-filled laps (read-only here)
 
     try:
         fastest_lap = laps.loc[laps[config.COL_LAP_TIME].idxmin()]
@@ -42,11 +46,15 @@ def get_overall_fastest_lap(session: ff1.core.Session) -> Optional[pd.Series]:
             config.COL_SECTOR3, config.COL_COMPOUND, config.COL_TYRE_LIFE
         ]].copy() # Ensure we work on a copy
 
-        # Add formatted times for easier reading later
-        fastest_lap_info['LapTimeStr'] = formatting.format_timedelta(fastest_lap_info[config.COL_LAP_TIME])
-        fastest_lap_info['Sector1Str'] = formatting.format_timedelta(fastest_lap_info.get(config.COL_SECTOR1))
-        fastest_lap_info['Sector2Str'] = formatting.format_timedelta(fastest_lap_info.get(config.COL_SECTOR2))
-        fastest_lap_info['Sector3Str'] = formatting.format_timedelta(fastest_lap_info.get(config.COL_SECTOR3))
+        # Add formatted times for easier reading later (compact float32 seconds via their decimal repr)
+        fastest_lap_info['LapTimeStr'] = formatting.format_timedelta(
+            compact_schema.decimal_seconds(fastest_lap_info[config.COL_LAP_TIME]))
+        fastest_lap_info['Sector1Str'] = formatting.format_timedelta(
+            compact_schema.decimal_seconds(fastest_lap_info.get(config.COL_SECTOR1)))
+        fastest_lap_info['Sector2Str'] = formatting.format_timedelta(
+            compact_schema.decimal_seconds(fastest_lap_info.get(config.COL_SECTOR2)))
+        fastest_lap_info['Sector3Str'] = formatting.format_timedelta(
+            compact_schema.decimal_seconds(fastest_lap_info.get(config.COL_SECTOR3)))
         # Format TyreLife nicely
         tyre_life = fastest_lap_info.get(config.COL_TYRE_LIFE, np.nan)
         fastest_lap_info['TyreLifeStr'] = f"{tyre_life:.0f}" if pd.notna(tyre_life) else 'N/A'
@@ -63,24 +71,28 @@ def get_overall_fastest_lap(session: ff1.core.Session) -> Optional[pd.Series]:
         return None
 
 
-def get_driver_fastest_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
+@helpers.requires_components('laps')
+def get_driver_fastest_laps(session: ff1.core.Session,
+                            prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
     """
     Finds the fastest lap for each driver in the session.
 
     Args:
         session: The loaded FastF1 Session object (must include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
 
     Returns:
         A pandas DataFrame containing the fastest lap for each driver,
         sorted by lap time, or None if unavailable.
     """
     logger.info(f"Calculating fastest lap per driver for {session.name}...")
-    if not hasattr(session, 'laps') or session.laps is None or session.laps.empty:
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
         logger.warning("Laps data not available for driver fastest lap analysis.")
         return None
 
-    laps = session.laps.copy()
-    laps = helpers.ensure_team_info(laps, session) # Ensure team data
+    laps = prepared.laps # Shared, team-filled laps (read-only here)
 
     try:
         # Ensure LapTime column exists before proceeding
@@ -90,12 +102,13 @@ def get_driver_fastest_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]
 
         # Drop laps with no valid LapTime before grouping
         valid_laps = laps.dropna(subset=[config.COL_LAP_TIME])
+        metrics.record_rows('driver_fastest:valid_lap_time', len(laps), len(valid_laps))
         if valid_laps.empty:
             logger.warning("No laps with valid LapTime found.")
             return None
 
         # Find the index of the fastest lap for each driver
-        idx_fastest = valid_laps.groupby(config.COL_DRIVER)[config.COL_LAP_TIME].idxmin()
+        idx_fastest = valid_laps.groupby(config.COL_DRIVER, observed=True)[config.COL_LAP_TIME].idxmin()
         driver_fastest = laps.loc[idx_fastest].sort_values(config.COL_LAP_TIME).reset_index(drop=True)
 
         # Select and potentially reorder relevant columns for output
@@ -108,7 +121,8 @@ def get_driver_fastest_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]
         driver_fastest_out = driver_fastest[cols_present].copy()
 
         # Add formatted time string
-        driver_fastest_out['LapTimeStr'] = driver_fastest_out[config.COL_LAP_TIME].apply(formatting.format_timedelta)
+        driver_fastest_out['LapTimeStr'] = formatting.format_timedelta_series(
+            compact_schema.decimal_seconds(driver_fastest_out[config.COL_LAP_TIME]))
 
         logger.info(f"Found fastest laps for {len(driver_fastest_out)} drivers.")
         return driver_fastest_out
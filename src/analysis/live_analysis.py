@@ -0,0 +1,149 @@
+# f1_analysis_dashboard/src/analysis/live_analysis.py
+import bisect
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src.utils import formatting, metrics
+
+logger = logging.getLogger(__name__)
+
+# Columns of the driver fastest-lap table, as returned by lap_analysis.get_driver_fastest_laps
+FASTEST_LAP_COLUMNS = [config.COL_DRIVER, config.COL_TEAM, config.COL_LAP_NUMBER,
+                       config.COL_LAP_TIME, config.COL_COMPOUND, config.COL_TYRE_LIFE]
+
+
+def _lap_seconds(value: Any) -> Optional[float]:
+    """Lap time in seconds from a Timedelta, a number of seconds or a missing value."""
+    if value is None:
+        return None
+    if isinstance(value, pd.Timedelta):
+        return None if pd.isna(value) else value.total_seconds()
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        seconds = pd.Timedelta(value).total_seconds() # e.g. '0 days 00:01:32.345'
+    return None if math.isnan(seconds) else seconds
+
+
+def _sorted_median(values: List[float], count: int) -> float:
+    """Median of the first `count` values of a sorted list."""
+    middle = count // 2
+    if count % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+class LiveLapAnalysis:
+    """
+    Incrementally maintained driver fastest laps and constructor race pace.
+
+    Lap rows are added as they complete (see :meth:`ingest`); each lap costs
+    O(log n) comparisons plus one sorted-array insertion, independent of how
+    many laps came before. The tables are then built from the running state
+    (one row per driver/team) instead of from the full laps frame.
+
+    The results match lap_analysis.get_driver_fastest_laps and
+    pace_analysis.get_constructor_race_pace on the same laps. The pace outlier
+    cutoff (PACE_FILTER_THRESHOLD x the median of all pace-valid laps) moves
+    as laps arrive, so laps are kept in sorted arrays - one over all pace-valid
+    laps for the cutoff and one per team - and each team median is taken
+    over the part of its array below the current cutoff. Only the 'median'
+    outlier strategy with 'global' scope is supported live.
+
+    Args:
+        driver_teams: Driver -> team, used for lap rows without a team
+                      (e.g. from the session results).
+    """
+
+    def __init__(self, driver_teams: Optional[Mapping[str, str]] = None):
+        self.driver_teams = dict(driver_teams or {})
+        self.laps_ingested = 0
+        self.last_lap_number = 0
+        self._fastest: Dict[str, Dict[str, Any]] = {} # Driver -> fastest lap row
+        self._pace_seconds: List[float] = [] # Sorted, all pace-valid laps
+        self._team_seconds: Dict[str, List[float]] = {} # Team -> sorted pace-valid laps
+        if config.PACE_OUTLIER_STRATEGY != 'median' or config.PACE_OUTLIER_SCOPE != 'global':
+            logger.warning(f"Live analysis only supports the 'median' outlier strategy with 'global' scope; "
+                           f"ignoring '{config.PACE_OUTLIER_STRATEGY}'/'{config.PACE_OUTLIER_SCOPE}'.")
+
+    def add_lap(self, row: Mapping[str, Any]):
+        """Adds one completed lap (a mapping with the laps-frame columns)."""
+        self.laps_ingested += 1
+        driver = row.get(config.COL_DRIVER)
+        team = row.get(config.COL_TEAM)
+        if team is None or (isinstance(team, float) and math.isnan(team)):
+            team = self.driver_teams.get(driver, 'N/A')
+        lap_number = row.get(config.COL_LAP_NUMBER)
+        if lap_number is not None and not pd.isna(lap_number):
+            self.last_lap_number = max(self.last_lap_number, int(lap_number))
+        seconds = _lap_seconds(row.get(config.COL_LAP_TIME))
+        if seconds is None or driver is None:
+            return
+
+        # Fastest lap per driver: running minimum (earlier lap wins ties, like idxmin)
+        best = self._fastest.get(driver)
+        if best is None or seconds < best['seconds']:
+            lap = {column: row.get(column) for column in FASTEST_LAP_COLUMNS if column in row}
+            lap[config.COL_TEAM] = team
+            lap[config.COL_LAP_TIME] = (row[config.COL_LAP_TIME] if isinstance(row.get(config.COL_LAP_TIME), pd.Timedelta)
+                                        else pd.Timedelta(seconds=seconds))
+            lap['seconds'] = seconds
+            self._fastest[driver] = lap
+
+        # Pace-valid laps: same basic filters as lap_cleaning.clean_laps
+        if lap_number is None or pd.isna(lap_number) or lap_number < config.MIN_LAP_NUMBER_PACE:
+            return
+        accurate = row.get(config.COL_IS_ACCURATE)
+        if accurate is None or pd.isna(accurate) or not accurate == True: # noqa: E712 (also numpy bools)
+            return
+        bisect.insort(self._pace_seconds, seconds)
+        bisect.insort(self._team_seconds.setdefault(team, []), seconds)
+
+    def ingest(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Adds completed laps in the order given. Returns the number of rows added."""
+        count = 0
+        for row in rows:
+            self.add_lap(row)
+            count += 1
+        metrics.inc('live_laps_ingested_total', count)
+        return count
+
+    def ingest_frame(self, laps: pd.DataFrame) -> int:
+        """Adds the rows of a laps DataFrame."""
+        return self.ingest(laps.to_dict('records'))
+
+    def pace_cutoff(self) -> Optional[float]:
+        """Current outlier cutoff in seconds (None before the first pace-valid lap)."""
+        if not self._pace_seconds:
+            return None
+        return _sorted_median(self._pace_seconds, len(self._pace_seconds)) * config.PACE_FILTER_THRESHOLD
+
+    def driver_fastest_laps(self) -> Optional[pd.DataFrame]:
+        """Fastest lap per driver so far, sorted by lap time (as get_driver_fastest_laps)."""
+        if not self._fastest:
+            return None
+        rows = sorted(self._fastest.values(), key=lambda lap: lap['seconds'])
+        columns = [column for column in FASTEST_LAP_COLUMNS if any(column in lap for lap in rows)]
+        table = pd.DataFrame([{column: lap.get(column) for column in columns} for lap in rows], columns=columns)
+        table['LapTimeStr'] = formatting.format_timedelta_series(table[config.COL_LAP_TIME])
+        return table
+
+    def constructor_pace(self) -> Optional[pd.Series]:
+        """Median pace-valid lap time per team so far, fastest first (as get_constructor_race_pace)."""
+        cutoff = self.pace_cutoff()
+        if cutoff is None or len(self._team_seconds) < 2:
+            return None
+        medians = {}
+        for team, seconds in self._team_seconds.items():
+            kept = bisect.bisect_right(seconds, cutoff) # Laps at or below the cutoff
+            if kept:
+                medians[team] = _sorted_median(seconds, kept)
+        if not medians:
+            return None
+        pace = pd.Series(medians, name=config.COL_LAP_TIME_SECONDS, dtype=float).sort_values()
+        pace.index.name = config.COL_TEAM
+        return pace
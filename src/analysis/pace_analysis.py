@@ -5,12 +5,14 @@ import fastf1 as ff1
 import logging
 from typing import Optional
 
-from f1_analysis_dashboard.src.utils import formatting, helpers
+from f1_analysis_dashboard.src.utils import formatting, helpers, metrics
 from f1_analysis_dashboard import config
 
 logger = logging.getLogger(__name__)
 
-def get_constructor_race_pace(session: ff1.core.Session) -> Optional[pd.Series]:
+@helpers.requires_components('laps')
+def get_constructor_race_pace(session: ff1.core.Session,
+                              prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.Series]:
     """
     Calculates the median race pace for each constructor.
 
@@ -19,6 +21,7 @@ def get_constructor_race_pace(session: ff1.core.Session) -> Optional[pd.Series]:
 
     Args:
         session: The loaded FastF1 Session object (must be Race, include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
 
     Returns:
         A pandas Series with Team as index and median lap time (in seconds)
@@ -31,12 +34,13 @@ def get_constructor_race_pace(session: ff1.core.Session) -> Optional[pd.Series]:
         logger.warning(f"Constructor pace analysis is designed for Race sessions. Session type is '{session_name}'.")
         # Allow continuing, but the results might be less meaningful
 
-    if not hasattr(session, 'laps') or session.laps is None or session.laps.empty:
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
         logger.warning("Laps data not available for constructor pace analysis.")
         return None
 
-    laps = session.laps.copy()
-    laps = helpers.ensure_team_info(laps, session) # Critical for grouping
+    laps = prepared.laps
 
     # Check if team info is usable
     if config.COL_TEAM not in laps.columns or laps[config.COL_TEAM].isnull().all() or laps[config.COL_TEAM].nunique() < 2 :
@@ -44,45 +48,21 @@ def get_constructor_race_pace(session: ff1.core.Session) -> Optional[pd.Series]:
         return None
 
     try:
-        # --- Data Preparation and Filtering ---
-        # Convert LapTime to seconds for calculation
         if config.COL_LAP_TIME not in laps.columns:
              logger.error(f"'{config.COL_LAP_TIME}' column missing, cannot calculate pace.")
              return None
-        laps[config.COL_LAP_TIME_SECONDS] = laps[config.COL_LAP_TIME].dt.total_seconds()
-
-        # Basic filters
-        laps = laps[laps[config.COL_LAP_NUMBER] >= config.MIN_LAP_NUMBER_PACE]
-        if config.COL_IS_ACCURATE in laps.columns:
-            laps = laps[laps[config.COL_IS_ACCURATE]]
-        else:
-            logger.warning(f"'{config.COL_IS_ACCURATE}' column not found. Pace calculation might be less accurate.")
-
-        # Filter out laps with no time
-        laps.dropna(subset=[config.COL_LAP_TIME_SECONDS], inplace=True)
-
-        if laps.empty:
-            logger.warning("No valid laps remaining after initial filtering.")
-            return None
-
-        # --- Outlier Filtering (based on overall median) ---
-        # Calculate overall median *only* on valid numeric times
-        valid_times = laps[config.COL_LAP_TIME_SECONDS]
-        if not valid_times.empty:
-            median_lap_time = valid_times.median()
-            cutoff_time = median_lap_time * config.PACE_FILTER_THRESHOLD
-            laps = laps[laps[config.COL_LAP_TIME_SECONDS] <= cutoff_time]
-            logger.info(f"Filtered laps slower than {config.PACE_FILTER_THRESHOLD:.0%} of median ({formatting.format_timedelta(pd.Timedelta(seconds=cutoff_time))}).")
-        else:
-            logger.warning("No valid lap times found for median calculation; skipping outlier filter.")
 
+        # Lap number, accuracy, missing time and outlier filters are applied
+        # once per session by the shared pace mask.
+        laps = prepared.pace_laps
+        metrics.record_rows('constructor_pace:pace_mask', len(prepared.laps), len(laps))
 
         if laps.empty:
             logger.warning("No valid laps remaining after outlier filtering.")
             return None
 
         # --- Calculate Median Pace per Constructor ---
-        constructor_pace = laps.groupby(config.COL_TEAM)[config.COL_LAP_TIME_SECONDS].median()
+        constructor_pace = laps.groupby(config.COL_TEAM, observed=True)[config.COL_LAP_TIME_SECONDS].median()
 
         # Drop teams if their median calculation resulted in NaN (e.g., no valid laps left)
         constructor_pace.dropna(inplace=True)
@@ -105,7 +85,9 @@ def get_constructor_race_pace(session: ff1.core.Session) -> Optional[pd.Series]:
 
 
 # --- NEW FUNCTION ---
-def get_driver_race_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
+@helpers.requires_components('laps')
+def get_driver_race_laps(session: ff1.core.Session,
+                         prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
     """
     Extracts and cleans lap time data per driver for race pace analysis.
 
@@ -114,6 +96,7 @@ def get_driver_race_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
 
     Args:
         session: The loaded FastF1 Session object (must be Race, include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
 
     Returns:
         A pandas DataFrame with cleaned lap data (Driver, Team, LapTimeSeconds),
@@ -126,51 +109,25 @@ def get_driver_race_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
         logger.warning(f"Driver pace distribution analysis is designed for Race sessions. Session type is '{session_name}'.")
         # Allow continuing, but the results might be less meaningful
 
-    if not hasattr(session, 'laps') or session.laps is None or session.laps.empty:
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
         logger.warning("Laps data not available for driver pace analysis.")
         return None
 
-    laps = session.laps.copy()
-    laps = helpers.ensure_team_info(laps, session) # Get Team info
+    laps = prepared.laps
 
     # Check if team info is usable (needed for coloring/grouping later)
     if config.COL_TEAM not in laps.columns or laps[config.COL_TEAM].isnull().all():
         logger.warning("Team information is missing or incomplete. Proceeding without it for pace calculation, but plotting might lack team colors.")
-        # Ensure the column exists even if empty for consistency downstream
-        if config.COL_TEAM not in laps.columns: laps[config.COL_TEAM] = 'N/A'
-        laps[config.COL_TEAM].fillna('N/A', inplace=True)
 
     try:
-        # --- Data Preparation and Filtering (similar to constructor pace) ---
         if config.COL_LAP_TIME not in laps.columns:
              logger.error(f"'{config.COL_LAP_TIME}' column missing, cannot calculate pace.")
              return None
-        laps[config.COL_LAP_TIME_SECONDS] = laps[config.COL_LAP_TIME].dt.total_seconds()
 
-        # Basic filters
-        laps = laps[laps[config.COL_LAP_NUMBER] >= config.MIN_LAP_NUMBER_PACE]
-        if config.COL_IS_ACCURATE in laps.columns:
-            laps = laps[laps[config.COL_IS_ACCURATE]]
-        else:
-            logger.warning(f"'{config.COL_IS_ACCURATE}' column not found. Pace calculation might be less accurate.")
-
-        # Filter out laps with no time
-        laps.dropna(subset=[config.COL_LAP_TIME_SECONDS], inplace=True)
-
-        if laps.empty:
-            logger.warning("No valid laps remaining after initial filtering.")
-            return None
-
-        # --- Outlier Filtering (based on overall median) ---
         # Note: More advanced analysis might filter outliers *per driver*
-        valid_times = laps[config.COL_LAP_TIME_SECONDS]
-        if not valid_times.empty:
-            median_lap_time = valid_times.median()
-            cutoff_time = median_lap_time * config.PACE_FILTER_THRESHOLD
-            laps = laps[laps[config.COL_LAP_TIME_SECONDS] <= cutoff_time]
-            logger.info(f"Filtered laps slower than {config.PACE_FILTER_THRESHOLD:.0%} of median ({formatting.format_timedelta(pd.Timedelta(seconds=cutoff_time))}).")
-        else:
-            logger.warning("No valid lap times found for median calculation; skipping outlier filter.")
+        laps = prepared.pace_laps
 
         if laps.empty:
             logger.warning("No valid laps remaining after outlier filtering.")
@@ -181,6 +138,11 @@ def get_driver_race_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
         # Ensure columns exist before selecting
         output_cols = [col for col in output_cols if col in laps.columns]
         cleaned_laps = laps[output_cols].copy()
+        metrics.record_rows('driver_race_laps:pace_mask', len(prepared.laps), len(cleaned_laps))
+        if config.COL_TEAM not in cleaned_laps.columns:
+            cleaned_laps[config.COL_TEAM] = 'N/A' # Keep column for consistency downstream
+        else:
+            cleaned_laps[config.COL_TEAM] = cleaned_laps[config.COL_TEAM].fillna('N/A')
 
         logger.info(f"Prepared cleaned lap data for {cleaned_laps[config.COL_DRIVER].nunique()} drivers.")
         return cleaned_laps
@@ -190,4 +152,4 @@ def get_driver_race_laps(session: ff1.core.Session) -> Optional[pd.DataFrame]:
         return None
     except Exception as e:
         logger.error(f"Error preparing driver race laps: {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None
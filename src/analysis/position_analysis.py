@@ -0,0 +1,227 @@
+# f1_analysis_dashboard/src/analysis/position_analysis.py
+import pandas as pd
+import numpy as np
+import fastf1 as ff1
+import logging
+from typing import Optional
+
+from f1_analysis_dashboard.src.analysis import degradation_analysis
+from f1_analysis_dashboard.src.analysis.race_trace_analysis import RaceMatrix
+from f1_analysis_dashboard.src.utils import helpers, metrics
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+COL_PIT_IN = 'PitInTime'
+COL_PIT_OUT = 'PitOutTime'
+
+# Per driver-lap counters of get_position_changes, summed by summarize_position_changes
+CHANGE_COUNTERS = ['OnTrackGained', 'OnTrackLost', 'PitCycleGained', 'PitCycleLost']
+
+
+def pit_laps(matrix: RaceMatrix, laps: pd.DataFrame) -> np.ndarray:
+    """
+    Boolean (drivers, laps) mask of in-laps and out-laps.
+
+    Uses FastF1's PitInTime (set on the in-lap) and PitOutTime (set on the
+    out-lap). Without them, pit stops are inferred from stint changes
+    (degradation_analysis.assign_stints): the first lap of a new stint is
+    the out-lap and the lap before it the in-lap.
+    """
+    if COL_PIT_IN in laps.columns and COL_PIT_OUT in laps.columns:
+        pit_in = ~np.isnan(matrix.scatter(laps, COL_PIT_IN))
+        pit_out = ~np.isnan(matrix.scatter(laps, COL_PIT_OUT))
+        pit_out[:, 0] = False # The first lap starts from the grid (or the pit lane) - not a stop
+        return pit_in | pit_out
+
+    logger.info("PitInTime/PitOutTime not available; inferring pit stops from stint changes.")
+    stints = matrix.scatter(laps.assign(**{degradation_analysis.COL_STINT: degradation_analysis.assign_stints(laps)}),
+                            degradation_analysis.COL_STINT)
+    out_lap = np.zeros(stints.shape, dtype=bool)
+    out_lap[:, 1:] = stints[:, 1:] > stints[:, :-1] # NaN compares False
+    in_lap = np.zeros_like(out_lap)
+    in_lap[:, :-1] = out_lap[:, 1:]
+    return in_lap | out_lap
+
+
+def grid_positions(session: ff1.core.Session, matrix: RaceMatrix) -> np.ndarray:
+    """
+    Grid slot of each matrix driver from session.results.
+
+    NaN for pit-lane starts (GridPosition 0), drivers missing from the
+    results, and when the results or lap 1 are not available.
+    """
+    grid = np.full(len(matrix.drivers), np.nan)
+    if len(matrix.lap_numbers) == 0 or matrix.lap_numbers[0] != 1:
+        return grid
+    try:
+        results = session.results.drop_duplicates(config.COL_ABBREVIATION).set_index(config.COL_ABBREVIATION)
+        slots = pd.to_numeric(results[config.COL_GRID_POSITION], errors='coerce')
+    except (AttributeError, KeyError, ff1.core.DataNotLoadedError):
+        logger.info("Grid positions not available; lap 1 changes are counted from the lap 1 order.")
+        return grid
+    slots = slots.where(slots > 0).reindex(matrix.drivers)
+    return slots.to_numpy(dtype=float)
+
+
+def detect_passes(matrix: RaceMatrix, pitted: np.ndarray):
+    """
+    Every pair of drivers that swapped places, for all laps at once.
+
+    Driver i passed driver j on lap k when i crossed the line behind j on
+    lap k-1 and ahead of j on lap k, both having completed both laps. The
+    comparison runs on a (drivers, drivers, laps) boolean array, so a
+    full race needs no loop over laps. A swap is a pit-cycle swap if either
+    driver was on an in-lap or out-lap; otherwise it is an on-track pass.
+    Retirements and lap 1 (no previous lap) produce no passes.
+
+    Args:
+        matrix: RaceMatrix of the race.
+        pitted: (drivers, laps) in/out-lap mask from pit_laps.
+
+    Returns:
+        (on_track, pit_cycle): (drivers, drivers, laps) boolean arrays,
+        [i, j, k] True if i passed j on lap_numbers[k].
+    """
+    race_time = matrix.race_time
+    completed = matrix.completed()
+    ahead = race_time[:, None, :] < race_time[None, :, :] # i ahead of j at the end of each lap
+    running = completed[:, None, :] & completed[None, :, :]
+
+    passed = np.zeros(ahead.shape, dtype=bool)
+    passed[:, :, 1:] = ahead[:, :, 1:] & ~ahead[:, :, :-1] & running[:, :, 1:] & running[:, :, :-1]
+    pit_pair = pitted[:, None, :] | pitted[None, :, :]
+    return passed & ~pit_pair, passed & pit_pair
+
+
+def overtakes(matrix: RaceMatrix, pitted: np.ndarray) -> pd.DataFrame:
+    """
+    One row per pass (LapNumber, Driver, Team, PassedDriver, PassedTeam, PitCycle), ordered by lap.
+    """
+    on_track, pit_cycle = detect_passes(matrix, pitted)
+    driver, passed, lap = np.nonzero(on_track | pit_cycle)
+    events = pd.DataFrame({
+        config.COL_LAP_NUMBER: matrix.lap_numbers[lap],
+        config.COL_DRIVER: matrix.drivers[driver],
+        config.COL_TEAM: matrix.teams[driver],
+        'PassedDriver': matrix.drivers[passed],
+        'PassedTeam': matrix.teams[passed],
+        'PitCycle': pit_cycle[driver, passed, lap],
+    })
+    return events.sort_values([config.COL_LAP_NUMBER, config.COL_DRIVER], kind='stable').reset_index(drop=True)
+
+
+@helpers.requires_components('laps')
+def get_position_changes(session: ff1.core.Session,
+                         prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
+    """
+    Calculates position gains and losses of every driver on every lap.
+
+    Positions come from the race-trace matrix (race_trace_analysis.RaceMatrix);
+    passes are found with detect_passes and split into on-track passes and
+    pit-cycle swaps. Lap 1 changes are measured against the grid
+    (grid_positions); the pass counters start on lap 2. Meant for Race
+    sessions; main.py runs it for 'R' only.
+
+    Args:
+        session: The loaded FastF1 Session object (must be Race, include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
+
+    Returns:
+        A pandas DataFrame with one row per driver and completed lap (Driver,
+        Team, LapNumber, Position, GridPosition (NaN if unknown),
+        PositionChange vs. the previous lap or the grid with gains positive
+        (0 if there is no timing or grid slot to compare with), OnTrackGained,
+        OnTrackLost, PitCycleGained, PitCycleLost, Pitted), ordered by lap and
+        position. Returns None if calculation fails.
+    """
+    session_name = getattr(session, 'name', 'Unknown Session')
+    logger.info(f"Calculating position changes for {session_name}...")
+
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
+        logger.warning("Laps data not available for position change analysis.")
+        return None
+
+    try:
+        matrix = RaceMatrix.from_laps(prepared.laps)
+        if matrix is None or not matrix.completed().any():
+            logger.warning("No completed laps with timing for position change analysis.")
+            return None
+
+        pitted = pit_laps(matrix, prepared.laps)
+        on_track, pit_cycle = detect_passes(matrix, pitted)
+        positions = matrix.positions()
+        completed = matrix.completed()
+        grid = grid_positions(session, matrix)
+        change = np.zeros(positions.shape)
+        # Positive: places gained; 0 where the previous lap has no timing (a missing Time) or there is no grid slot
+        change[:, 0] = np.where(completed[:, 0] & ~np.isnan(grid), grid - positions[:, 0], 0)
+        change[:, 1:] = np.where(completed[:, 1:] & completed[:, :-1], positions[:, :-1] - positions[:, 1:], 0)
+
+        rows, columns = np.nonzero(completed)
+        changes = pd.DataFrame({
+            config.COL_DRIVER: matrix.drivers[rows],
+            config.COL_TEAM: matrix.teams[rows],
+            config.COL_LAP_NUMBER: matrix.lap_numbers[columns],
+            config.COL_POSITION: positions[rows, columns].astype(int),
+            config.COL_GRID_POSITION: grid[rows],
+            'PositionChange': change[rows, columns].astype(int),
+            'OnTrackGained': on_track.sum(axis=1)[rows, columns],
+            'OnTrackLost': on_track.sum(axis=0)[rows, columns],
+            'PitCycleGained': pit_cycle.sum(axis=1)[rows, columns],
+            'PitCycleLost': pit_cycle.sum(axis=0)[rows, columns],
+            'Pitted': pitted[rows, columns],
+        })
+        changes = changes.sort_values([config.COL_LAP_NUMBER, config.COL_POSITION], kind='stable').reset_index(drop=True)
+        metrics.record_rows('position_changes:completed_laps', len(prepared.laps), len(changes))
+        logger.info(f"Found {int(on_track.sum())} on-track passes and {int(pit_cycle.sum())} pit-cycle swaps.")
+        return changes
+
+    except KeyError as e:
+        logger.error(f"Missing expected column for position change analysis: {e}", exc_info=True)
+        return None
+    except Exception as e:
+        logger.error(f"Error calculating position changes: {e}", exc_info=True)
+        return None
+
+
+def summarize_position_changes(changes: pd.DataFrame, window: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """
+    Totals of get_position_changes per driver, or per driver and lap window.
+
+    Args:
+        changes: Result of get_position_changes.
+        window: Laps per window (e.g. config.POSITION_LAP_WINDOW); None for whole-race totals.
+
+    Returns:
+        Per driver: Team, StartPosition (the grid slot; the lap 1 position
+        for pit-lane starters or without a grid), FinishPosition, NetChange
+        and the summed counters, in finishing order. Per window: Driver,
+        Team, LapStart, LapEnd, NetChange and the summed counters. None if
+        there are no changes.
+    """
+    if changes is None or changes.empty:
+        return None
+    if window is None:
+        by_driver = changes.sort_values(config.COL_LAP_NUMBER, kind='stable').groupby(config.COL_DRIVER, sort=False)
+        summary = by_driver.agg(**{config.COL_TEAM: (config.COL_TEAM, 'first'),
+                                   'StartPosition': (config.COL_GRID_POSITION, 'first'),
+                                   'FirstPosition': (config.COL_POSITION, 'first'),
+                                   'FinishPosition': (config.COL_POSITION, 'last'),
+                                   'LastLap': (config.COL_LAP_NUMBER, 'last')})
+        summary['StartPosition'] = summary['StartPosition'].fillna(summary.pop('FirstPosition')).astype(int)
+        summary['NetChange'] = summary['StartPosition'] - summary['FinishPosition']
+        summary = summary.join(by_driver[CHANGE_COUNTERS].sum())
+        # Classified order: most laps first, then position on the last lap
+        summary = summary.sort_values(['LastLap', 'FinishPosition'], ascending=[False, True])
+        return summary.drop(columns='LastLap').reset_index()
+
+    window_index = (changes[config.COL_LAP_NUMBER] - 1) // window
+    grouped = changes.groupby([config.COL_DRIVER, window_index.rename('Window')])
+    summary = grouped.agg(**{config.COL_TEAM: (config.COL_TEAM, 'first'),
+                             'NetChange': ('PositionChange', 'sum')}).join(grouped[CHANGE_COUNTERS].sum()).reset_index()
+    summary.insert(3, 'LapStart', summary['Window'] * window + 1)
+    summary.insert(4, 'LapEnd', np.minimum((summary['Window'] + 1) * window, changes[config.COL_LAP_NUMBER].max()))
+    return summary.drop(columns='Window')
@@ -0,0 +1,186 @@
+# f1_analysis_dashboard/src/analysis/race_trace_analysis.py
+import pandas as pd
+import numpy as np
+import fastf1 as ff1
+import logging
+from typing import Optional
+
+from f1_analysis_dashboard.src.utils import helpers, metrics
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+
+def _seconds(values: pd.Series) -> np.ndarray:
+    """Float seconds from a timedelta column (or a compact-schema column already in seconds)."""
+    if pd.api.types.is_timedelta64_dtype(values.dtype):
+        return values.dt.total_seconds().to_numpy(dtype=float)
+    return values.to_numpy(dtype=float)
+
+
+class RaceMatrix:
+    """
+    Dense drivers x laps view of a race.
+
+    ``race_time[i, k]`` is the session time (seconds) at which driver i
+    completed lap ``lap_numbers[k]``; NaN where the lap was not completed
+    (retirements, lapped cars taking the flag early, missing timing). Every
+    other per-lap quantity is derived from this one array with column-wise
+    NumPy operations; no per-driver filtering.
+
+    Attributes:
+        drivers: Driver abbreviations, one per row.
+        teams: Team of each driver.
+        lap_numbers: Lap numbers, one per column (1..last lap).
+        race_time: (drivers, laps) float array of lap completion times.
+    """
+
+    def __init__(self, drivers: np.ndarray, teams: np.ndarray, lap_numbers: np.ndarray, race_time: np.ndarray):
+        self.drivers = drivers
+        self.teams = teams
+        self.lap_numbers = lap_numbers
+        self.race_time = race_time
+
+    @classmethod
+    def from_laps(cls, laps: pd.DataFrame) -> Optional['RaceMatrix']:
+        """
+        Scatters a laps frame into the matrix (one vectorized assignment).
+
+        Lap completion time is the 'Time' column; without it, the running
+        sum of LapTime is used (a missing lap time then masks the rest of
+        that driver's race).
+        """
+        laps = laps.dropna(subset=[config.COL_DRIVER, config.COL_LAP_NUMBER])
+        if laps.empty:
+            return None
+        row, drivers = pd.factorize(laps[config.COL_DRIVER].astype(str), sort=True)
+        lap_number = laps[config.COL_LAP_NUMBER].to_numpy(dtype=int)
+        lap_numbers = np.arange(1, lap_number.max() + 1)
+        if config.COL_TIME in laps.columns:
+            race_time = cls.lap_values(laps, config.COL_TIME, row, lap_number, len(drivers), len(lap_numbers))
+        else:
+            lap_seconds = cls.lap_values(laps, config.COL_LAP_TIME, row, lap_number, len(drivers), len(lap_numbers))
+            race_time = np.cumsum(lap_seconds, axis=1) # NaN propagates past a missing lap
+
+        teams = np.full(len(drivers), 'N/A', dtype=object)
+        if config.COL_TEAM in laps.columns:
+            teams[row] = laps[config.COL_TEAM].astype(str).to_numpy() # Any lap's team will do
+        return cls(np.asarray(drivers, dtype=object), teams, lap_numbers, race_time)
+
+    @staticmethod
+    def lap_values(laps: pd.DataFrame, column: str, row: np.ndarray, lap_number: np.ndarray,
+                   n_drivers: int, n_laps: int) -> np.ndarray:
+        """A laps column scattered into a (drivers, laps) float matrix (times as seconds, NaN if absent)."""
+        values = np.full((n_drivers, n_laps), np.nan)
+        values[row, lap_number - 1] = _seconds(laps[column])
+        return values
+
+    def scatter(self, laps: pd.DataFrame, column: str) -> np.ndarray:
+        """Another laps column (e.g. 'PitInTime') aligned to this matrix; NaN where absent."""
+        laps = laps.dropna(subset=[config.COL_DRIVER, config.COL_LAP_NUMBER])
+        row = pd.Index(self.drivers).get_indexer(laps[config.COL_DRIVER].astype(str))
+        lap_number = laps[config.COL_LAP_NUMBER].to_numpy(dtype=int)
+        keep = (row >= 0) & (lap_number >= 1) & (lap_number <= len(self.lap_numbers))
+        return self.lap_values(laps[keep], column, row[keep], lap_number[keep], len(self.drivers), len(self.lap_numbers))
+
+    def completed(self) -> np.ndarray:
+        """Boolean mask of completed laps."""
+        return ~np.isnan(self.race_time)
+
+    def leader_time(self) -> np.ndarray:
+        """Time the leader completed each lap (NaN for laps nobody completed)."""
+        completed = self.completed()
+        leader = np.where(completed, self.race_time, np.inf).min(axis=0)
+        return np.where(completed.any(axis=0), leader, np.nan)
+
+    def gap_to_leader(self) -> np.ndarray:
+        """Seconds behind the first car to complete each lap."""
+        return self.race_time - self.leader_time()
+
+    def positions(self) -> np.ndarray:
+        """Running order at the end of each lap (1 = leader), NaN for laps not completed."""
+        order = np.argsort(self.race_time, axis=0, kind='stable') # NaN sorts last
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, len(self.drivers) + 1)[:, None], axis=0)
+        return np.where(self.completed(), ranks, np.nan)
+
+    def interval(self) -> np.ndarray:
+        """Seconds behind the car directly ahead on the road at each lap line (0 for the leader)."""
+        order = np.argsort(self.race_time, axis=0, kind='stable')
+        in_order = np.take_along_axis(self.race_time, order, axis=0)
+        intervals = np.diff(in_order, axis=0, prepend=in_order[:1]) # Leader: 0
+        result = np.empty_like(intervals)
+        np.put_along_axis(result, order, intervals, axis=0)
+        return np.where(self.completed(), result, np.nan)
+
+    def laps_down(self) -> np.ndarray:
+        """Laps behind the leader: leader laps completed before the driver completed the same lap number."""
+        leader = self.leader_time()
+        leader_done = np.maximum.accumulate(np.where(np.isnan(leader), -np.inf, leader)) # Sorted for searchsorted
+        crossings = np.searchsorted(leader_done, np.where(self.completed(), self.race_time, np.inf).ravel(), side='left')
+        down = crossings.reshape(self.race_time.shape) - np.arange(1, len(self.lap_numbers) + 1)
+        return np.where(self.completed(), np.maximum(down, 0), np.nan)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long frame with one row per completed (driver, lap), ordered by lap and position."""
+        completed = self.completed()
+        rows, columns = np.nonzero(completed)
+        frame = pd.DataFrame({
+            config.COL_DRIVER: self.drivers[rows],
+            config.COL_TEAM: self.teams[rows],
+            config.COL_LAP_NUMBER: self.lap_numbers[columns],
+            'RaceTimeSeconds': self.race_time[rows, columns],
+            'GapToLeader': self.gap_to_leader()[rows, columns],
+            'Interval': self.interval()[rows, columns],
+            config.COL_POSITION: self.positions()[rows, columns].astype(int),
+            'LapsDown': self.laps_down()[rows, columns].astype(int),
+        })
+        return frame.sort_values([config.COL_LAP_NUMBER, config.COL_POSITION], kind='stable').reset_index(drop=True)
+
+
+@helpers.requires_components('laps')
+def get_race_trace(session: ff1.core.Session,
+                   prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
+    """
+    Calculates gap to leader, interval and running position for every lap.
+
+    All values come from one drivers x laps matrix of lap completion times
+    (see RaceMatrix); laps a driver did not complete are left out. Meant for
+    Race sessions; main.py runs it for 'R' only.
+
+    Args:
+        session: The loaded FastF1 Session object (must be Race, include laps).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
+
+    Returns:
+        A pandas DataFrame with one row per driver and completed lap
+        (Driver, Team, LapNumber, RaceTimeSeconds, GapToLeader, Interval,
+        Position, LapsDown), ordered by lap and position. Returns None if
+        calculation fails.
+    """
+    session_name = getattr(session, 'name', 'Unknown Session')
+    logger.info(f"Calculating race trace for {session_name}...")
+
+    if prepared is None:
+        prepared = helpers.prepare_laps(session)
+    if prepared is None:
+        logger.warning("Laps data not available for race trace analysis.")
+        return None
+
+    try:
+        matrix = RaceMatrix.from_laps(prepared.laps)
+        if matrix is None or not matrix.completed().any():
+            logger.warning("No completed laps with timing for race trace analysis.")
+            return None
+
+        trace = matrix.to_frame()
+        metrics.record_rows('race_trace:completed_laps', len(prepared.laps), len(trace))
+        logger.info(f"Built race trace of {len(matrix.drivers)} drivers over {len(matrix.lap_numbers)} laps.")
+        return trace
+
+    except KeyError as e:
+        logger.error(f"Missing expected column for race trace analysis: {e}", exc_info=True)
+        return None
+    except Exception as e:
+        logger.error(f"Error calculating race trace: {e}", exc_info=True)
+        return None
@@ -4,11 +4,12 @@ import fastf1 as ff1
 import logging
 from typing import Optional
 
-from f1_analysis_dashboard.src.utils import formatting
+from f1_analysis_dashboard.src.utils import compact_schema, formatting, helpers, metrics
 from f1_analysis_dashboard import config
 
 logger = logging.getLogger(__name__)
 
+@helpers.requires_components() # Results are always loaded
 def get_official_results(session: ff1.core.Session) -> Optional[pd.DataFrame]:
     """
     Retrieves and formats the official session results.
@@ -54,7 +55,7 @@ def get_official_results(session: ff1.core.Session) -> Optional[pd.DataFrame]:
 
         # Format Time column - handle both Timedelta and potentially other representations
         if config.COL_TIME in results_df.columns:
-            results_df['TimeStr'] = results_df[config.COL_TIME].apply(formatting.format_timedelta)
+            results_df['TimeStr'] = formatting.format_timedelta_series(compact_schema.decimal_seconds(results_df[config.COL_TIME]))
         else:
             results_df['TimeStr'] = '' # Should not happen due to check above, but safe
 
@@ -87,6 +88,7 @@ def get_official_results(session: ff1.core.Session) -> Optional[pd.DataFrame]:
         if config.COL_POSITION in results_out.columns:
              results_out = results_out.sort_values(by=config.COL_POSITION).reset_index(drop=True)
 
+        metrics.record_rows('official_results', len(session.results), len(results_out))
         logger.info(f"Formatted official results for {len(results_out)} drivers.")
         return results_out
 
@@ -0,0 +1,232 @@
+# f1_analysis_dashboard/src/analysis/telemetry_analysis.py
+import pandas as pd
+import numpy as np
+import fastf1 as ff1
+import logging
+from typing import Dict, List, Optional, Sequence
+
+from f1_analysis_dashboard.src import telemetry_store
+from f1_analysis_dashboard.src.analysis import lap_analysis
+from f1_analysis_dashboard.src.utils import helpers, metrics
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+# Channels resampled onto the shared distance grid ('Time' is seconds since the lap started)
+TRACE_CHANNELS = ['Time', 'Speed', 'Throttle', 'Brake', 'X', 'Y']
+
+
+def resample_to_distance(distances: Sequence[np.ndarray], channels: Dict[str, Sequence[np.ndarray]],
+                         grid: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Linearly interpolates the channels of N laps onto one distance grid in a single pass.
+
+    The laps are concatenated with each lap's distance shifted past the end
+    of the previous one, so a single np.searchsorted over the combined
+    distance axis locates every grid point of every lap. The interpolation
+    positions and weights are computed once and shared by all channels - no
+    loop over laps and no per-lap merge. Equivalent to np.interp per lap
+    (values beyond a lap's end are held at its last sample).
+
+    Args:
+        distances: Per lap, the non-decreasing distance (metres from the lap start) of each sample.
+        channels: Channel name -> per lap, the sample values (same lengths as `distances`).
+        grid: Shared distance axis in metres.
+
+    Returns:
+        Channel name -> (N laps, len(grid)) float array.
+    """
+    n_laps, n_points = len(distances), len(grid)
+    lengths = np.array([len(distance) for distance in distances])
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    span = max(float(grid[-1]), max(float(distance[-1]) for distance in distances)) + 1.0
+
+    sample_lap = np.repeat(np.arange(n_laps), lengths)
+    x = np.concatenate(distances).astype(float) + sample_lap * span
+    target_lap = np.repeat(np.arange(n_laps), n_points)
+    targets = np.tile(grid.astype(float), n_laps) + target_lap * span
+
+    # Right neighbour of every target, kept inside its own lap's samples
+    right = np.searchsorted(x, targets, side='right')
+    right = np.clip(right, offsets[target_lap] + 1, offsets[target_lap] + lengths[target_lap] - 1)
+    left = right - 1
+    step = x[right] - x[left]
+    weight = np.divide(targets - x[left], step, out=np.zeros_like(targets), where=step > 0)
+    weight = np.clip(weight, 0.0, 1.0)
+
+    resampled = {}
+    for name, values in channels.items():
+        flat = np.concatenate(values).astype(float)
+        resampled[name] = (flat[left] + weight * (flat[right] - flat[left])).reshape(n_laps, n_points)
+    return resampled
+
+
+def _as_timedelta(value) -> pd.Timedelta:
+    """Session time as a Timedelta; compact-schema laps hold float seconds."""
+    if value is None or pd.isna(value):
+        return pd.NaT
+    return value if isinstance(value, pd.Timedelta) else pd.Timedelta(seconds=float(value))
+
+
+def _lap_channels_from_session(session: ff1.core.Session, lap: pd.Series) -> Optional[Dict[str, np.ndarray]]:
+    """A lap's channels from telemetry held in memory (when no telemetry store is available)."""
+    try:
+        car_data = session.car_data
+    except (AttributeError, ff1.core.DataNotLoadedError):
+        return None
+    car = car_data.get(str(lap.get('DriverNumber'))) if car_data else None
+    end = _as_timedelta(lap.get(config.COL_TIME))
+    start = _as_timedelta(lap.get('LapStartTime'))
+    if pd.isna(start) and pd.notna(end):
+        start = end - _as_timedelta(lap.get(config.COL_LAP_TIME))
+    if car is None or pd.isna(start) or pd.isna(end):
+        return None
+
+    window = car[(car['SessionTime'] >= start) & (car['SessionTime'] <= end)]
+    session_time = window['SessionTime'].to_numpy().astype('timedelta64[ns]').view('int64')
+    speed = window['Speed'].to_numpy(dtype=float)
+    if 'Distance' in window.columns:
+        distance = window['Distance'].to_numpy(dtype=float)
+    else: # Integrate speed (km/h) over time, like Telemetry.add_distance
+        distance = np.concatenate(([0.0], np.cumsum(speed[1:] / 3.6 * np.diff(session_time) / 1e9)))
+    lap_channels = {'SessionTime': session_time, 'Distance': distance, 'Speed': speed,
+                    'Throttle': window['Throttle'].to_numpy(dtype=float),
+                    'Brake': window['Brake'].to_numpy(dtype=float)}
+    for axis in ('X', 'Y'):
+        lap_channels[axis] = (window[axis].to_numpy(dtype=float) if axis in window.columns
+                              else np.full(len(window), np.nan))
+    return lap_channels
+
+
+@helpers.requires_components('laps', 'telemetry')
+@helpers.uses_config('TELEMETRY_DISTANCE_STEP')
+def get_fastest_lap_telemetry(session: ff1.core.Session,
+                              prepared: Optional[helpers.PreparedLaps] = None) -> Optional[pd.DataFrame]:
+    """
+    Resamples every driver's fastest lap onto a shared distance axis.
+
+    The laps come from lap_analysis.get_driver_fastest_laps; their telemetry
+    is read from the memory-mapped telemetry store (or from the session if
+    no store exists). The grid runs from the start line to the shortest of
+    the laps in steps of config.TELEMETRY_DISTANCE_STEP metres, so every
+    trace is defined along the whole axis.
+
+    Args:
+        session: The loaded FastF1 Session object (must include laps and telemetry).
+        prepared: Optional shared PreparedLaps for this session; built on demand if omitted.
+
+    Returns:
+        A long pandas DataFrame with one row per driver and grid point
+        (Driver, Team, LapNumber, Distance, Time, Speed, Throttle, Brake, X, Y),
+        drivers ordered fastest first. Returns None if no telemetry is available.
+    """
+    session_name = getattr(session, 'name', 'Unknown Session')
+    logger.info(f"Comparing fastest lap telemetry for {session_name}...")
+
+    fastest_laps = lap_analysis.get_driver_fastest_laps(session, prepared)
+    if fastest_laps is None or fastest_laps.empty:
+        logger.warning("No fastest laps available for telemetry comparison.")
+        return None
+
+    try:
+        store = telemetry_store.open_session(session) if config.TELEMETRY_STORE_ENABLED else None
+        session_laps = None
+        if store is None: # Lap windows for slicing the in-memory telemetry
+            session_laps = session.laps.set_index([config.COL_DRIVER, config.COL_LAP_NUMBER])
+
+        drivers: List[pd.Series] = []
+        distances, channels = [], {name: [] for name in TRACE_CHANNELS}
+        for _, lap in fastest_laps.iterrows(): # One lap per driver; the resampling itself is batched
+            driver, lap_number = lap[config.COL_DRIVER], int(lap[config.COL_LAP_NUMBER])
+            if store is not None:
+                lap_channels = store.lap(str(driver), lap_number) if str(driver) in store.drivers else None
+            else:
+                lap_channels = _lap_channels_from_session(session, session_laps.loc[(driver, lap[config.COL_LAP_NUMBER])])
+            if lap_channels is None or len(lap_channels['Distance']) < 2:
+                logger.warning(f"No telemetry for {driver}'s fastest lap ({lap_number}). Skipping driver.")
+                continue
+            distance = np.asarray(lap_channels['Distance'], dtype=float)
+            distances.append(np.maximum.accumulate(distance - distance[0])) # Guard against sensor jitter
+            session_time = np.asarray(lap_channels['SessionTime'], dtype=np.int64)
+            channels['Time'].append((session_time - session_time[0]) / 1e9)
+            for name in TRACE_CHANNELS[1:]:
+                channels[name].append(np.asarray(lap_channels[name], dtype=float))
+            drivers.append(lap)
+
+        if len(drivers) < 1:
+            logger.warning("Telemetry is not available for any fastest lap.")
+            return None
+
+        lap_length = min(distance[-1] for distance in distances)
+        grid = np.arange(0.0, lap_length, config.TELEMETRY_DISTANCE_STEP)
+        traces = resample_to_distance(distances, channels, grid)
+        metrics.record_rows('telemetry_comparison:samples', sum(len(distance) for distance in distances), traces['Speed'].size)
+
+        n_points = len(grid)
+        result = pd.DataFrame({
+            config.COL_DRIVER: np.repeat([str(lap[config.COL_DRIVER]) for lap in drivers], n_points),
+            config.COL_TEAM: np.repeat([str(lap.get(config.COL_TEAM, 'N/A')) for lap in drivers], n_points),
+            config.COL_LAP_NUMBER: np.repeat([int(lap[config.COL_LAP_NUMBER]) for lap in drivers], n_points),
+            'Distance': np.tile(grid, len(drivers)),
+        })
+        for name in TRACE_CHANNELS:
+            result[name] = traces[name].ravel()
+        logger.info(f"Resampled fastest-lap telemetry of {len(drivers)} drivers onto {n_points} points.")
+        return result
+
+    except KeyError as e:
+        logger.error(f"Missing expected column for telemetry comparison: {e}", exc_info=True)
+        return None
+    except Exception as e:
+        logger.error(f"Error comparing fastest lap telemetry: {e}", exc_info=True)
+        return None
+
+
+def trace_matrix(traces: pd.DataFrame, channel: str) -> np.ndarray:
+    """A channel of get_fastest_lap_telemetry's result as a (drivers, grid points) matrix."""
+    n_drivers = traces[config.COL_DRIVER].nunique()
+    return traces[channel].to_numpy(dtype=float).reshape(n_drivers, -1)
+
+
+def minisector_dominance(traces: pd.DataFrame, n_mini_sectors: Optional[int] = None) -> Optional[pd.DataFrame]:
+    """
+    Fastest driver in each mini-sector of the shared distance axis.
+
+    The lap is cut into equal-length mini-sectors; each driver's time through
+    every mini-sector is the difference of the elapsed-time matrix at the
+    mini-sector boundaries, and the winner is its argmin over drivers.
+
+    Args:
+        traces: Result of get_fastest_lap_telemetry.
+        n_mini_sectors: Number of mini-sectors (default: config.TELEMETRY_MINI_SECTORS).
+
+    Returns:
+        One row per mini-sector (MiniSector, StartDistance, EndDistance,
+        Driver, Team, SectorTimeSeconds, GapSeconds to the second fastest),
+        or None if there is nothing to compare.
+    """
+    if traces is None or traces.empty:
+        return None
+    n_mini_sectors = config.TELEMETRY_MINI_SECTORS if n_mini_sectors is None else n_mini_sectors
+    elapsed = trace_matrix(traces, 'Time')
+    n_drivers, n_points = elapsed.shape
+    n_mini_sectors = max(1, min(n_mini_sectors, n_points - 1))
+    edges = np.linspace(0, n_points - 1, n_mini_sectors + 1).round().astype(int)
+
+    sector_times = elapsed[:, edges[1:]] - elapsed[:, edges[:-1]] # (drivers, mini-sectors)
+    fastest = np.argmin(sector_times, axis=0)
+    best = sector_times[fastest, np.arange(n_mini_sectors)]
+    runner_up = np.partition(sector_times, 1, axis=0)[1] if n_drivers > 1 else np.full(n_mini_sectors, np.nan)
+
+    drivers = traces[config.COL_DRIVER].to_numpy()[::n_points]
+    teams = traces[config.COL_TEAM].to_numpy()[::n_points]
+    distance = traces['Distance'].to_numpy()[:n_points]
+    return pd.DataFrame({
+        'MiniSector': np.arange(1, n_mini_sectors + 1),
+        'StartDistance': distance[edges[:-1]],
+        'EndDistance': distance[edges[1:]],
+        config.COL_DRIVER: drivers[fastest],
+        config.COL_TEAM: teams[fastest],
+        'SectorTimeSeconds': best,
+        'GapSeconds': runner_up - best,
+    })
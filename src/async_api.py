@@ -0,0 +1,140 @@
+# f1_analysis_dashboard/src/async_api.py
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+import fastf1 as ff1
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.utils import helpers
+
+logger = logging.getLogger(__name__)
+
+# Async facade over the blocking loader and analyses for asyncio services.
+# FastF1 and pandas work runs in a module-level thread pool; the coroutines
+# only wait for it. Cancelling or timing out a coroutine stops the caller
+# waiting but cannot interrupt a load already running in a worker thread.
+
+# (event loop, year, event, session identifier, load config)
+_LoadKey = Tuple[asyncio.AbstractEventLoop, int, str, str, Tuple[Tuple[str, bool], ...]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_inflight: Dict[_LoadKey, asyncio.Task] = {}
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """The shared worker pool, created on first use with config.ASYNC_WORKERS threads."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=config.ASYNC_WORKERS, thread_name_prefix='f1-async')
+        return _executor
+
+
+def shutdown(wait: bool = True):
+    """Stops the worker pool; the next async call creates a new one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def _run_blocking(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Runs func in the worker pool with the caller's context (e.g. the metrics session label)."""
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(get_executor(), call)
+
+
+async def load_session_async(year: int, event: Union[str, int], session_identifier: str,
+                             load_config: Optional[Dict[str, bool]] = None,
+                             timeout: Optional[float] = None) -> Optional[ff1.core.Session]:
+    """
+    Awaitable `data_loader.load_session_data`.
+
+    Concurrent calls for the same session and load configuration share one
+    load: only the first starts it, the others wait for its result. A caller
+    that is cancelled or times out stops waiting without affecting the
+    others.
+
+    Args:
+        year, event, session_identifier, load_config: As for load_session_data.
+        timeout: Seconds to wait before raising asyncio.TimeoutError (None waits indefinitely).
+
+    Returns:
+        The loaded session, or None if loading failed.
+    """
+    effective_config = config.LOAD_CONFIG if load_config is None else load_config
+    key = (asyncio.get_running_loop(), year, str(event).lower(), session_identifier,
+           tuple(sorted(effective_config.items())))
+    task = _inflight.get(key)
+    if task is None:
+        logger.debug(f"Starting async load of {year} {event} {session_identifier}.")
+        task = asyncio.ensure_future(_run_blocking(data_loader.load_session_data, year, event,
+                                                   session_identifier, load_config=load_config))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug(f"Joining in-flight load of {year} {event} {session_identifier}.")
+    # shield: cancelling this caller must not cancel the load other callers share
+    return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+def run_analyses(session: ff1.core.Session, analyses: Mapping[str, Callable]) -> Dict[str, Any]:
+    """
+    Runs analysis functions on a loaded session (blocking).
+
+    Laps are prepared once and passed to every analysis that declares the
+    'laps' component, as in main.analyse_session.
+
+    Returns:
+        A dict of analysis name -> result (None where an analysis failed).
+    """
+    needs_laps = any('laps' in getattr(func, 'required_components', ()) for func in analyses.values())
+    prepared_laps = helpers.prepare_laps(session) if needs_laps else None
+    results = {}
+    for name, func in analyses.items():
+        if 'laps' in getattr(func, 'required_components', ()):
+            results[name] = func(session, prepared_laps)
+        else:
+            results[name] = func(session)
+    return results
+
+
+async def run_analyses_async(session: ff1.core.Session, analyses: Mapping[str, Callable],
+                             timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Awaitable run_analyses, e.g. `await run_analyses_async(session, main.ANALYSES)`.
+
+    Raises:
+        asyncio.TimeoutError: If the analyses take longer than `timeout` seconds.
+    """
+    return await asyncio.wait_for(_run_blocking(run_analyses, session, analyses), timeout)
+
+
+async def analyse_session_async(year: int, event: Union[str, int], session_identifier: str,
+                                analyses: Mapping[str, Callable],
+                                timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Loads only the components the analyses need and runs them.
+
+    `timeout` bounds the load and the analyses together.
+
+    Returns:
+        A dict of analysis name -> result, or None if the session could not be loaded.
+    """
+    async def load_and_run() -> Optional[Dict[str, Any]]:
+        load_config = data_loader.required_load_config(analyses.values())
+        session = await load_session_async(year, event, session_identifier, load_config)
+        if session is None:
+            return None
+        return await run_analyses_async(session, analyses)
+
+    return await asyncio.wait_for(load_and_run(), timeout)
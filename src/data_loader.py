@@ -4,55 +4,132 @@ import fastf1.ergast
 import pandas as pd
 import os
 import logging
+import threading
+import time
 import traceback
-from typing import Optional, Union
+from typing import Callable, Dict, Iterable, Optional, Union
 from f1_analysis_dashboard import config # Use relative import
+from f1_analysis_dashboard.src import session_store, telemetry_store
+from f1_analysis_dashboard.src.utils import compact_schema, metrics
 from fastf1.ergast.interface import ErgastError
 
 logger = logging.getLogger(__name__)
 
+# Directory the FastF1 cache was enabled with; enable_cache replaces FastF1's global
+# HTTP session, so it must not run again while other threads are downloading
+_cache_lock = threading.Lock()
+_enabled_cache_dir = None
+
 def setup_fastf1_cache() -> bool:
     """
     Configures the FastF1 cache according to settings in config.py.
 
+    The cache is enabled once per cache directory; later calls (from every
+    session load, in any thread) return without touching FastF1.
+
     Returns:
         True if cache setup was successful or not needed, False otherwise.
     """
+    global _enabled_cache_dir
     if not config.CACHE_ENABLED:
         logger.info("FastF1 cache is disabled in config.")
         return True
 
     cache_path = config.CACHE_DIR
+    with _cache_lock:
+        if _enabled_cache_dir == cache_path:
+            return True
+        try:
+            if not cache_path.exists():
+                logger.info(f"Cache directory '{cache_path}' not found. Creating...")
+                cache_path.mkdir(parents=True, exist_ok=True)
+            else:
+                 logger.info(f"Using existing cache directory: {cache_path}")
+
+            logger.info(f"Attempting to enable cache at: {cache_path}")
+            ff1.Cache.enable_cache(str(cache_path)) # enable_cache expects string path
+            _enabled_cache_dir = cache_path
+            # Assume enable_cache provides necessary feedback or errors if it fails.
+            logger.info(f"FastF1 cache enabled using path: {cache_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to configure FastF1 cache at '{cache_path}': {e}", exc_info=True)
+            return False
+
+# Components that can be switched on or off in Session.load; results are always loaded
+LOADABLE_COMPONENTS = ('laps', 'telemetry', 'weather', 'messages')
+
+
+def required_load_config(analyses: Iterable[Callable]) -> Dict[str, bool]:
+    """
+    Computes the load configuration needed by a set of analysis functions.
+
+    Each analysis declares its components with `helpers.requires_components`;
+    the result is their union, so nothing is loaded that no analysis uses.
+
+    Args:
+        analyses: Analysis functions that will run on the session.
+
+    Returns:
+        A dict suitable for `load_session_data(load_config=...)`.
+    """
+    needed = set()
+    for analysis in analyses:
+        needed.update(getattr(analysis, 'required_components', LOADABLE_COMPONENTS))
+    return {component: component in needed for component in LOADABLE_COMPONENTS}
+
+
+def apply_compact_schema(session: ff1.core.Session) -> ff1.core.Session:
+    """Replaces the session's laps and results with compact-dtype copies and logs the memory saved."""
+    label = f"{session.event['EventName']} {session.name}"
     try:
-        if not cache_path.exists():
-            logger.info(f"Cache directory '{cache_path}' not found. Creating...")
-            cache_path.mkdir(parents=True, exist_ok=True)
-        else:
-             logger.info(f"Using existing cache directory: {cache_path}")
-
-        ff1.Cache.enable_cache(str(cache_path)) # enable_cache expects string path
-        logger.info(f"Attempting to enable cache at: {cache_path}")
-        ff1.Cache.enable_cache(str(cache_path)) # enable_cache expects string path
-        # Access the cache_dir attribute *after* enabling it
-        # Assume enable_cache provides necessary feedback or errors if it fails.
-        logger.info(f"FastF1 cache enabled using path: {cache_path}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to configure FastF1 cache at '{cache_path}': {e}", exc_info=True)
-        return False
+        laps = session.laps
+        compact_laps = compact_schema.compact_frame(laps, compact_schema.LAPS_SCHEMA)
+        logger.info(compact_schema.memory_report(f"{label} laps", laps, compact_laps))
+        session._laps = ff1.core.Laps(compact_laps, session=session)
+    except ff1.core.DataNotLoadedError:
+        pass # Laps were not requested
+    results = session.results
+    compact_results = compact_schema.compact_frame(results, compact_schema.RESULTS_SCHEMA)
+    logger.info(compact_schema.memory_report(f"{label} results", results, compact_results))
+    session._results = ff1.core.SessionResults(compact_results)
+    return session
+
 
-def load_session_data(year: int, event: Union[str, int], session_type: str) -> Optional[ff1.core.Session]:
+def load_session_data(year: int, event: Union[str, int], session_type: str,
+                      load_config: Optional[Dict[str, bool]] = None) -> Optional[ff1.core.Session]:
     """
     Loads FastF1 session data with specified loading configuration.
 
+    When the parsed-session store is enabled and covers the requested
+    components, a stored copy of the laps and results is returned without
+    going through FastF1; otherwise the session is loaded and then stored.
+
     Args:
         year: Championship year.
         event: Event identifier (Name, City, or Round Number).
         session_type: Session identifier (e.g., 'R', 'Q', 'FP1').
+        load_config: Components to load (see `required_load_config`). Defaults to config.LOAD_CONFIG.
 
     Returns:
         A loaded FastF1 Session object, or None if loading fails.
     """
+    start = time.perf_counter()
+    session = _load_session_data(year, event, session_type, load_config)
+    metrics.observe('session_load_seconds', time.perf_counter() - start,
+                    result='ok' if session is not None else 'failed')
+    if session is not None:
+        for frame_name in ('laps', 'results'):
+            try:
+                metrics.inc('session_rows_loaded_total', len(getattr(session, frame_name)), frame=frame_name)
+            except (ff1.core.DataNotLoadedError, TypeError):
+                pass # Component not loaded in this run
+    return session
+
+
+def _load_session_data(year: int, event: Union[str, int], session_type: str,
+                       load_config: Optional[Dict[str, bool]]) -> Optional[ff1.core.Session]:
+    load_config = dict(config.LOAD_CONFIG if load_config is None else load_config)
     logger.info(f"Attempting to load data for: {year} {event} - {session_type}")
     session: Optional[ff1.Session] = None
 
@@ -62,21 +139,40 @@ def load_session_data(year: int, event: Union[str, int], session_type: str) -> O
         # Optionally, force disable cache if setup fails critically
         # ff1.Cache.disabled = True
 
+    use_store = session_store.is_enabled() and session_store.covers(load_config)
+    if use_store:
+        session = session_store.load_session(year, event, session_type)
+        metrics.inc('session_store_lookups_total', result='hit' if session is not None else 'miss')
+        if session is not None:
+            return apply_compact_schema(session) if config.COMPACT_DTYPES else session
+
     try:
         session = ff1.get_session(year, event, session_type)
         logger.info(f"Session object created for {session.event.year} {session.event['EventName']} - {session.name}")
 
-        # Load data based on config
-        logger.info(f"Loading data components: {config.LOAD_CONFIG}")
-        session.load(**config.LOAD_CONFIG) # verbose=False to reduce library output
+        # Load only the requested components
+        if load_config['telemetry'] and config.TELEMETRY_STORE_ENABLED and telemetry_store.exists(session):
+            # Telemetry is read from the memory-mapped store instead (telemetry_store.open_session)
+            logger.info("Telemetry store found; skipping FastF1 telemetry loading.")
+            load_config['telemetry'] = False
+        logger.info(f"Loading data components: {load_config}")
+        session.load(**load_config) # verbose=False to reduce library output
+
+        if load_config['telemetry'] and config.TELEMETRY_STORE_ENABLED:
+            # Write each driver's telemetry once, then free the in-memory copy
+            telemetry_store.write_session(session, release=True)
 
         # Basic validation after load
-        if config.LOAD_CONFIG['laps'] and (not hasattr(session, 'laps') or session.laps is None or session.laps.empty):
+        if load_config['laps'] and (not hasattr(session, 'laps') or session.laps is None or session.laps.empty):
              logger.warning("Laps data was requested but seems unavailable or empty after loading.")
         #if config.LOAD_CONFIG['results'] and (not hasattr(session, 'results') or session.results is None or session.results.empty):
         #    logger.warning("Results data was requested but seems unavailable or empty after loading.")
 
         logger.info(f"Data loaded successfully for {session.event['EventName']} {session.name}")
+        if use_store and load_config['laps']:
+            session_store.save_session(session, year, event, session_type)
+        if config.COMPACT_DTYPES:
+            session = apply_compact_schema(session)
         return session
 
     except ErgastError as e:
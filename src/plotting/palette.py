@@ -0,0 +1,156 @@
+# f1_analysis_dashboard/src/plotting/palette.py
+import fastf1 as ff1
+import fastf1.plotting
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_COLOR: str = '#808080' # Grey for drivers/teams FastF1 cannot resolve
+_NOT_FOUND_COLORS = (None, '#ffffff') # White often means not found
+
+# Pirelli compound colors; fixed, so they need no session (unlike FastF1's lookup)
+COMPOUND_COLORS: Dict[str, str] = {
+    'SOFT': '#da291c', 'MEDIUM': '#ffd12e', 'HARD': '#f0f0ec',
+    'INTERMEDIATE': '#43b02a', 'WET': '#0067ad',
+}
+
+# Palettes are tiny, but keep the cache bounded for long batch runs
+MAX_CACHED_PALETTES: int = 256
+
+_palettes: 'OrderedDict[Hashable, SessionPalette]' = OrderedDict()
+_lock = threading.Lock()
+
+
+class SessionPalette:
+    """
+    Driver and team colors of one session, resolved once.
+
+    All driver colors and the colors of every team in the session are looked
+    up in a single batch when the palette is built. Names that are not part
+    of that batch (e.g. a differently spelled team name) are resolved on first
+    use and memoized. Only a weak reference to the session is kept, so cached
+    palettes never keep session data alive.
+    """
+
+    def __init__(self, session: ff1.core.Session, colors: Optional[Dict[str, Dict[str, Optional[str]]]] = None):
+        self.bind(session)
+        self._driver_colors: Dict[str, Optional[str]] = {}
+        self._team_colors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if colors is not None: # Previously resolved colors (see colors()); no lookups
+            self._driver_colors.update(colors.get('drivers', {}))
+            self._team_colors.update(colors.get('teams', {}))
+            return
+        try:
+            self._driver_colors.update(fastf1.plotting.get_driver_color_mapping(session))
+            for team in fastf1.plotting.list_team_names(session):
+                self._team_colors[team] = fastf1.plotting.get_team_color(team, session=session, exact_match=True)
+        except Exception as e: # Driver list unavailable; fall back to per-name lookups
+            logger.warning(f"Could not resolve session colors in one batch: {e}")
+
+    def bind(self, session: ff1.core.Session):
+        """Uses `session` for later per-name lookups (e.g. a reloaded copy of the same session)."""
+        self._session_ref = weakref.ref(session) if session is not None else None
+
+    def _lookup(self, getter, identifier: str) -> Optional[str]:
+        session = self._session_ref() if self._session_ref is not None else None
+        if session is None and self._session_ref is not None:
+            return None # Session released; unresolved names stay grey
+        try:
+            return getter(identifier, session=session)
+        except Exception as e:
+            logger.debug(f"No color found for '{identifier}': {e}")
+            return None
+
+    def colors(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Copy of every color resolved so far, e.g. to rebuild the palette without a session."""
+        with self._lock:
+            return {'drivers': dict(self._driver_colors), 'teams': dict(self._team_colors)}
+
+    def team_color(self, team: str) -> str:
+        """Team color, defaulting to grey if not found."""
+        with self._lock:
+            if team not in self._team_colors:
+                self._team_colors[team] = self._lookup(fastf1.plotting.get_team_color, team) or FALLBACK_COLOR
+            return self._team_colors[team]
+
+    def driver_color(self, driver: str, team: str = 'N/A') -> str:
+        """Driver color, falling back to the team color and then grey."""
+        with self._lock:
+            if driver not in self._driver_colors:
+                self._driver_colors[driver] = self._lookup(fastf1.plotting.get_driver_color, driver)
+            color = self._driver_colors[driver]
+        if color in _NOT_FOUND_COLORS:
+            color = self.team_color(team)
+        return color
+
+
+def compound_color(compound: str) -> str:
+    """Tyre compound color, defaulting to grey for unknown compounds."""
+    return COMPOUND_COLORS.get(str(compound).upper(), FALLBACK_COLOR)
+
+
+def _palette_key(session: ff1.core.Session) -> Optional[Hashable]:
+    """Cache key (year, event, session), or None if the session has no event information."""
+    try:
+        return (int(session.event.year), str(session.event['EventName']), str(session.name))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _info_key(session_info: Optional[Dict[str, Any]]) -> Optional[Hashable]:
+    """The palette key of a session_info dict ('Year', 'EventName', 'SessionName')."""
+    try:
+        return (int(session_info['Year']), str(session_info['EventName']), str(session_info['SessionName']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def get_palette(session: Optional[ff1.core.Session],
+                session_info: Optional[Dict[str, Any]] = None) -> SessionPalette:
+    """
+    Returns the cached color palette of a session, building it on first use.
+
+    Palettes are shared by all plot functions and keyed by (year, event,
+    session), so a batch run resolves each session's colors only once.
+    Without a session (results served from the result cache), the palette is
+    found by `session_info` instead.
+    """
+    key = _palette_key(session) or _info_key(session_info)
+    if key is None:
+        return SessionPalette(session) # Cannot be identified, so not cached
+    with _lock:
+        palette = _palettes.get(key)
+        if palette is not None:
+            _palettes.move_to_end(key)
+            palette.bind(session)
+            return palette
+    palette = SessionPalette(session) # Built outside the lock; may look up the driver list
+    with _lock:
+        palette = _palettes.setdefault(key, palette)
+        _palettes.move_to_end(key)
+        while len(_palettes) > MAX_CACHED_PALETTES:
+            _palettes.popitem(last=False)
+    return palette
+
+
+def restore(session_info: Dict[str, Any], colors: Dict[str, Dict[str, Optional[str]]]):
+    """Caches a palette with previously resolved colors for the session described by `session_info`."""
+    key = _info_key(session_info)
+    if key is None:
+        return
+    with _lock:
+        _palettes[key] = SessionPalette(None, colors)
+        _palettes.move_to_end(key)
+        while len(_palettes) > MAX_CACHED_PALETTES:
+            _palettes.popitem(last=False)
+
+
+def clear_cache():
+    """Drops all cached palettes."""
+    with _lock:
+        _palettes.clear()
@@ -1,13 +1,23 @@
 # f1_analysis_dashboard/src/plotting/plot_generator.py
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+import seaborn as sns
 import fastf1 as ff1
 import fastf1.plotting
+import hashlib
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Callable, Optional, Union, Dict, Any
 
-from f1_analysis_dashboard.src.utils import formatting
+from f1_analysis_dashboard.src.analysis import telemetry_analysis
+from f1_analysis_dashboard.src.utils import formatting, metrics
+from f1_analysis_dashboard.src.plotting import palette, render_pool
 from f1_analysis_dashboard import config
 
 logger = logging.getLogger(__name__)
@@ -34,11 +44,11 @@ def setup_plotting_style():
         logger.error(f"Could not set up FastF1 plotting styles: {e}. Using default matplotlib styles.", exc_info=True)
 
 
-def _save_plot(fig: plt.Figure, filename: Union[str, Path]):
-    """Helper function to save a matplotlib figure."""
+def _save_plot(fig: plt.Figure, filename: Union[str, Path]) -> bool:
+    """Helper function to save a matplotlib figure. Returns True if the file was written."""
     if not config.PLOT_SAVE:
         logger.debug(f"Plot saving disabled. Skipping save for '{filename}'.")
-        return
+        return False
 
     try:
         # Ensure output directory exists
@@ -50,19 +60,397 @@ def _save_plot(fig: plt.Figure, filename: Union[str, Path]):
         # Check if figure has axes with data before saving
         if not fig.get_axes() or all(not ax.has_data() for ax in fig.get_axes()):
              logger.warning(f"Attempted to save plot '{full_path}' but it appears empty. Skipping.")
-             return
+             return False
 
         # Add a background color to ensure non-transparent saving if needed
         # fig.patch.set_facecolor('white') # Optional: forces white background
 
         fig.savefig(full_path, dpi=config.PLOT_DPI, bbox_inches='tight')
         logger.info(f"Plot saved successfully: {full_path}")
+        return True
 
     except Exception as e:
         logger.error(f"Failed to save plot '{filename}': {e}", exc_info=True)
+        return False
 
 
-def plot_constructor_pace_deltas(pace_data: pd.Series, session_info: Dict[str, Any], session: ff1.core.Session):
+# --- Plot Hashes ---
+# Each saved plot gets a sidecar file holding the hash of the payload and plot
+# settings it was rendered from. A plot whose hash is unchanged and whose image
+# still exists is not rendered again (unless config.PLOT_FORCE_REPLOT is set).
+
+# Bump when a renderer's output changes for the same payload
+RENDERER_VERSION: int = 1
+_HASH_DIR = '.plot_hashes'
+
+
+def _plot_path(filename: str) -> Path:
+    return Path(config.OUTPUT_DIR) / f"{filename}.{config.PLOT_FORMAT}"
+
+
+def _hash_path(filename: str) -> Path:
+    return Path(config.OUTPUT_DIR) / _HASH_DIR / f"{filename}.{config.PLOT_FORMAT}.sha256"
+
+
+def payload_hash(kind: str, payload: Dict[str, Any]) -> str:
+    """Hash of a plot job and the settings that affect its saved image."""
+    content = {
+        'kind': kind,
+        'renderer_version': RENDERER_VERSION,
+        'payload': payload,
+        'dpi': config.PLOT_DPI,
+        'format': config.PLOT_FORMAT,
+        'color_scheme': config.COLOR_SCHEME,
+    }
+    encoded = json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _is_up_to_date(filename: str, digest: str) -> bool:
+    """True if the saved plot exists and was rendered from the same hash."""
+    if config.PLOT_FORCE_REPLOT or not config.PLOT_SAVE or config.PLOT_SHOW:
+        return False
+    try:
+        return _plot_path(filename).exists() and _hash_path(filename).read_text().strip() == digest
+    except OSError:
+        return False
+
+
+def _record_hash(filename: str, digest: str):
+    """Writes the sidecar hash of a freshly saved plot."""
+    hash_path = _hash_path(filename)
+    try:
+        hash_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = hash_path.with_name(hash_path.name + f'.{os.getpid()}.tmp')
+        tmp_path.write_text(digest)
+        os.replace(tmp_path, hash_path)
+    except OSError as e:
+        logger.warning(f"Could not record plot hash '{hash_path}': {e}")
+
+
+def _plot_filename(session_info: Dict[str, Any], analysis_type: str) -> str:
+    return f"{session_info.get('Year', 'YYYY')}_{session_info.get('EventName', 'Event').replace(' ', '')}_{session_info.get('SessionName', 'Session')}_{analysis_type}"
+
+
+def _plot_title(session_info: Dict[str, Any], subtitle: str) -> str:
+    return f"{session_info.get('EventName', 'Event')} {session_info.get('SessionName', 'Session')} ({session_info.get('Year', '')})\n{subtitle}"
+
+
+def _finish_figure(fig: plt.Figure, filename: str) -> bool:
+    """Saves the figure and either shows or closes it. Returns True if it was saved."""
+    saved = _save_plot(fig, filename)
+
+    if config.PLOT_SHOW:
+        plt.show()
+    else:
+        plt.close(fig)
+    return saved
+
+
+def _add_delta_labels(ax: plt.Axes, bars):
+    """Adds '+x.xxxs' labels to horizontal delta bars."""
+    for bar in bars:
+        width = bar.get_width()
+        # Format delta time - handle potential floating point inaccuracies near zero
+        label = f"+{width:.3f}s" if width > 0.0001 else "0.000s"
+        ax.text(width + 0.01, bar.get_y() + bar.get_height()/2., # Adjust text position slightly
+                 label, va='center', ha='left', fontsize=8)
+
+
+# --- Renderers ---
+# Each renderer draws and saves one figure from a plain-data payload (lists,
+# floats and strings). They never touch the FastF1 session, so they can run
+# in a headless render_pool worker process as well as inline.
+
+def _render_constructor_pace_deltas(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    bars = ax.barh(payload['teams'], payload['deltas'], color=payload['colors']) # Plot Deltas
+
+    ax.set_xlabel("Median Lap Time Delta to Fastest (seconds)") # Update Label
+    ax.set_ylabel("Constructor")
+    ax.set_title(payload['title'])
+    ax.invert_yaxis()  # Fastest (0.0 delta) at the top
+    _add_delta_labels(ax, bars)
+
+    plt.tight_layout()
+    plt.subplots_adjust(left=0.25) # Adjust for long team names
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_driver_fastest_lap_deltas(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(10, max(6, len(payload['drivers']) * 0.35))) # Adjust height
+
+    bars = ax.barh(payload['drivers'], payload['deltas'], color=payload['colors']) # Plot Deltas
+
+    ax.set_xlabel("Fastest Lap Delta to Overall Fastest (seconds)") # Update Label
+    ax.set_ylabel("Driver")
+    ax.set_title(payload['title'])
+    ax.invert_yaxis() # Fastest (0.0 delta) at the top
+    _add_delta_labels(ax, bars)
+
+    plt.tight_layout()
+    plt.subplots_adjust(left=0.18) # Adjust for driver names
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_driver_pace_distribution(payload: Dict[str, Any]) -> bool:
+    laps_df = pd.DataFrame({config.COL_DRIVER: payload['drivers'],
+                            config.COL_LAP_TIME_SECONDS: payload['lap_seconds']})
+    fig, ax = plt.subplots(figsize=(14, 7)) # Wider figure for many drivers
+
+    sns.violinplot(data=laps_df,
+                   x=config.COL_DRIVER,
+                   y=config.COL_LAP_TIME_SECONDS,
+                   order=payload['driver_order'], # Order drivers by median pace
+                   palette=payload['palette'], # Use mapped driver/team colors
+                   inner='box', # Show boxplot inside violins (can use 'quartile', 'point', None)
+                   ax=ax)
+
+    ax.set_xlabel("Driver")
+    ax.set_ylabel("Race Lap Time (seconds)")
+    ax.set_title(payload['title'])
+
+    # Improve readability
+    ax.tick_params(axis='x', rotation=70) # Rotate driver names if needed
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+
+    plt.tight_layout()
+    plt.subplots_adjust(bottom=0.15) # Adjust for rotated labels
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_tyre_degradation(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(10, max(6, len(payload['labels']) * 0.28)))
+
+    bars = ax.barh(payload['labels'], payload['rates'], color=payload['colors'],
+                   edgecolor='#404040', linewidth=0.5) # Edge keeps white (hard) bars visible
+    for bar, rate in zip(bars, payload['rates']):
+        ax.text(bar.get_width() + 0.002 if rate >= 0 else 0.002, bar.get_y() + bar.get_height()/2.,
+                f"{rate:+.3f}s", va='center', ha='left', fontsize=7)
+    handles = [Patch(facecolor=color, edgecolor='#404040', label=compound)
+               for compound, color in payload['legend'].items()]
+    ax.legend(handles=handles, title="Compound", loc='upper left', bbox_to_anchor=(1.01, 1.0))
+
+    ax.axvline(0, color='grey', linewidth=0.8)
+    ax.set_xlabel("Degradation (seconds per lap of tyre life)")
+    ax.set_ylabel("Driver / Stint")
+    ax.set_title(payload['title'])
+    ax.invert_yaxis() # Lowest degradation of the first compound at the top
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_telemetry_comparison(payload: Dict[str, Any]) -> bool:
+    fig, axes = plt.subplots(3, 1, figsize=(14, 9), sharex=True, gridspec_kw={'height_ratios': [3, 1.5, 1]})
+    distance = payload['distance']
+
+    for trace in payload['traces']:
+        for ax, channel in zip(axes, ('speed', 'throttle', 'brake')):
+            ax.plot(distance, trace[channel], color=trace['color'], linewidth=1.0, label=trace['label'])
+
+    axes[0].set_ylabel("Speed (km/h)")
+    axes[1].set_ylabel("Throttle (%)")
+    axes[2].set_ylabel("Brake")
+    axes[2].set_xlabel("Distance (m)")
+    axes[0].legend(loc='lower right', fontsize=8, ncol=len(payload['traces']))
+    axes[0].set_title(payload['title'])
+    for ax in axes:
+        ax.grid(linestyle='--', alpha=0.5)
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_minisector_dominance(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(10, 8) if payload['track'] else (14, 3))
+    sectors = payload['sectors']
+    if payload['track']: # Track map colored by the fastest driver of each mini-sector
+        x, y = payload['track']['x'], payload['track']['y']
+        for sector in sectors:
+            points = list(zip(x[sector['start']:sector['stop'] + 1], y[sector['start']:sector['stop'] + 1]))
+            segments = [points[i:i + 2] for i in range(len(points) - 1)]
+            ax.add_collection(LineCollection(segments, colors=sector['color'], linewidths=5))
+        ax.plot(x, y, color='grey', linewidth=0.5, alpha=0.5) # Makes the axes span the track
+        ax.set_aspect('equal')
+        ax.axis('off')
+    else: # No position data: mini-sectors along the distance axis
+        for sector in sectors:
+            ax.axvspan(sector['start_distance'], sector['end_distance'], color=sector['color'])
+        ax.plot([sectors[0]['start_distance'], sectors[-1]['end_distance']], [0.5, 0.5], alpha=0) # Data for saving
+        ax.set_yticks([])
+        ax.set_xlabel("Distance (m)")
+
+    handles = [Patch(facecolor=color, label=driver) for driver, color in payload['legend'].items()]
+    ax.legend(handles=handles, title="Fastest", loc='upper left', bbox_to_anchor=(1.01, 1.0))
+    ax.set_title(payload['title'])
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_gap_to_leader(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for driver in payload['drivers']:
+        ax.plot(payload['laps'], driver['values'], color=driver['color'], linewidth=1.2, label=driver['label'])
+
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Gap to Leader (seconds)")
+    ax.set_title(payload['title'])
+    ax.invert_yaxis() # Leader at the top
+    ax.grid(linestyle='--', alpha=0.5)
+    ax.legend(loc='upper left', bbox_to_anchor=(1.01, 1.0), fontsize=8)
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_interval_heatmap(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(14, max(5, len(payload['drivers']) * 0.35)))
+
+    image = ax.imshow(payload['intervals'], aspect='auto', cmap='RdYlGn', interpolation='nearest',
+                      vmin=0.0, vmax=payload['max_interval'],
+                      extent=(payload['laps'][0] - 0.5, payload['laps'][-1] + 0.5, len(payload['drivers']) - 0.5, -0.5))
+    ax.set_yticks(range(len(payload['drivers'])))
+    ax.set_yticklabels(payload['drivers'])
+    fig.colorbar(image, ax=ax, label=f"Interval to Car Ahead (seconds, capped at {payload['max_interval']:g})")
+
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Driver (finishing order)")
+    ax.set_title(payload['title'])
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_position_per_lap(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(14, 8))
+
+    for driver in payload['drivers']:
+        ax.plot(payload['laps'], driver['values'], color=driver['color'], linewidth=1.5)
+        last = max((i for i, value in enumerate(driver['values']) if value == value), default=None) # Skip NaN
+        if last is not None:
+            ax.text(payload['laps'][last] + 0.5, driver['values'][last], driver['label'],
+                    va='center', fontsize=8, color=driver['color'])
+
+    n_positions = len(payload['drivers'])
+    ax.set_yticks(range(1, n_positions + 1))
+    ax.set_ylim(n_positions + 0.5, 0.5) # P1 at the top
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Position")
+    ax.set_title(payload['title'])
+    ax.grid(axis='x', linestyle='--', alpha=0.5)
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+def _render_bump_chart(payload: Dict[str, Any]) -> bool:
+    fig, ax = plt.subplots(figsize=(16, 9))
+    laps = payload['laps']
+
+    for driver in payload['drivers']:
+        positions = driver['values']
+        ax.plot(laps, positions, color=driver['color'], linewidth=2.0, alpha=0.85)
+        lap_index = {lap: i for i, lap in enumerate(laps)}
+        for key, marker, fill in (('on_track_laps', '^', driver['color']), ('pit_cycle_laps', 'o', 'none')):
+            marked = [lap_index[lap] for lap in driver[key]]
+            ax.scatter([laps[i] for i in marked], [positions[i] for i in marked], marker=marker, s=40,
+                       facecolors=fill, edgecolors=driver['color'], zorder=3)
+        completed = [i for i, value in enumerate(positions) if value == value] # Skip NaN
+        if completed:
+            ax.text(laps[completed[0]] - 0.7, positions[completed[0]], driver['label'],
+                    ha='right', va='center', fontsize=8, color=driver['color'])
+            ax.text(laps[completed[-1]] + 0.7, positions[completed[-1]], driver['label'],
+                    ha='left', va='center', fontsize=8, color=driver['color'])
+
+    n_positions = len(payload['drivers'])
+    ax.set_yticks(range(1, n_positions + 1))
+    ax.set_ylim(n_positions + 0.5, 0.5) # P1 at the top
+    ax.set_xlim(laps[0] - 3, laps[-1] + 3) # Room for the labels
+    ax.set_xlabel("Lap")
+    ax.set_ylabel("Position")
+    ax.set_title(payload['title'])
+    ax.grid(axis='x', linestyle='--', alpha=0.4)
+    ax.legend(handles=[Line2D([], [], color='grey', marker='^', linestyle='', label='On-track pass'),
+                       Line2D([], [], color='grey', marker='o', markerfacecolor='none', linestyle='',
+                              label='Pit-cycle gain')],
+              loc='upper left', bbox_to_anchor=(1.01, 1.0))
+
+    plt.tight_layout()
+    return _finish_figure(fig, payload['filename'])
+
+
+_RENDERERS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    'constructor_pace_deltas': _render_constructor_pace_deltas,
+    'driver_fastest_lap_deltas': _render_driver_fastest_lap_deltas,
+    'driver_pace_distribution': _render_driver_pace_distribution,
+    'tyre_degradation': _render_tyre_degradation,
+    'telemetry_comparison': _render_telemetry_comparison,
+    'minisector_dominance': _render_minisector_dominance,
+    'gap_to_leader': _render_gap_to_leader,
+    'interval_heatmap': _render_interval_heatmap,
+    'position_per_lap': _render_position_per_lap,
+    'bump_chart': _render_bump_chart,
+}
+
+
+def render_payload(kind: str, payload: Dict[str, Any], digest: Optional[str] = None) -> bool:
+    """
+    Renders a plot job; entry point for render_pool workers.
+
+    Args:
+        kind: Renderer name (key of _RENDERERS).
+        payload: Plain-data plot inputs, including 'filename'.
+        digest: Hash to record next to the saved plot (see payload_hash).
+
+    Returns:
+        True if the plot was saved.
+    """
+    with metrics.timed('plot_render_seconds', plot=kind):
+        saved = _RENDERERS[kind](payload)
+    if saved:
+        try:
+            metrics.observe('plot_bytes', _plot_path(payload['filename']).stat().st_size,
+                            buckets=metrics.BYTES_BUCKETS, plot=kind)
+        except OSError:
+            pass
+        if digest:
+            _record_hash(payload['filename'], digest)
+    return saved
+
+
+def _dispatch(kind: str, payload: Dict[str, Any]) -> Optional[Path]:
+    """
+    Renders a plot job unless the saved plot is already up to date.
+
+    Jobs go to the render pool if one is running, otherwise they render inline.
+
+    Returns:
+        Path of the plot file, or None if it was not saved. Jobs handed to the
+        render pool are reported by path before the file is written.
+    """
+    digest = payload_hash(kind, payload)
+    if _is_up_to_date(payload['filename'], digest):
+        logger.info(f"Plot '{payload['filename']}' is unchanged. Skipping render.")
+        metrics.inc('plots_skipped_total', plot=kind)
+        return _plot_path(payload['filename'])
+    if render_pool.is_active():
+        render_pool.submit(kind, payload, digest, metrics.current_session())
+        return _plot_path(payload['filename'])
+    if render_payload(kind, payload, digest):
+        return _plot_path(payload['filename'])
+    return None
+
+
+# --- Public Plot Functions ---
+# These resolve everything that needs the session (colors, names) and hand a
+# plain-data payload to the renderer. Each returns the path of the plot file
+# (see _dispatch), or None if nothing was saved.
+
+def plot_constructor_pace_deltas(pace_data: pd.Series, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
     """
     Generates and saves a bar plot comparing constructor median race pace
     as deltas relative to the fastest constructor.
@@ -70,56 +458,36 @@ def plot_constructor_pace_deltas(pace_data: pd.Series, session_info: Dict[str, A
     Args:
         pace_data: Series with Team as index and median lap time (seconds) as values.
         session_info: Dict containing 'EventName', 'SessionName', 'Year'.
-        session: The FastF1 session object for context (e.g., colors).
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
     """
     if pace_data is None or pace_data.empty:
         logger.warning("No constructor pace data provided for plotting.")
-        return
+        return None
 
     logger.info("Generating constructor pace delta comparison plot...")
-    fig, ax = plt.subplots(figsize=(10, 6))
 
     pace_df = pace_data.reset_index()
     pace_df.columns = [config.COL_TEAM, config.COL_LAP_TIME_SECONDS] # Rename for clarity
 
     # --- Calculate Deltas ---
     min_pace = pace_df[config.COL_LAP_TIME_SECONDS].min()
-    pace_df['DeltaSeconds'] = pace_df[config.COL_LAP_TIME_SECONDS] - min_pace
+    deltas = pace_df[config.COL_LAP_TIME_SECONDS] - min_pace
     # ----------------------
 
     # Get team colors, defaulting to grey if not found
-    team_colors = [fastf1.plotting.get_team_color(team, session=session) or '#808080'
-                   for team in pace_df[config.COL_TEAM]]
-
-    bars = ax.barh(pace_df[config.COL_TEAM], pace_df['DeltaSeconds'], color=team_colors) # Plot Deltas
-
-    ax.set_xlabel("Median Lap Time Delta to Fastest (seconds)") # Update Label
-    ax.set_ylabel("Constructor")
-    title = f"{session_info.get('EventName', 'Event')} {session_info.get('SessionName', 'Session')} ({session_info.get('Year', '')})\nConstructor Median Race Pace Delta" # Update Title
-    ax.set_title(title)
-    ax.invert_yaxis()  # Fastest (0.0 delta) at the top
-
-    # Add labels to bars showing the delta
-    for bar in bars:
-        width = bar.get_width()
-        # Format delta time - handle potential floating point inaccuracies near zero
-        label = f"+{width:.3f}s" if width > 0.0001 else "0.000s"
-        ax.text(width + 0.01, bar.get_y() + bar.get_height()/2., # Adjust text position slightly
-                 label, va='center', ha='left', fontsize=8)
-
-    plt.tight_layout()
-    plt.subplots_adjust(left=0.25) # Adjust for long team names
+    session_palette = palette.get_palette(session, session_info)
+    team_colors = [session_palette.team_color(team) for team in pace_df[config.COL_TEAM]]
 
-    # Update filename
-    filename = f"{session_info.get('Year', 'YYYY')}_{session_info.get('EventName', 'Event').replace(' ', '')}_{session_info.get('SessionName', 'Session')}_ConstructorPaceDelta"
-    _save_plot(fig, filename)
+    return _dispatch('constructor_pace_deltas', {
+        'teams': [str(team) for team in pace_df[config.COL_TEAM]],
+        'deltas': deltas.astype(float).tolist(),
+        'colors': team_colors,
+        'title': _plot_title(session_info, "Constructor Median Race Pace Delta"),
+        'filename': _plot_filename(session_info, 'ConstructorPaceDelta'),
+    })
 
-    if config.PLOT_SHOW:
-        plt.show()
-    else:
-        plt.close(fig)
 
-def plot_driver_fastest_lap_deltas(fastest_laps_df: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session):
+def plot_driver_fastest_lap_deltas(fastest_laps_df: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
     """
     Generates and saves a bar plot comparing driver fastest laps
     as deltas relative to the overall fastest lap.
@@ -127,79 +495,52 @@ def plot_driver_fastest_lap_deltas(fastest_laps_df: pd.DataFrame, session_info:
     Args:
         fastest_laps_df: DataFrame containing fastest lap per driver.
         session_info: Dict containing 'EventName', 'SessionName', 'Year'.
-        session: The FastF1 session object for context (e.g., colors).
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
     """
     if fastest_laps_df is None or fastest_laps_df.empty:
         logger.warning("No driver fastest lap data provided for plotting.")
-        return
+        return None
 
     logger.info("Generating driver fastest lap delta comparison plot...")
-    fig, ax = plt.subplots(figsize=(10, max(6, len(fastest_laps_df) * 0.35))) # Adjust height
 
     # Ensure LapTime column exists
     if config.COL_LAP_TIME not in fastest_laps_df.columns:
          logger.error(f"Cannot plot driver laps: '{config.COL_LAP_TIME}' column missing.")
-         plt.close(fig)
-         return
+         return None
 
     # --- Calculate Deltas ---
     # Convert to seconds first if necessary
     if pd.api.types.is_timedelta64_dtype(fastest_laps_df[config.COL_LAP_TIME]):
-        fastest_laps_df['LapTimeSeconds'] = fastest_laps_df[config.COL_LAP_TIME].dt.total_seconds()
+        lap_seconds = fastest_laps_df[config.COL_LAP_TIME].dt.total_seconds()
     elif pd.api.types.is_numeric_dtype(fastest_laps_df[config.COL_LAP_TIME]):
-        fastest_laps_df['LapTimeSeconds'] = fastest_laps_df[config.COL_LAP_TIME] # Assume already seconds
+        lap_seconds = fastest_laps_df[config.COL_LAP_TIME] # Assume already seconds
     else:
          logger.error(f"Cannot calculate delta: '{config.COL_LAP_TIME}' is not numeric or timedelta.")
-         plt.close(fig)
-         return
+         return None
 
-    min_lap_time_sec = fastest_laps_df['LapTimeSeconds'].min()
-    fastest_laps_df['DeltaSeconds'] = fastest_laps_df['LapTimeSeconds'] - min_lap_time_sec
+    deltas = lap_seconds - lap_seconds.min()
     # ----------------------
 
     # Get driver colors
-    driver_colors = []
     team_col = config.COL_TEAM
     driver_col = config.COL_DRIVER # Assuming this holds abbreviation
 
     teams = fastest_laps_df[team_col] if team_col in fastest_laps_df else pd.Series(['N/A'] * len(fastest_laps_df))
-
-    for driver, team in zip(fastest_laps_df[driver_col], teams):
-        # Use session context for colors
-        color = fastf1.plotting.get_driver_color(driver, session=session)
-        if color is None or color == '#ffffff': # White often means not found
-             color = fastf1.plotting.get_team_color(team, session=session) or '#808080' # Fallback grey
-        driver_colors.append(color)
-
-    bars = ax.barh(fastest_laps_df[config.COL_DRIVER], fastest_laps_df['DeltaSeconds'], color=driver_colors) # Plot Deltas
-
-    ax.set_xlabel("Fastest Lap Delta to Overall Fastest (seconds)") # Update Label
-    ax.set_ylabel("Driver")
-    title = f"{session_info.get('EventName', 'Event')} {session_info.get('SessionName', 'Session')} ({session_info.get('Year', '')})\nDriver Fastest Lap Delta" # Update Title
-    ax.set_title(title)
-    ax.invert_yaxis() # Fastest (0.0 delta) at the top
-
-    # Add labels showing delta
-    for bar in bars:
-        width = bar.get_width()
-        label = f"+{width:.3f}s" if width > 0.0001 else "0.000s"
-        ax.text(width + 0.01, bar.get_y() + bar.get_height()/2., # Adjust text position
-                 label, va='center', ha='left', fontsize=8)
-
-    plt.tight_layout()
-    plt.subplots_adjust(left=0.18) # Adjust for driver names
-
-    # Update filename
-    filename = f"{session_info.get('Year', 'YYYY')}_{session_info.get('EventName', 'Event').replace(' ', '')}_{session_info.get('SessionName', 'Session')}_DriverFastestLapDelta"
-    _save_plot(fig, filename)
-
-    if config.PLOT_SHOW:
-        plt.show()
-    else:
-        plt.close(fig)
+    # Use the session's cached palette for colors
+    session_palette = palette.get_palette(session, session_info)
+    driver_colors = [session_palette.driver_color(driver, team)
+                     for driver, team in zip(fastest_laps_df[driver_col], teams)]
+
+    return _dispatch('driver_fastest_lap_deltas', {
+        'drivers': [str(driver) for driver in fastest_laps_df[driver_col]],
+        'deltas': deltas.astype(float).tolist(),
+        'colors': driver_colors,
+        'title': _plot_title(session_info, "Driver Fastest Lap Delta"),
+        'filename': _plot_filename(session_info, 'DriverFastestLapDelta'),
+    })
 
 # --- NEW FUNCTION for Violin Plot ---
-def plot_driver_pace_distribution(laps_df: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session):
+def plot_driver_pace_distribution(laps_df: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
     """
     Generates and saves a violin plot showing the distribution of lap times
     for each driver during a race session.
@@ -207,62 +548,261 @@ def plot_driver_pace_distribution(laps_df: pd.DataFrame, session_info: Dict[str,
     Args:
         laps_df: DataFrame containing cleaned lap data per driver (needs Driver, Team, LapTimeSeconds).
         session_info: Dict containing 'EventName', 'SessionName', 'Year'.
-        session: The FastF1 session object for context (e.g., colors).
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
     """
     if laps_df is None or laps_df.empty or config.COL_LAP_TIME_SECONDS not in laps_df.columns:
         logger.warning("No valid driver lap data provided for pace distribution plot.")
-        return
+        return None
 
     logger.info("Generating driver race pace distribution plot (violin)...")
 
     # --- Prepare data for plotting ---
     # Calculate median pace per driver to order the plot
-    median_pace = laps_df.groupby(config.COL_DRIVER)[config.COL_LAP_TIME_SECONDS].median()
+    median_pace = laps_df.groupby(config.COL_DRIVER, observed=True)[config.COL_LAP_TIME_SECONDS].median()
     # Sort drivers by median pace (fastest first)
-    driver_order = median_pace.sort_values().index.tolist()
+    driver_order = [str(driver) for driver in median_pace.sort_values().index]
 
     # Get driver colors
-    driver_colors_map = {}
     team_col = config.COL_TEAM
     driver_col = config.COL_DRIVER
 
     # Create a mapping from driver abbreviation to team (handle potential missing teams)
     driver_team_map = laps_df.set_index(driver_col)[team_col].to_dict() if team_col in laps_df else {}
+    session_palette = palette.get_palette(session, session_info)
+    driver_colors_map = {driver: session_palette.driver_color(driver, driver_team_map.get(driver, 'N/A'))
+                         for driver in driver_order}
 
-    for driver in driver_order:
-        team = driver_team_map.get(driver, 'N/A')
-        color = fastf1.plotting.get_driver_color(driver, session=session)
-        if color is None or color == '#ffffff': # White often means not found
-             color = fastf1.plotting.get_team_color(team, session=session) or '#808080' # Fallback grey
-        driver_colors_map[driver] = color
+    return _dispatch('driver_pace_distribution', {
+        'drivers': laps_df[driver_col].astype(str).tolist(),
+        'lap_seconds': laps_df[config.COL_LAP_TIME_SECONDS].astype(float).tolist(),
+        'driver_order': driver_order,
+        'palette': driver_colors_map,
+        'title': _plot_title(session_info, "Driver Race Pace Distribution"),
+        'filename': _plot_filename(session_info, 'DriverPaceDistribution'),
+    })
 
-    # --- Create Plot ---
-    fig, ax = plt.subplots(figsize=(14, 7)) # Wider figure for many drivers
 
-    sns.violinplot(data=laps_df,
-                   x=config.COL_DRIVER,
-                   y=config.COL_LAP_TIME_SECONDS,
-                   order=driver_order, # Order drivers by median pace
-                   palette=driver_colors_map, # Use mapped driver/team colors
-                   inner='box', # Show boxplot inside violins (can use 'quartile', 'point', None)
-                   ax=ax)
+def plot_tyre_degradation(degradation_df: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a bar plot of the degradation rate of every stint,
+    colored by tyre compound.
 
-    ax.set_xlabel("Driver")
-    ax.set_ylabel("Race Lap Time (seconds)")
-    title = f"{session_info.get('EventName', 'Event')} {session_info.get('SessionName', 'Session')} ({session_info.get('Year', '')})\nDriver Race Pace Distribution"
-    ax.set_title(title)
+    Args:
+        degradation_df: DataFrame from degradation_analysis.get_tyre_degradation.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context; unused, compound colors are fixed.
+    """
+    if degradation_df is None or degradation_df.empty:
+        logger.warning("No tyre degradation data provided for plotting.")
+        return None
 
-    # Improve readability
-    ax.tick_params(axis='x', rotation=70) # Rotate driver names if needed
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    logger.info("Generating tyre degradation plot...")
 
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.15) # Adjust for rotated labels
+    compounds = degradation_df[config.COL_COMPOUND].astype(str)
+    labels = [f"{driver} S{int(stint)}" for driver, stint in zip(degradation_df[config.COL_DRIVER], degradation_df['Stint'])]
 
-    filename = f"{session_info.get('Year', 'YYYY')}_{session_info.get('EventName', 'Event').replace(' ', '')}_{session_info.get('SessionName', 'Session')}_DriverPaceDistribution"
-    _save_plot(fig, filename)
+    return _dispatch('tyre_degradation', {
+        'labels': labels,
+        'rates': degradation_df['DegRate'].astype(float).tolist(),
+        'colors': [palette.compound_color(compound) for compound in compounds],
+        'legend': {compound: palette.compound_color(compound) for compound in compounds.unique()},
+        'title': _plot_title(session_info, "Tyre Degradation per Stint"),
+        'filename': _plot_filename(session_info, 'TyreDegradation'),
+    })
 
-    if config.PLOT_SHOW:
-        plt.show()
-    else:
-        plt.close(fig)
\ No newline at end of file
+
+def plot_telemetry_comparison(traces: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves speed, throttle and brake traces of the fastest
+    drivers' fastest laps over the shared distance axis.
+
+    Args:
+        traces: DataFrame from telemetry_analysis.get_fastest_lap_telemetry.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
+    """
+    if traces is None or traces.empty:
+        logger.warning("No telemetry traces provided for plotting.")
+        return None
+
+    logger.info("Generating fastest lap telemetry comparison plot...")
+
+    n_points = int((traces[config.COL_DRIVER] == traces[config.COL_DRIVER].iloc[0]).sum())
+    shown = traces.iloc[:config.TELEMETRY_PLOT_DRIVERS * n_points] # Drivers are ordered fastest first
+    session_palette = palette.get_palette(session, session_info)
+    plot_traces = []
+    for driver, driver_trace in shown.groupby(config.COL_DRIVER, sort=False):
+        plot_traces.append({
+            'label': f"{driver} (L{int(driver_trace[config.COL_LAP_NUMBER].iloc[0])})",
+            'color': session_palette.driver_color(driver, driver_trace[config.COL_TEAM].iloc[0]),
+            'speed': driver_trace['Speed'].round(1).tolist(),
+            'throttle': driver_trace['Throttle'].round(1).tolist(),
+            'brake': driver_trace['Brake'].round(2).tolist(),
+        })
+
+    return _dispatch('telemetry_comparison', {
+        'distance': traces['Distance'].iloc[:n_points].round(1).tolist(),
+        'traces': plot_traces,
+        'title': _plot_title(session_info, "Fastest Lap Telemetry"),
+        'filename': _plot_filename(session_info, 'TelemetryComparison'),
+    })
+
+
+def plot_minisector_dominance(traces: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a track map colored by the fastest driver in each
+    mini-sector (along the distance axis if position data is missing).
+
+    Args:
+        traces: DataFrame from telemetry_analysis.get_fastest_lap_telemetry.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
+    """
+    dominance = telemetry_analysis.minisector_dominance(traces)
+    if dominance is None or dominance.empty:
+        logger.warning("No mini-sector dominance data provided for plotting.")
+        return None
+
+    logger.info("Generating mini-sector dominance plot...")
+
+    session_palette = palette.get_palette(session, session_info)
+    colors = {driver: session_palette.driver_color(driver, team)
+              for driver, team in zip(dominance[config.COL_DRIVER], dominance[config.COL_TEAM])}
+
+    # The fastest lap's positions serve as the track outline
+    reference = traces[traces[config.COL_DRIVER] == traces[config.COL_DRIVER].iloc[0]]
+    distance = reference['Distance'].to_numpy()
+    track = None
+    if reference[['X', 'Y']].notna().all().all():
+        track = {'x': reference['X'].round(1).tolist(), 'y': reference['Y'].round(1).tolist()}
+    starts = np.searchsorted(distance, dominance['StartDistance'].to_numpy())
+    stops = np.searchsorted(distance, dominance['EndDistance'].to_numpy())
+
+    return _dispatch('minisector_dominance', {
+        'track': track,
+        'sectors': [{'start': int(start), 'stop': int(stop), 'start_distance': float(start_distance),
+                     'end_distance': float(end_distance), 'color': colors[driver]}
+                    for start, stop, start_distance, end_distance, driver
+                    in zip(starts, stops, dominance['StartDistance'], dominance['EndDistance'], dominance[config.COL_DRIVER])],
+        'legend': {str(driver): colors[driver] for driver in dominance[config.COL_DRIVER].unique()},
+        'title': _plot_title(session_info, "Mini-Sector Dominance (Fastest Laps)"),
+        'filename': _plot_filename(session_info, 'MiniSectorDominance'),
+    })
+
+
+def _race_trace_matrix(race_trace: pd.DataFrame, column: str) -> pd.DataFrame:
+    """A race-trace column as drivers x laps, drivers in finishing order (running order on their last lap)."""
+    matrix = race_trace.pivot(index=config.COL_DRIVER, columns=config.COL_LAP_NUMBER, values=column)
+    last = race_trace.sort_values(config.COL_LAP_NUMBER, kind='stable').groupby(config.COL_DRIVER).last()
+    finishing_order = last.sort_values([config.COL_LAP_NUMBER, config.COL_POSITION], ascending=[False, True]).index
+    return matrix.loc[finishing_order]
+
+
+def _driver_lines(race_trace: pd.DataFrame, column: str, session_info: Dict[str, Any],
+                  session: ff1.core.Session) -> Dict[str, Any]:
+    """Per-driver line payloads of a race-trace column (NaN where a lap was not completed)."""
+    matrix = _race_trace_matrix(race_trace, column)
+    teams = race_trace.groupby(config.COL_DRIVER)[config.COL_TEAM].first()
+    session_palette = palette.get_palette(session, session_info)
+    return {
+        'laps': [int(lap) for lap in matrix.columns],
+        'drivers': [{'label': str(driver), 'color': session_palette.driver_color(driver, teams.get(driver, 'N/A')),
+                     'values': matrix.loc[driver].astype(float).round(3).tolist()}
+                    for driver in matrix.index],
+    }
+
+
+def plot_gap_to_leader(race_trace: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a line plot of every driver's gap to the leader by lap.
+
+    Args:
+        race_trace: DataFrame from race_trace_analysis.get_race_trace.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
+    """
+    if race_trace is None or race_trace.empty:
+        logger.warning("No race trace data provided for plotting.")
+        return None
+
+    logger.info("Generating gap to leader plot...")
+    return _dispatch('gap_to_leader', {
+        **_driver_lines(race_trace, 'GapToLeader', session_info, session),
+        'title': _plot_title(session_info, "Gap to Leader"),
+        'filename': _plot_filename(session_info, 'GapToLeader'),
+    })
+
+
+def plot_interval_heatmap(race_trace: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a drivers x laps heatmap of the interval to the car ahead.
+
+    Args:
+        race_trace: DataFrame from race_trace_analysis.get_race_trace.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context; unused.
+    """
+    if race_trace is None or race_trace.empty:
+        logger.warning("No race trace data provided for plotting.")
+        return None
+
+    logger.info("Generating interval heatmap...")
+    matrix = _race_trace_matrix(race_trace, 'Interval')
+    return _dispatch('interval_heatmap', {
+        'laps': [int(lap) for lap in matrix.columns],
+        'drivers': [str(driver) for driver in matrix.index],
+        'intervals': matrix.astype(float).round(3).to_numpy().tolist(),
+        'max_interval': 5.0, # Beyond ~5s the car ahead has no effect; keeps the scale readable
+        'title': _plot_title(session_info, "Interval to Car Ahead"),
+        'filename': _plot_filename(session_info, 'IntervalHeatmap'),
+    })
+
+
+def plot_position_per_lap(race_trace: pd.DataFrame, session_info: Dict[str, Any], session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a line plot of every driver's running position by lap.
+
+    Args:
+        race_trace: DataFrame from race_trace_analysis.get_race_trace.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
+    """
+    if race_trace is None or race_trace.empty:
+        logger.warning("No race trace data provided for plotting.")
+        return None
+
+    logger.info("Generating position per lap plot...")
+    return _dispatch('position_per_lap', {
+        **_driver_lines(race_trace, config.COL_POSITION, session_info, session),
+        'title': _plot_title(session_info, "Position per Lap"),
+        'filename': _plot_filename(session_info, 'PositionPerLap'),
+    })
+
+
+def plot_position_changes(position_changes: pd.DataFrame, session_info: Dict[str, Any],
+                          session: ff1.core.Session) -> Optional[Path]:
+    """
+    Generates and saves a bump chart of running positions, marking on-track passes and pit-cycle gains.
+
+    Args:
+        position_changes: DataFrame from position_analysis.get_position_changes.
+        session_info: Dict containing 'EventName', 'SessionName', 'Year'.
+        session: The FastF1 session object for context (e.g., colors); None for cached results.
+    """
+    if position_changes is None or position_changes.empty:
+        logger.warning("No position change data provided for plotting.")
+        return None
+
+    logger.info("Generating position change bump chart...")
+    payload = _driver_lines(position_changes, config.COL_POSITION, session_info, session)
+    gained_laps = {key: position_changes[position_changes[column] > 0].groupby(config.COL_DRIVER)[config.COL_LAP_NUMBER]
+                   .agg(lambda laps: [int(lap) for lap in laps])
+                   for key, column in (('on_track_laps', 'OnTrackGained'), ('pit_cycle_laps', 'PitCycleGained'))}
+    for driver in payload['drivers']:
+        for key, laps in gained_laps.items():
+            driver[key] = laps.get(driver['label'], [])
+    return _dispatch('bump_chart', {
+        **payload,
+        'title': _plot_title(session_info, "Position Changes"),
+        'filename': _plot_filename(session_info, 'PositionChanges'),
+    })
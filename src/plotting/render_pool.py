@@ -0,0 +1,119 @@
+# f1_analysis_dashboard/src/plotting/render_pool.py
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# Module-level pool shared by all plot functions of this process; None renders inline
+_pool: Optional[ProcessPoolExecutor] = None
+_pending: List[Future] = []
+
+
+# --- Worker Process ---
+def _init_worker(plot_settings: Dict[str, Any]):
+    """Configures a render worker once: headless backend, plot settings and style."""
+    import matplotlib
+    matplotlib.use('Agg') # Workers never show plots
+    from f1_analysis_dashboard.src.plotting import plot_generator
+
+    for name, value in plot_settings.items():
+        setattr(config, name, value)
+    config.PLOT_SHOW = False
+    plot_generator.setup_plotting_style()
+
+
+def _render_job(kind: str, payload: Dict[str, Any], digest: Optional[str],
+                session: Optional[str]) -> Dict[str, Any]:
+    """Renders one plot job and hands the metrics it recorded back to the parent process."""
+    from f1_analysis_dashboard.src.plotting import plot_generator
+    with metrics.session_scope(session):
+        plot_generator.render_payload(kind, payload, digest)
+    return metrics.take()
+
+
+# --- Public API ---
+def is_active() -> bool:
+    """True if plots are currently sent to a render pool."""
+    return _pool is not None
+
+
+def start(workers: int) -> bool:
+    """
+    Starts a pool of headless render processes.
+
+    Plot jobs submitted while the pool is active are rendered and saved in
+    the workers instead of the calling process. Interactive display
+    (config.PLOT_SHOW) is not possible from workers.
+
+    Args:
+        workers: Number of render processes (1 or more).
+
+    Returns:
+        True if the pool was started.
+    """
+    global _pool
+    if _pool is not None:
+        logger.warning("Render pool already running.")
+        return True
+    if workers < 1:
+        logger.error(f"Invalid number of render workers: {workers}")
+        return False
+    if config.PLOT_SHOW:
+        logger.warning("Plots rendered in the render pool are saved only; they cannot be shown interactively.")
+
+    plot_settings = {
+        'OUTPUT_DIR': config.OUTPUT_DIR,
+        'PLOT_SAVE': config.PLOT_SAVE,
+        'PLOT_DPI': config.PLOT_DPI,
+        'PLOT_FORMAT': config.PLOT_FORMAT,
+        'COLOR_SCHEME': config.COLOR_SCHEME,
+    }
+    # 'spawn' keeps workers independent of any threads started by FastF1 in this process
+    _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                initializer=_init_worker, initargs=(plot_settings,))
+    logger.info(f"Render pool started with {workers} workers.")
+    return True
+
+
+def submit(kind: str, payload: Dict[str, Any], digest: Optional[str] = None,
+           session: Optional[str] = None) -> Future:
+    """Queues a plot job (see plot_generator.render_payload) on the running pool; `session` labels its metrics."""
+    if _pool is None:
+        raise RuntimeError("Render pool is not running; call render_pool.start() first.")
+    future = _pool.submit(_render_job, kind, payload, digest, session)
+    _pending.append(future)
+    return future
+
+
+def wait_all() -> int:
+    """
+    Blocks until every submitted plot job has finished.
+
+    Returns:
+        The number of jobs that failed (each failure is logged).
+    """
+    failed = 0
+    while _pending:
+        future = _pending.pop(0)
+        try:
+            metrics.merge(future.result())
+        except Exception as e:
+            failed += 1
+            logger.error(f"Plot rendering failed: {e}", exc_info=True)
+    return failed
+
+
+def shutdown():
+    """Waits for outstanding plot jobs and stops the pool; later plots render inline."""
+    global _pool
+    if _pool is None:
+        return
+    failed = wait_all()
+    _pool.shutdown()
+    _pool = None
+    logger.info(f"Render pool stopped ({failed} failed plot jobs).")
@@ -0,0 +1,274 @@
+# f1_analysis_dashboard/src/result_cache.py
+import functools
+import hashlib
+import inspect
+import io
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+import fastf1 as ff1
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import session_store
+from f1_analysis_dashboard.src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+# Analysis results of completed sessions, stored per (session, analysis function,
+# relevant settings, code version) as compressed .npz files using the session
+# store's column codec. A run whose selected analyses are all cached does not
+# load the session at all.
+
+# Bump when the on-disk layout changes
+RESULT_CACHE_VERSION: int = 1
+
+# Settings that change the output of analyses built on PreparedLaps
+LAP_FILTER_CONFIG = ('MIN_LAP_NUMBER_PACE', 'PACE_FILTER_THRESHOLD', 'PACE_OUTLIER_STRATEGY',
+                     'PACE_OUTLIER_SCOPE', 'PACE_MAD_THRESHOLD', 'PACE_IQR_FACTOR')
+# Settings that change the output of every analysis (e.g. result dtypes)
+COMMON_CONFIG = ('COMPACT_DTYPES',)
+
+# Sessions this recent may still receive data corrections upstream, so they are not cached
+_MIN_SESSION_AGE = pd.Timedelta(days=1)
+
+
+def is_enabled() -> bool:
+    """True if the result cache is active (requires the FastF1 cache to be enabled)."""
+    return config.CACHE_ENABLED and config.RESULT_CACHE_ENABLED
+
+
+# --- Keys ---
+_PACKAGE = config.__name__.rpartition('.')[0]
+
+
+def package_dependencies(module_name: str) -> Dict[str, str]:
+    """
+    The package modules a module uses, directly or through other package modules.
+
+    Follows the module's globals: imported package modules, and functions or
+    classes imported from them. config is left out; the settings a result
+    depends on are part of the key (config_snapshot).
+
+    Returns:
+        Source file per module name, including the module itself.
+    """
+    found: Dict[str, str] = {}
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        module = sys.modules.get(name)
+        if name in found or module is None or module is config:
+            continue
+        found[name] = inspect.getsourcefile(module)
+        for value in vars(module).values():
+            used = value.__name__ if inspect.ismodule(value) else getattr(value, '__module__', None)
+            if isinstance(used, str) and used.startswith(_PACKAGE + '.'):
+                pending.append(used)
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(func: Callable) -> str:
+    """Hash of the source files an analysis result depends on: its module and every package module it uses."""
+    digest = hashlib.sha256(str(RESULT_CACHE_VERSION).encode())
+    for name, source in sorted(package_dependencies(func.__module__).items()):
+        digest.update(name.encode())
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def config_snapshot(func: Callable) -> Dict[str, Any]:
+    """The current values of the settings that affect `func`'s result (see helpers.uses_config)."""
+    names = COMMON_CONFIG + getattr(func, 'config_settings', ())
+    if 'laps' in getattr(func, 'required_components', ()):
+        names += LAP_FILTER_CONFIG
+    return {name: getattr(config, name) for name in names}
+
+
+def _session_prefix(year: int, event: Union[str, int], session_type: str) -> str:
+    event_key = str(event).replace(' ', '').replace(os.sep, '_')
+    return f"{year}_{event_key}_{session_type}"
+
+
+def _entry_path(year: int, event: Union[str, int], session_type: str, func: Callable) -> Path:
+    key = {
+        'year': year, 'event': str(event), 'session': session_type,
+        'function': f"{func.__module__}.{func.__qualname__}",
+        'config': config_snapshot(func), 'code': code_version(func), 'fastf1': ff1.__version__,
+    }
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return Path(config.RESULT_CACHE_DIR) / f"{_session_prefix(year, event, session_type)}_{func.__name__}_{digest}.npz"
+
+
+def _session_path(year: int, event: Union[str, int], session_type: str) -> Path:
+    """Session metadata (session_info and plot colors) shared by the session's result entries."""
+    return Path(config.RESULT_CACHE_DIR) / f"{_session_prefix(year, event, session_type)}_session.json"
+
+
+# --- Result Codec ---
+# DataFrames are stored as they are, numeric Series as a one-column frame (keeping
+# the index) and mixed-type Series (a single lap) as a one-row frame.
+
+def _encode_result(result: Union[pd.DataFrame, pd.Series], arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    if isinstance(result, pd.DataFrame):
+        return {'kind': 'frame', 'schema': session_store.encode_frame(result, 'result', arrays)}
+    name = None if result.name is None else str(result.name)
+    if result.dtype == object:
+        row = result.to_frame().T.infer_objects().reset_index(drop=True)
+        return {'kind': 'row', 'name': name, 'schema': session_store.encode_frame(row, 'result', arrays)}
+    return {'kind': 'series', 'name': name,
+            'schema': session_store.encode_frame(result.to_frame('value'), 'result', arrays)}
+
+
+def _decode_result(npz: Any, spec: Dict[str, Any]) -> Union[pd.DataFrame, pd.Series]:
+    frame = session_store.decode_frame(npz, 'result', spec['schema'])
+    if spec['kind'] == 'frame':
+        return frame
+    series = frame.iloc[0].astype(object) if spec['kind'] == 'row' else frame['value']
+    series.name = spec['name']
+    return series
+
+
+# --- Public API ---
+def load_results(year: int, event: Union[str, int], session_type: str,
+                 analyses: Mapping[str, Callable]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Looks up the cached results of every given analysis.
+
+    Returns:
+        (session metadata, {analysis name: result}) if all analyses are
+        cached, otherwise None. The metadata holds 'session_info' and, if
+        recorded, the plot 'colors' of the session.
+    """
+    session_path = _session_path(year, event, session_type)
+    try:
+        session_meta = json.loads(session_path.read_text())
+    except (OSError, ValueError):
+        metrics.inc('result_cache_lookups_total', result='miss')
+        return None
+
+    results = {}
+    for name, func in analyses.items():
+        path = _entry_path(year, event, session_type, func)
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                results[name] = _decode_result(npz, json.loads(str(npz['meta']))['result'])
+            os.utime(path) # Recently used entries are evicted last
+        except FileNotFoundError:
+            metrics.inc('result_cache_lookups_total', result='miss')
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read cached result '{path}': {e}")
+            metrics.inc('result_cache_lookups_total', result='miss')
+            return None
+    metrics.inc('result_cache_lookups_total', result='hit')
+    logger.info(f"Using cached results for {year} {event} {session_type}: {', '.join(results)}")
+    return session_meta, results
+
+
+def save_results(session: ff1.core.Session, year: int, event: Union[str, int], session_type: str,
+                 session_info: Dict[str, Any], analyses: Mapping[str, Callable], results: Mapping[str, Any]) -> int:
+    """
+    Stores the results of a completed session's analyses.
+
+    Results that are None (the analysis failed or had no data) are not
+    stored. Failures are logged and never raised; the cache is only an
+    accelerator.
+
+    Returns:
+        The number of results written.
+    """
+    session_date = getattr(session, 'date', None)
+    if session_date is None or pd.isna(session_date):
+        logger.debug(f"Session {year} {event} {session_type} has no date; results are not cached.")
+        return 0
+    session_date = pd.Timestamp(session_date)
+    if session_date.tzinfo is None:
+        session_date = session_date.tz_localize('UTC')
+    if pd.Timestamp.now(tz='UTC') - session_date < _MIN_SESSION_AGE:
+        logger.info(f"Session {year} {event} {session_type} is too recent to cache results; data may still change.")
+        return 0
+
+    written = 0
+    try:
+        Path(config.RESULT_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+        session_path = _session_path(year, event, session_type)
+        if not session_path.exists():
+            info = {'Year': int(session_info['Year']), 'EventName': str(session_info['EventName']),
+                    'SessionName': str(session_info['SessionName'])}
+            _write_atomic(session_path, json.dumps({'session_info': info}).encode())
+        for name, func in analyses.items():
+            result = results.get(name)
+            if not isinstance(result, (pd.DataFrame, pd.Series)):
+                continue
+            arrays: Dict[str, np.ndarray] = {}
+            meta = {'result_cache_version': RESULT_CACHE_VERSION, 'result': _encode_result(result, arrays)}
+            arrays['meta'] = np.array(json.dumps(meta))
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, **arrays)
+            _write_atomic(_entry_path(year, event, session_type, func), buffer.getvalue())
+            written += 1
+    except Exception as e:
+        logger.warning(f"Could not cache analysis results for {year} {event} {session_type}: {e}")
+    if written:
+        logger.info(f"Cached {written} analysis results for {year} {event} {session_type}.")
+        evict()
+    return written
+
+
+def save_colors(year: int, event: Union[str, int], session_type: str, colors: Dict[str, Any]):
+    """Records the session's resolved plot colors, so plots of cached results need no session."""
+    session_path = _session_path(year, event, session_type)
+    try:
+        session_meta = json.loads(session_path.read_text())
+        if session_meta.get('colors') == colors:
+            return
+        session_meta['colors'] = colors
+        _write_atomic(session_path, json.dumps(session_meta, default=str).encode())
+    except (OSError, ValueError):
+        pass # Results of this session are not cached
+
+
+def evict(max_bytes: Optional[int] = None) -> int:
+    """
+    Deletes the least recently used entries until the cache fits in `max_bytes`.
+
+    Args:
+        max_bytes: Size budget (default: config.RESULT_CACHE_MAX_BYTES).
+
+    Returns:
+        The number of files deleted.
+    """
+    max_bytes = config.RESULT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    try:
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry)
+                   for entry in Path(config.RESULT_CACHE_DIR).glob('*.npz')]
+    except OSError:
+        return 0
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        deleted += 1
+    if deleted:
+        metrics.inc('result_cache_evictions_total', deleted)
+        logger.info(f"Evicted {deleted} cached analysis results ({total / 2**20:.1f} MiB remain).")
+    return deleted
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp_path = path.with_name(path.name + f'.{os.getpid()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,200 @@
+# f1_analysis_dashboard/src/session_store.py
+import fastf1 as ff1
+import fastf1.events
+import numpy as np
+import pandas as pd
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; entries with another version are ignored
+STORE_VERSION: int = 1
+
+# Session components the store can serve. Runs requesting anything else go through FastF1.
+_UNSTORED_COMPONENTS = ('telemetry', 'weather', 'messages')
+
+# Sessions this recent may still receive data corrections upstream, so they are not stored
+_MIN_SESSION_AGE = pd.Timedelta(days=1)
+
+
+def is_enabled() -> bool:
+    """True if the parsed-session store is active (requires the FastF1 cache to be enabled)."""
+    return config.CACHE_ENABLED and config.SESSION_STORE_ENABLED
+
+
+def covers(load_config: Dict[str, bool]) -> bool:
+    """True if everything requested by `load_config` can be served from the store."""
+    return not any(load_config.get(component, False) for component in _UNSTORED_COMPONENTS)
+
+
+def _store_path(year: int, event: Union[str, int], session_type: str) -> Path:
+    """Store file for a (year, event, session) key, using the identifiers as given by the caller."""
+    event_key = str(event).replace(' ', '').replace(os.sep, '_')
+    return Path(config.SESSION_STORE_DIR) / f"{year}_{event_key}_{session_type}.npz"
+
+
+# --- Column Codec ---
+# Every column becomes one or two plain (non-pickled) NumPy arrays plus a schema
+# entry describing how to rebuild the original dtype.
+# encode_frame/decode_frame are also used by the analysis result cache.
+
+def _encode_column(series: pd.Series) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = np.asarray(dtype.categories.astype(str), dtype=str)
+        return ({'kind': 'category', 'ordered': bool(dtype.ordered)},
+                [series.cat.codes.to_numpy(), categories])
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        naive_utc = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        return {'kind': 'datetimetz', 'tz': str(dtype.tz)}, [naive_utc.to_numpy()]
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufmM':
+        return {'kind': 'numpy'}, [series.to_numpy()]
+
+    # Object and extension dtypes: inspect the non-null values
+    values = series.to_numpy(dtype=object)
+    null_mask = pd.isna(values)
+    present = values[~null_mask]
+    restore = None if isinstance(dtype, np.dtype) else str(dtype)
+    if all(isinstance(v, str) for v in present):
+        strings = np.where(null_mask, '', values).astype(str)
+        return {'kind': 'str', 'restore': restore}, [strings, null_mask]
+    if all(isinstance(v, (bool, np.bool_)) for v in present):
+        flags = np.where(null_mask, False, values).astype(bool)
+        return {'kind': 'objbool', 'restore': restore}, [flags, null_mask]
+    if all(isinstance(v, (int, float, np.number)) for v in present):
+        numbers = np.where(null_mask, np.nan, values).astype(np.float64)
+        return {'kind': 'objfloat', 'restore': restore}, [numbers, null_mask]
+    raise TypeError(f"Column '{series.name}' has values of unsupported type for the session store.")
+
+
+def _decode_column(spec: Dict[str, Any], arrays: List[np.ndarray], index: pd.Index) -> pd.Series:
+    kind = spec['kind']
+    if kind == 'category':
+        codes, categories = arrays
+        dtype = pd.CategoricalDtype(categories.tolist(), ordered=spec['ordered'])
+        return pd.Series(pd.Categorical.from_codes(codes, dtype=dtype), index=index)
+    if kind == 'datetimetz':
+        return pd.Series(arrays[0], index=index).dt.tz_localize('UTC').dt.tz_convert(spec['tz'])
+    if kind == 'numpy':
+        return pd.Series(arrays[0], index=index)
+
+    values, null_mask = arrays
+    values = values.astype(object)
+    values[null_mask] = None
+    series = pd.Series(values, index=index, dtype=object)
+    if spec.get('restore'):
+        series = series.astype(spec['restore'])
+    return series
+
+
+def encode_frame(df: pd.DataFrame, prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Adds the arrays of `df` (index included) to `arrays` and returns the frame schema."""
+    columns = []
+    index_series = df.index.to_series(index=pd.RangeIndex(len(df)))
+    for position, (name, series) in enumerate([(df.index.name, index_series)] + list(df.items())):
+        spec, column_arrays = _encode_column(series.reset_index(drop=True))
+        spec['name'] = name
+        spec['n_arrays'] = len(column_arrays)
+        for part, array in enumerate(column_arrays):
+            arrays[f"{prefix}/{position}/{part}"] = array
+        columns.append(spec)
+    return {'columns': columns, 'range_index': isinstance(df.index, pd.RangeIndex)}
+
+
+def decode_frame(npz: Any, prefix: str, schema: Dict[str, Any]) -> pd.DataFrame:
+    specs = schema['columns']
+    n_rows = len(npz[f"{prefix}/0/0"])
+    positional = pd.RangeIndex(n_rows)
+    decoded = [
+        _decode_column(spec, [npz[f"{prefix}/{position}/{part}"] for part in range(spec['n_arrays'])], positional)
+        for position, spec in enumerate(specs)
+    ]
+    df = pd.DataFrame(dict(enumerate(decoded[1:])), index=positional)
+    df.columns = [spec['name'] for spec in specs[1:]]
+    if not schema['range_index']:
+        df.index = pd.Index(decoded[0], name=specs[0]['name'])
+    return df
+
+
+# --- Public API ---
+def save_session(session: ff1.core.Session, year: int, event: Union[str, int], session_type: str) -> bool:
+    """
+    Stores the parsed laps, results and event metadata of a loaded session.
+
+    Failures are logged and never raised; the store is only an accelerator.
+
+    Returns:
+        True if the session was written to the store.
+    """
+    path = _store_path(year, event, session_type)
+    try:
+        session_date = pd.Timestamp(session.date)
+        if session_date.tzinfo is None:
+            session_date = session_date.tz_localize('UTC')
+        if pd.Timestamp.now(tz='UTC') - session_date < _MIN_SESSION_AGE:
+            logger.info(f"Session {year} {event} {session_type} is too recent to store; data may still change.")
+            return False
+
+        arrays: Dict[str, np.ndarray] = {}
+        event_frame = pd.DataFrame([dict(session.event)])
+        meta = {
+            'store_version': STORE_VERSION,
+            'fastf1_version': ff1.__version__,
+            'year': int(session.event.year),
+            'session_name': session.name,
+            'f1_api_support': bool(session.f1_api_support),
+            'event': encode_frame(event_frame, 'event', arrays),
+            'laps': encode_frame(pd.DataFrame(session.laps), 'laps', arrays),
+            'results': encode_frame(pd.DataFrame(session.results), 'results', arrays),
+        }
+        arrays['meta'] = np.array(json.dumps(meta))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays) # Uncompressed: loading speed matters more than size here
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(buffer.getvalue())
+        os.replace(tmp_path, path)
+        logger.info(f"Stored parsed session data: {path}")
+        return True
+    except Exception as e:
+        logger.warning(f"Could not store parsed session data for {year} {event} {session_type}: {e}")
+        return False
+
+
+def load_session(year: int, event: Union[str, int], session_type: str) -> Optional[ff1.core.Session]:
+    """
+    Rebuilds a FastF1 Session with laps and results from the store.
+
+    Returns:
+        A Session whose `laps`, `results` and `event` are populated, or None
+        on a miss (no entry, other store/FastF1 version, or unreadable file).
+    """
+    path = _store_path(year, event, session_type)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            meta = json.loads(str(npz['meta']))
+            if meta['store_version'] != STORE_VERSION or meta['fastf1_version'] != ff1.__version__:
+                logger.info(f"Ignoring stored session data from another version: {path}")
+                return None
+            event_row = decode_frame(npz, 'event', meta['event']).iloc[0]
+            laps = decode_frame(npz, 'laps', meta['laps'])
+            results = decode_frame(npz, 'results', meta['results'])
+
+        event_obj = fastf1.events.Event(event_row, year=meta['year'])
+        session = ff1.core.Session(event_obj, meta['session_name'], f1_api_support=meta['f1_api_support'])
+        session._laps = ff1.core.Laps(laps, session=session)
+        session._results = ff1.core.SessionResults(results)
+        logger.info(f"Loaded parsed session data from store: {path}")
+        return session
+    except Exception as e:
+        logger.warning(f"Could not read stored session data '{path}': {e}. Falling back to FastF1.")
+        return None
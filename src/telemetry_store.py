@@ -0,0 +1,183 @@
+# f1_analysis_dashboard/src/telemetry_store.py
+import fastf1 as ff1
+import numpy as np
+import pandas as pd
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; stores with another version are rewritten
+STORE_VERSION: int = 1
+
+# Channels kept per driver and their fixed on-disk dtypes.
+# SessionTime is stored as int64 nanoseconds; Distance is cumulative over the session.
+TELEMETRY_CHANNELS: Dict[str, str] = {
+    'SessionTime': 'int64',
+    'Distance': 'float32',
+    'Speed': 'float32',
+    'Throttle': 'float32',
+    'Brake': 'bool',
+    'nGear': 'int8',
+    'X': 'float32',
+    'Y': 'float32',
+}
+
+# Per-driver lap index: rows [Start, Stop) of the channel arrays belong to LapNumber
+LAP_INDEX_DTYPE = np.dtype([('LapNumber', 'int16'), ('Start', 'int64'), ('Stop', 'int64')])
+
+_META_FILE = 'meta.json' # Written last; its presence marks a complete store
+
+
+def _store_dir(session: ff1.core.Session) -> Path:
+    """Store directory for a session, keyed by its canonical year, event and session names."""
+    event_name = str(session.event['EventName']).replace(' ', '')
+    session_name = str(session.name).replace(' ', '')
+    return Path(config.TELEMETRY_STORE_DIR) / f"{session.event.year}_{event_name}_{session_name}"
+
+
+def exists(session: ff1.core.Session) -> bool:
+    """True if a complete telemetry store of the current version exists for the session."""
+    meta_path = _store_dir(session) / _META_FILE
+    if not meta_path.exists():
+        return False
+    try:
+        return json.loads(meta_path.read_text())['store_version'] == STORE_VERSION
+    except (OSError, ValueError, KeyError):
+        return False
+
+
+def _build_lap_index(session_time_ns: np.ndarray, driver_laps: pd.DataFrame) -> np.ndarray:
+    """Locates every lap's [LapStartTime, Time] window in the driver's sorted SessionTime array."""
+    driver_laps = driver_laps.dropna(subset=[config.COL_LAP_NUMBER, 'LapStartTime', config.COL_TIME])
+    lap_index = np.zeros(len(driver_laps), dtype=LAP_INDEX_DTYPE)
+    if driver_laps.empty:
+        return lap_index
+    lap_index['LapNumber'] = driver_laps[config.COL_LAP_NUMBER].to_numpy()
+    lap_index['Start'] = np.searchsorted(session_time_ns, driver_laps['LapStartTime'].to_numpy().view('int64'), side='left')
+    lap_index['Stop'] = np.searchsorted(session_time_ns, driver_laps[config.COL_TIME].to_numpy().view('int64'), side='right')
+    return lap_index
+
+
+def write_session(session: ff1.core.Session, release: bool = True) -> bool:
+    """
+    Writes the car and position telemetry of every driver to fixed-dtype .npy files.
+
+    Drivers are processed one at a time, so peak memory is one driver's merged
+    telemetry on top of what FastF1 already holds. With `release`, the
+    session's in-memory car/position data is dropped afterwards; read it back
+    with :func:`open_session`.
+
+    Returns:
+        True if the store was written completely.
+    """
+    store_dir = _store_dir(session)
+    try:
+        car_data = session.car_data
+        pos_data = session.pos_data
+    except ff1.core.DataNotLoadedError:
+        logger.warning("Telemetry was not loaded for this session; nothing to store.")
+        return False
+
+    tmp_dir = store_dir.with_name(store_dir.name + '.tmp')
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        laps = session.laps
+        drivers = []
+        for driver_number in list(car_data.keys()):
+            telemetry = car_data[driver_number]
+            if driver_number in pos_data:
+                telemetry = telemetry.merge_channels(pos_data[driver_number], frequency='original')
+            telemetry = telemetry.add_distance()
+
+            driver_laps = laps[laps['DriverNumber'] == driver_number]
+            abbreviation = driver_laps[config.COL_DRIVER].iloc[0] if not driver_laps.empty else driver_number
+            driver_dir = tmp_dir / str(abbreviation)
+            driver_dir.mkdir()
+
+            session_time_ns = telemetry['SessionTime'].to_numpy().view('int64')
+            for channel, dtype in TELEMETRY_CHANNELS.items():
+                if channel == 'SessionTime':
+                    values = session_time_ns
+                elif channel in telemetry.columns:
+                    values = telemetry[channel].fillna(0).to_numpy().astype(dtype)
+                else:
+                    values = np.zeros(len(telemetry), dtype=dtype)
+                np.save(driver_dir / f"{channel}.npy", np.ascontiguousarray(values, dtype=dtype))
+            np.save(driver_dir / 'laps.npy', _build_lap_index(session_time_ns, driver_laps.sort_values(config.COL_LAP_NUMBER)))
+            drivers.append(str(abbreviation))
+            del telemetry # Keep only one driver's merged telemetry alive at a time
+
+        (tmp_dir / _META_FILE).write_text(json.dumps({'store_version': STORE_VERSION, 'drivers': drivers}))
+        shutil.rmtree(store_dir, ignore_errors=True)
+        tmp_dir.rename(store_dir)
+        logger.info(f"Telemetry for {len(drivers)} drivers written to {store_dir}")
+    except Exception as e:
+        logger.error(f"Failed to write telemetry store '{store_dir}': {e}", exc_info=True)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return False
+
+    if release:
+        session._car_data = {}
+        session._pos_data = {}
+    return True
+
+
+class SessionTelemetry:
+    """
+    Read-only, memory-mapped view of a session's telemetry store.
+
+    Channel arrays are opened lazily per driver with ``mmap_mode='r'``, so only
+    the pages that are actually sliced are read from disk.
+    """
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = store_dir
+        meta = json.loads((store_dir / _META_FILE).read_text())
+        self.drivers: List[str] = meta['drivers']
+        self._channels: Dict[str, Dict[str, np.ndarray]] = {}
+        self._lap_index: Dict[str, np.ndarray] = {}
+
+    def channels(self, driver: str) -> Dict[str, np.ndarray]:
+        """All channels of a driver as memory-mapped arrays."""
+        if driver not in self._channels:
+            driver_dir = self.store_dir / driver
+            self._channels[driver] = {
+                channel: np.load(driver_dir / f"{channel}.npy", mmap_mode='r')
+                for channel in TELEMETRY_CHANNELS
+            }
+            self._lap_index[driver] = np.load(driver_dir / 'laps.npy')
+        return self._channels[driver]
+
+    def lap_bounds(self, driver: str, lap_number: int) -> Optional[slice]:
+        """Row slice of a driver's lap in the channel arrays, or None if the lap is not indexed."""
+        self.channels(driver)
+        lap_index = self._lap_index[driver]
+        matches = np.flatnonzero(lap_index['LapNumber'] == lap_number)
+        if matches.size == 0:
+            return None
+        entry = lap_index[matches[0]]
+        return slice(int(entry['Start']), int(entry['Stop']))
+
+    def lap(self, driver: str, lap_number: int) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Channels of a single lap as zero-copy slices of the memory-mapped arrays.
+
+        Distance is cumulative over the session; subtract the first value for lap distance.
+        """
+        bounds = self.lap_bounds(driver, lap_number)
+        if bounds is None:
+            return None
+        return {channel: values[bounds] for channel, values in self.channels(driver).items()}
+
+
+def open_session(session: ff1.core.Session) -> Optional[SessionTelemetry]:
+    """Opens the telemetry store of a session, or returns None if none exists."""
+    if not exists(session):
+        return None
+    return SessionTelemetry(_store_dir(session))
@@ -0,0 +1,93 @@
+# f1_analysis_dashboard/src/utils/compact_schema.py
+import numpy as np
+import pandas as pd
+import logging
+from typing import Any, Dict, Union
+from f1_analysis_dashboard import config
+
+logger = logging.getLogger(__name__)
+
+# Opt-in compact dtypes (config.COMPACT_DTYPES). Small-int columns fall back to the
+# matching nullable dtype (e.g. 'Int16') when they contain missing values.
+# Every timedelta64 column additionally becomes float32 seconds (millisecond resolution).
+LAPS_SCHEMA: Dict[str, str] = {
+    config.COL_DRIVER: 'category',
+    'DriverNumber': 'category',
+    config.COL_TEAM: 'category',
+    config.COL_COMPOUND: 'category',
+    'TrackStatus': 'category',
+    'DeletedReason': 'category',
+    config.COL_LAP_NUMBER: 'int16',
+    config.COL_TYRE_LIFE: 'int16',
+    'Stint': 'int8',
+    config.COL_POSITION: 'int8',
+    'SpeedI1': 'float32',
+    'SpeedI2': 'float32',
+    'SpeedFL': 'float32',
+    'SpeedST': 'float32',
+}
+
+# Results frames have one row per driver, so only numeric columns are narrowed;
+# string columns stay object so results_analysis can fill placeholders freely.
+RESULTS_SCHEMA: Dict[str, str] = {
+    config.COL_POSITION: 'int8',
+    'ClassifiedPosition': 'category',
+    'GridPosition': 'int8',
+    config.COL_POINTS: 'float32',
+    'Laps': 'int16',
+}
+
+
+def frame_memory_bytes(df: pd.DataFrame) -> int:
+    """Total memory used by a DataFrame, including object contents."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _compact_column(series: pd.Series, dtype: str) -> pd.Series:
+    if dtype.startswith('int') and series.isna().any():
+        dtype = dtype.capitalize() # Nullable counterpart, e.g. 'int16' -> 'Int16'
+    return series.astype(dtype)
+
+
+def compact_frame(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Returns a copy of `df` with the compact schema applied.
+
+    Columns listed in `schema` are converted to the given dtype and all
+    timedelta64 columns become float32 seconds. Columns that cannot be
+    converted are left unchanged (and logged).
+    """
+    compact = df.copy()
+    for column in compact.columns:
+        series = compact[column]
+        try:
+            if pd.api.types.is_timedelta64_dtype(series.dtype):
+                compact[column] = series.dt.total_seconds().astype(np.float32)
+            elif column in schema:
+                compact[column] = _compact_column(series, schema[column])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not compact column '{column}' to '{schema.get(column, 'float32')}': {e}")
+    return compact
+
+
+def decimal_seconds(values: Union[pd.Series, Any]) -> Union[pd.Series, Any]:
+    """
+    Compact float32 seconds as float64 through their shortest decimal repr.
+
+    float32(90.1) is 90.09999847...; widened exactly it would format as
+    01:30.099 instead of the original 01:30.100. Takes a column or a single
+    value (e.g. from a lap row); other dtypes are returned unchanged.
+    """
+    if isinstance(values, np.float32):
+        return float(str(values))
+    if isinstance(values, pd.Series) and values.dtype == np.float32:
+        return values.astype(str).astype(np.float64)
+    return values
+
+
+def memory_report(label: str, before: pd.DataFrame, after: pd.DataFrame) -> str:
+    """One-line before/after memory footprint summary for a frame."""
+    before_bytes, after_bytes = frame_memory_bytes(before), frame_memory_bytes(after)
+    saved = 1 - after_bytes / before_bytes if before_bytes else 0.0
+    return (f"{label}: {before_bytes / 1e6:.2f} MB -> {after_bytes / 1e6:.2f} MB "
+            f"({saved:.0%} smaller, {len(after)} rows)")
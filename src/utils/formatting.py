@@ -1,4 +1,5 @@
 # f1_analysis_dashboard/src/utils/formatting.py
+import numpy as np
 import pandas as pd
 from typing import Union, Optional
 
@@ -13,10 +14,14 @@ def format_timedelta(td: Optional[Union[pd.Timedelta, float, int, str]]) -> str:
     Returns:
         Formatted time string (MM:SS.ms), "N/A", or "Invalid Time".
     """
-    if pd.isna(td):
-        return "N/A"
-
     try:
+        if pd.isna(td): # Raises ValueError for list-likes, reported as invalid below
+            return "N/A"
+
+        if isinstance(td, np.floating):
+            # Exact float64, as format_timedelta_series widens whole columns (pandas
+            # would otherwise convert float32 seconds in float32 arithmetic)
+            td = float(td)
         if not isinstance(td, pd.Timedelta):
             # Attempt conversion assuming seconds if numeric, or direct if string
             td = pd.to_timedelta(td, unit='s', errors='coerce')
@@ -38,4 +43,75 @@ def format_timedelta(td: Optional[Union[pd.Timedelta, float, int, str]]) -> str:
 
     except (ValueError, TypeError, AttributeError):
         # Catch potential errors during conversion or attribute access
-        return "Invalid Time"
\ No newline at end of file
+        return "Invalid Time"
+
+
+# Largest magnitude (in seconds) representable as timedelta64[ns]; beyond it the
+# scalar conversion coerces to NaT.
+_MAX_TIMEDELTA_SECONDS = np.iinfo(np.int64).max / 1e9
+
+_ASCII_ZERO = ord('0')
+
+
+def format_timedelta_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized version of :func:`format_timedelta` for a whole column.
+
+    timedelta64 and numeric (seconds) columns are formatted from their int64
+    nanosecond representation with NumPy arithmetic; the output is identical
+    to ``values.map(format_timedelta)``. Other dtypes (e.g. object columns
+    with mixed values) fall back to the scalar function. Compact float32
+    seconds are widened exactly; see compact_schema.decimal_seconds.
+
+    Args:
+        values: Series of timedeltas or numeric seconds.
+
+    Returns:
+        Series of formatted strings with the same index and name.
+    """
+    values = values if isinstance(values, pd.Series) else pd.Series(values)
+    dtype = values.dtype
+
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        timedeltas = values.astype('timedelta64[ns]')
+    elif pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        # Exact float64 of each value, as format_timedelta widens a scalar
+        seconds = values.astype('float64')
+        # Out-of-range and non-finite seconds become NaT, as with errors='coerce'
+        in_range = np.isfinite(seconds) & (seconds.abs() < _MAX_TIMEDELTA_SECONDS)
+        timedeltas = pd.Series(pd.NaT, index=values.index, dtype='timedelta64[ns]')
+        timedeltas[in_range] = pd.to_timedelta(seconds[in_range], unit='s')
+    else:
+        return values.map(format_timedelta)
+
+    is_nat = timedeltas.isna().to_numpy()
+    nanoseconds = timedeltas.to_numpy().view('int64')
+
+    # Same float arithmetic as the scalar version: divmod of total_seconds by 60
+    minutes, seconds = np.divmod(nanoseconds / 1e9, 60.0)
+    minutes = minutes.astype(np.int64)
+    seconds = np.where(seconds >= 60, 59, seconds).astype(np.int64) # Cap as in format_timedelta
+    milliseconds = (nanoseconds // 1000) % 1_000_000 // 1000 # Timedelta.microseconds // 1000
+
+    result = np.full(len(values), "N/A", dtype=object)
+
+    # Common case (0-99 minutes): assemble fixed-width 'MM:SS.mmm' bytes directly
+    fast = ~is_nat & (minutes >= 0) & (minutes < 100)
+    m, s, ms = minutes[fast], seconds[fast], milliseconds[fast]
+    chars = np.empty((len(m), 9), dtype=np.uint8)
+    chars[:, 0] = m // 10 + _ASCII_ZERO
+    chars[:, 1] = m % 10 + _ASCII_ZERO
+    chars[:, 2] = ord(':')
+    chars[:, 3] = s // 10 + _ASCII_ZERO
+    chars[:, 4] = s % 10 + _ASCII_ZERO
+    chars[:, 5] = ord('.')
+    chars[:, 6] = ms // 100 + _ASCII_ZERO
+    chars[:, 7] = ms // 10 % 10 + _ASCII_ZERO
+    chars[:, 8] = ms % 10 + _ASCII_ZERO
+    result[fast] = chars.view('S9').ravel().astype('U9').astype(object)
+
+    # Rare cases (negative or 100+ minutes) use Python formatting on the precomputed parts
+    for i in np.flatnonzero(~is_nat & ~fast):
+        result[i] = f"{minutes[i]:02d}:{seconds[i]:02d}.{milliseconds[i]:03d}"
+
+    return pd.Series(result, index=values.index, name=values.name)
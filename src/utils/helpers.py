@@ -2,10 +2,39 @@
 import pandas as pd
 import fastf1 as ff1
 import logging
+from typing import Callable, Dict, Optional
 from f1_analysis_dashboard import config # Use relative import within the package
+from f1_analysis_dashboard.src.utils import lap_cleaning
 
 logger = logging.getLogger(__name__)
 
+def requires_components(*components: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator declaring which session components an analysis needs.
+
+    Components are the `Session.load` flags ('laps', 'telemetry', 'weather',
+    'messages'); results are always loaded. `data_loader.required_load_config`
+    uses the declarations to load only what the selected analyses need.
+    """
+    def decorator(func: Callable) -> Callable:
+        func.required_components = frozenset(components)
+        return func
+    return decorator
+
+
+def uses_config(*names: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator declaring the config settings an analysis reads besides the lap filters.
+
+    `result_cache` keys cached results on these settings, so changing one
+    recomputes the analysis instead of serving a stale result.
+    """
+    def decorator(func: Callable) -> Callable:
+        func.config_settings = tuple(names)
+        return func
+    return decorator
+
+
 def ensure_team_info(laps_df: pd.DataFrame, session: ff1.core.Session) -> pd.DataFrame:
     """
     Ensures the 'Team' column exists and is populated in the laps DataFrame.
@@ -76,7 +105,80 @@ def ensure_team_info(laps_df: pd.DataFrame, session: ff1.core.Session) -> pd.Dat
     if col_team not in laps_df.columns:
          laps_df[col_team] = 'N/A'
     elif laps_df[col_team].isnull().any(): # Fill remaining NaNs if mapping was partial
-         laps_df[col_team].fillna('N/A', inplace=True)
+         team = laps_df[col_team]
+         if isinstance(team.dtype, pd.CategoricalDtype) and 'N/A' not in team.cat.categories:
+             team = team.cat.add_categories('N/A') # Compact schema
+         laps_df[col_team] = team.fillna('N/A')
+
+
+    return laps_df
+
+class PreparedLaps:
+    """
+    Session-scoped lap data shared by all analyses of a single session.
+
+    Holds one team-filled copy of ``session.laps`` with ``LapTimeSeconds``
+    already derived, plus the boolean mask of laps that are usable for pace
+    analysis. Build it once per session with :func:`prepare_laps` and pass it
+    to every analysis function instead of letting each one copy the laps.
 
+    Attributes:
+        session: The FastF1 Session object the laps belong to.
+        laps: Team-filled laps DataFrame including 'LapTimeSeconds'.
+    """
+
+    def __init__(self, laps: pd.DataFrame, session: ff1.core.Session):
+        self.session = session
+        self.laps = laps
+        self._pace_mask: Optional[pd.Series] = None
+        self._pace_stats: Optional[Dict[str, int]] = None
+
+    def _clean(self):
+        self._pace_mask, self._pace_stats = lap_cleaning.clean_laps(self.laps)
+
+    @property
+    def pace_mask(self) -> pd.Series:
+        """Boolean mask over ``laps`` selecting laps valid for pace analysis (computed lazily)."""
+        if self._pace_mask is None:
+            self._clean()
+        return self._pace_mask
 
-    return laps_df
\ No newline at end of file
+    @property
+    def pace_stats(self) -> Dict[str, int]:
+        """Lap counts removed by each pace filter (see lap_cleaning.clean_laps)."""
+        if self._pace_stats is None:
+            self._clean()
+        return self._pace_stats
+
+    @property
+    def pace_laps(self) -> pd.DataFrame:
+        """Laps filtered by :attr:`pace_mask` (a new frame on every access)."""
+        return self.laps[self.pace_mask]
+
+
+def prepare_laps(session: ff1.core.Session) -> Optional[PreparedLaps]:
+    """
+    Copies the session laps once, fills team info and derives LapTimeSeconds.
+
+    Args:
+        session: The loaded FastF1 Session object (must include laps).
+
+    Returns:
+        A PreparedLaps object, or None if laps are unavailable.
+    """
+    try:
+        laps = session.laps
+    except (AttributeError, ff1.core.DataNotLoadedError):
+        laps = None
+    if laps is None or laps.empty:
+        logger.warning("Laps data not available for analysis.")
+        return None
+
+    laps = ensure_team_info(laps.copy(), session)
+    if config.COL_LAP_TIME in laps.columns:
+        lap_time = laps[config.COL_LAP_TIME]
+        if pd.api.types.is_timedelta64_dtype(lap_time.dtype):
+            laps[config.COL_LAP_TIME_SECONDS] = lap_time.dt.total_seconds()
+        else:
+            laps[config.COL_LAP_TIME_SECONDS] = lap_time # Compact schema: already seconds
+    return PreparedLaps(laps, session)
@@ -0,0 +1,125 @@
+# f1_analysis_dashboard/src/utils/lap_cleaning.py
+import numpy as np
+import pandas as pd
+import logging
+from typing import Dict, Optional, Tuple
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src.utils import formatting, metrics
+
+logger = logging.getLogger(__name__)
+
+# Outlier cutoffs supported by clean_laps:
+#   'median': keep laps <= PACE_FILTER_THRESHOLD x median (slow laps only)
+#   'mad':    keep laps within PACE_MAD_THRESHOLD scaled MADs of the median
+#   'iqr':    keep laps within [Q1 - k*IQR, Q3 + k*IQR], k = PACE_IQR_FACTOR
+OUTLIER_STRATEGIES = ('median', 'mad', 'iqr')
+# Population the outlier statistics are computed over
+OUTLIER_SCOPES = ('global', 'driver', 'team')
+
+# Scales the MAD to a consistent estimator of the standard deviation for normal data
+_MAD_SCALE = 1.4826
+
+
+def _group_stat(values: pd.Series, keys: Optional[pd.Series], func: str, *args) -> pd.Series:
+    """A per-row statistic of `values`, either over all rows or per group via groupby().transform."""
+    if keys is None:
+        return pd.Series(getattr(values, func)(*args), index=values.index)
+    return values.groupby(keys, observed=True).transform(func, *args)
+
+
+def _outlier_mask(seconds: pd.Series, keys: Optional[pd.Series], strategy: str) -> pd.Series:
+    """Mask of laps passing the outlier cutoff; `seconds` is NaN for laps already rejected."""
+    median = _group_stat(seconds, keys, 'median')
+    if strategy == 'median':
+        return seconds <= median * config.PACE_FILTER_THRESHOLD
+    if strategy == 'mad':
+        mad = _group_stat((seconds - median).abs(), keys, 'median')
+        return (seconds - median).abs() <= config.PACE_MAD_THRESHOLD * _MAD_SCALE * mad
+    if strategy == 'iqr':
+        q1 = _group_stat(seconds, keys, 'quantile', 0.25)
+        q3 = _group_stat(seconds, keys, 'quantile', 0.75)
+        spread = config.PACE_IQR_FACTOR * (q3 - q1)
+        return (seconds >= q1 - spread) & (seconds <= q3 + spread)
+    raise ValueError(f"Unknown outlier strategy '{strategy}'. Choose from {OUTLIER_STRATEGIES}.")
+
+
+def _record_filter_rows(stats: Dict[str, int]):
+    """Exports the rows entering and leaving each filter, in the order they are applied."""
+    rows = stats['input']
+    for name in ('below_min_lap', 'inaccurate', 'missing_time', 'outliers'):
+        metrics.record_rows(f'lap_filter:{name}', rows, rows - stats[name])
+        rows -= stats[name]
+
+
+def clean_laps(laps: pd.DataFrame, strategy: Optional[str] = None,
+               scope: Optional[str] = None) -> Tuple[pd.Series, Dict[str, int]]:
+    """
+    Builds the pace-analysis lap mask in a single pass over the laps.
+
+    All filters (minimum lap number, IsAccurate, missing lap time and the
+    outlier cutoff) are combined into one boolean mask; no intermediate
+    filtered frames are created. Outlier statistics are computed over the
+    laps that survive the basic filters, globally or per driver/team.
+
+    Args:
+        laps: Laps with 'LapTimeSeconds' (see helpers.prepare_laps).
+        strategy: One of OUTLIER_STRATEGIES (default: config.PACE_OUTLIER_STRATEGY).
+        scope: One of OUTLIER_SCOPES (default: config.PACE_OUTLIER_SCOPE).
+
+    Returns:
+        A tuple of (mask aligned with `laps`, filter statistics). The
+        statistics count input laps, laps removed by each filter in order,
+        and laps kept.
+    """
+    strategy = strategy or config.PACE_OUTLIER_STRATEGY
+    scope = scope or config.PACE_OUTLIER_SCOPE
+    if scope not in OUTLIER_SCOPES:
+        raise ValueError(f"Unknown outlier scope '{scope}'. Choose from {OUTLIER_SCOPES}.")
+
+    stats = {'input': len(laps), 'below_min_lap': 0, 'inaccurate': 0,
+             'missing_time': 0, 'outliers': 0, 'kept': 0}
+    if config.COL_LAP_TIME_SECONDS not in laps.columns:
+        return pd.Series(False, index=laps.index), stats
+
+    seconds = laps[config.COL_LAP_TIME_SECONDS]
+    mask = pd.Series(True, index=laps.index)
+
+    if config.COL_LAP_NUMBER in laps.columns:
+        lap_ok = (laps[config.COL_LAP_NUMBER] >= config.MIN_LAP_NUMBER_PACE).to_numpy(dtype=bool, na_value=False)
+        stats['below_min_lap'] = int((~lap_ok).sum())
+        mask &= lap_ok
+    if config.COL_IS_ACCURATE in laps.columns:
+        accurate = laps[config.COL_IS_ACCURATE].eq(True).to_numpy(dtype=bool, na_value=False)
+        stats['inaccurate'] = int((mask.to_numpy() & ~accurate).sum())
+        mask &= accurate
+    else:
+        logger.warning(f"'{config.COL_IS_ACCURATE}' column not found. Pace calculation might be less accurate.")
+    has_time = seconds.notna().to_numpy()
+    stats['missing_time'] = int((mask.to_numpy() & ~has_time).sum())
+    mask &= has_time
+
+    if not mask.any():
+        logger.warning("No valid laps remaining after initial filtering.")
+        _record_filter_rows(stats)
+        return mask, stats
+
+    # --- Outlier Filtering (statistics over the laps that passed so far) ---
+    keys = None
+    if scope == 'driver':
+        keys = laps[config.COL_DRIVER]
+    elif scope == 'team':
+        keys = laps[config.COL_TEAM]
+    candidate_seconds = seconds.where(mask)
+    within = _outlier_mask(candidate_seconds, keys, strategy).to_numpy()
+    stats['outliers'] = int((mask.to_numpy() & ~within).sum())
+    mask &= within
+    stats['kept'] = int(mask.sum())
+    _record_filter_rows(stats)
+
+    if strategy == 'median' and scope == 'global':
+        cutoff_time = candidate_seconds.median() * config.PACE_FILTER_THRESHOLD
+        logger.info(f"Filtered laps slower than {config.PACE_FILTER_THRESHOLD:.0%} of median ({formatting.format_timedelta(pd.Timedelta(seconds=cutoff_time))}).")
+    logger.info(f"Lap cleaning ({strategy}, {scope}): kept {stats['kept']} of {stats['input']} laps "
+                f"(lap number: -{stats['below_min_lap']}, inaccurate: -{stats['inaccurate']}, "
+                f"no time: -{stats['missing_time']}, outliers: -{stats['outliers']}).")
+    return mask, stats
@@ -0,0 +1,78 @@
+# f1_analysis_dashboard/src/utils/logging_setup.py
+import logging
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Iterable, List, TextIO
+
+# Per-thread list of held-back records while buffer_thread_logs is active
+_buffers = threading.local()
+
+
+def setup_logging(stream: TextIO = sys.stdout):
+    """
+    Configures console logging for the command-line entry points.
+
+    Called from each script's main(); importing the package never touches
+    the logging configuration.
+
+    Args:
+        stream: Where log lines go (stdout by default; stderr keeps stdout machine-readable).
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=[
+            logging.StreamHandler(stream) # Output logs to console
+            # Optionally add FileHandler here
+            # logging.FileHandler("f1_analysis.log")
+        ]
+    )
+    # Silence excessive matplotlib/fastf1 logs if desired
+    logging.getLogger('matplotlib').setLevel(logging.WARNING)
+    logging.getLogger('fastf1').setLevel(logging.INFO) # Keep FastF1 INFO for loading status
+
+
+class _ThreadBufferFilter(logging.Filter):
+    """Handler filter that diverts records of buffering threads into their buffer."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = getattr(_buffers, 'records', None)
+        if buffer is None:
+            return True
+        if not buffer or buffer[-1] is not record: # Once per record, however many handlers see it
+            buffer.append(record)
+        return False
+
+
+_BUFFER_FILTER = _ThreadBufferFilter()
+
+
+@contextmanager
+def buffer_thread_logs():
+    """
+    Holds back the log records emitted by the current thread.
+
+    Used by worker threads that run next to each other, so each one's log
+    lines can be written together (replay_logs) instead of interleaving.
+    Filters run in the emitting thread, so other threads log as usual.
+
+    Yields:
+        The list the held-back records are appended to.
+    """
+    for handler in logging.getLogger().handlers:
+        if _BUFFER_FILTER not in handler.filters:
+            handler.addFilter(_BUFFER_FILTER)
+    records: List[logging.LogRecord] = []
+    _buffers.records = records
+    try:
+        yield records
+    finally:
+        _buffers.records = None
+
+
+def replay_logs(records: Iterable[logging.LogRecord]):
+    """Passes records held back by buffer_thread_logs to their loggers' handlers."""
+    for record in records:
+        logging.getLogger(record.name).handle(record)
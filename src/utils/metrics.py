@@ -0,0 +1,201 @@
+# f1_analysis_dashboard/src/utils/metrics.py
+import bisect
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Metrics are collected in-process for the whole run and exported once at the end
+# (config.METRICS_FILE); nothing is served. Every series gets a 'session' label
+# from the active session_scope, so scheduled runs can be trended per session.
+
+SECONDS_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+BYTES_BUCKETS: Tuple[float, ...] = (1e4, 2.5e4, 5e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7)
+METRICS_FORMATS = ('prometheus', 'jsonl')
+
+_PREFIX = 'f1_dashboard_'
+
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_lock = threading.Lock()
+_counters: Dict[SeriesKey, float] = {}
+_histograms: Dict[SeriesKey, Dict[str, Any]] = {}
+_session: contextvars.ContextVar = contextvars.ContextVar('metrics_session', default=None)
+
+
+def _key(name: str, labels: Dict[str, Any]) -> SeriesKey:
+    session = _session.get()
+    if session is not None and 'session' not in labels:
+        labels = dict(labels, session=session)
+    return _PREFIX + name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+@contextlib.contextmanager
+def session_scope(session: Optional[str]) -> Iterator[None]:
+    """Adds a 'session' label to every metric recorded in the enclosed block (current thread only)."""
+    token = _session.set(session)
+    try:
+        yield
+    finally:
+        _session.reset(token)
+
+
+def current_session() -> Optional[str]:
+    return _session.get()
+
+
+def inc(name: str, value: float = 1.0, **labels: Any):
+    """Adds `value` to a counter."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0.0) + value
+
+
+def observe(name: str, value: float, buckets: Sequence[float] = SECONDS_BUCKETS, **labels: Any):
+    """Records one observation in a histogram."""
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {'buckets': list(buckets), 'counts': [0] * (len(buckets) + 1),
+                                            'sum': 0.0, 'count': 0}
+        histogram['counts'][bisect.bisect_left(histogram['buckets'], value)] += 1
+        histogram['sum'] += value
+        histogram['count'] += 1
+
+
+def record_rows(stage: str, rows_in: int, rows_out: int):
+    """Counts the rows entering and leaving a filtering stage."""
+    inc('rows_in_total', rows_in, stage=stage)
+    inc('rows_out_total', rows_out, stage=stage)
+
+
+@contextlib.contextmanager
+def timed(name: str, **labels: Any) -> Iterator[None]:
+    """Observes the wall time of the enclosed block in the seconds histogram `name`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+
+# --- Transfer between processes ---
+def take() -> Dict[str, Any]:
+    """Returns and clears everything recorded so far (e.g. in a worker process, for merge())."""
+    global _counters, _histograms
+    with _lock:
+        state = {'counters': list(_counters.items()), 'histograms': list(_histograms.items())}
+        _counters, _histograms = {}, {}
+    return state
+
+
+def merge(state: Dict[str, Any]):
+    """Adds the metrics returned by take() in another process to this process."""
+    with _lock:
+        for key, value in state['counters']:
+            _counters[key] = _counters.get(key, 0.0) + value
+        for key, other in state['histograms']:
+            histogram = _histograms.get(key)
+            if histogram is None:
+                _histograms[key] = {**other, 'counts': list(other['counts'])}
+                continue
+            histogram['counts'] = [a + b for a, b in zip(histogram['counts'], other['counts'])]
+            histogram['sum'] += other['sum']
+            histogram['count'] += other['count']
+
+
+def reset():
+    """Drops everything recorded so far."""
+    take()
+
+
+# --- Export ---
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def to_prometheus() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted(_histograms.items())
+    lines = []
+    typed = set()
+    for (name, labels), value in counters:
+        if name not in typed:
+            lines.append(f"# TYPE {name} counter")
+            typed.add(name)
+        lines.append(f"{name}{_format_labels(labels)} {value:g}")
+    for (name, labels), histogram in histograms:
+        if name not in typed:
+            lines.append(f"# TYPE {name} histogram")
+            typed.add(name)
+        cumulative = 0
+        bounds = [f'{bound:g}' for bound in histogram['buckets']] + ['+Inf']
+        for bound, count in zip(bounds, histogram['counts']):
+            cumulative += count # Prometheus buckets are cumulative
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', bound),))} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {histogram['sum']:g}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+    return '\n'.join(lines) + '\n'
+
+
+def to_records() -> Iterator[Dict[str, Any]]:
+    """One JSON-serialisable record per metric series."""
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted(_histograms.items())
+    for (name, labels), value in counters:
+        yield {'metric': name, 'type': 'counter', 'labels': dict(labels), 'value': value}
+    for (name, labels), histogram in histograms:
+        yield {'metric': name, 'type': 'histogram', 'labels': dict(labels), 'buckets': histogram['buckets'],
+               'counts': histogram['counts'], 'sum': histogram['sum'], 'count': histogram['count']}
+
+
+def export(path: Path, fmt: Optional[str] = None) -> bool:
+    """
+    Writes all metrics recorded in this run.
+
+    'prometheus' atomically replaces `path` (for node_exporter's textfile
+    collector); 'jsonl' appends one line per series, stamped with the run
+    time, so the file accumulates a history across runs. Without `fmt`, files
+    ending in '.jsonl' use JSON lines and everything else Prometheus.
+
+    Returns:
+        True if the file was written.
+    """
+    fmt = fmt or ('jsonl' if path.suffix == '.jsonl' else 'prometheus')
+    if fmt not in METRICS_FORMATS:
+        logger.error(f"Unknown metrics format '{fmt}'. Choose from {METRICS_FORMATS}.")
+        return False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == 'prometheus':
+            tmp_path = path.with_name(path.name + '.tmp')
+            tmp_path.write_text(to_prometheus())
+            os.replace(tmp_path, path) # The collector must never read a partial file
+        else:
+            timestamp = time.time()
+            with open(path, 'a', encoding='utf-8') as f:
+                for record in to_records():
+                    f.write(json.dumps({'timestamp': timestamp, **record}) + '\n')
+        logger.info(f"Metrics written to {path} ({fmt}).")
+        return True
+    except OSError as e:
+        logger.error(f"Failed to write metrics to '{path}': {e}")
+        return False
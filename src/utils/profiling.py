@@ -0,0 +1,100 @@
+# f1_analysis_dashboard/src/utils/profiling.py
+import cProfile
+import contextlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from f1_analysis_dashboard.src.utils import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimer:
+    """
+    Records wall-clock and CPU time of the named stages of one session run.
+
+    Every stage's wall time is also exported as the 'stage_seconds' metric.
+
+    Stages may be nested (e.g. each plot inside the report stage); nested
+    stages are indented in the summary and not added to the total. CPU time is
+    the CPU time of the calling thread, so sessions analysed in worker threads
+    are measured independently.
+
+    With `cprofile`, a cProfile profiler runs for the duration of every stage
+    and can be written out with :meth:`dump_stats`. Only one profiler can be
+    active at a time, so profile one session at a time.
+    """
+
+    def __init__(self, label: str, cprofile: bool = False):
+        self.label = label
+        self.records: List[Dict[str, Any]] = []
+        self.profiler = cProfile.Profile() if cprofile else None
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as stage `name`."""
+        record = {'stage': name, 'depth': self._depth, 'wall_s': 0.0, 'cpu_s': 0.0}
+        self.records.append(record) # Appended first so nested stages follow their parent
+        if self.profiler is not None and self._depth == 0:
+            self.profiler.enable()
+        self._depth += 1
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            record['wall_s'] = time.perf_counter() - wall_start
+            record['cpu_s'] = time.thread_time() - cpu_start
+            metrics.observe('stage_seconds', record['wall_s'], stage=name)
+            self._depth -= 1
+            if self.profiler is not None and self._depth == 0:
+                self.profiler.disable()
+
+    def total(self) -> Dict[str, float]:
+        """Summed wall and CPU seconds of all top-level stages."""
+        top_level = [record for record in self.records if record['depth'] == 0]
+        return {'wall_s': sum(r['wall_s'] for r in top_level), 'cpu_s': sum(r['cpu_s'] for r in top_level)}
+
+    def summary_table(self) -> str:
+        """Fixed-width table of every stage with its share of the total wall time."""
+        total = self.total()
+        width = max([len('  ' * r['depth'] + r['stage']) for r in self.records] + [len('Stage'), len('Total')])
+        lines = [f"{'Stage':<{width}}  {'Wall (s)':>9}  {'CPU (s)':>9}  {'Wall %':>6}"]
+        lines.append('-' * len(lines[0]))
+        for record in self.records:
+            share = record['wall_s'] / total['wall_s'] if total['wall_s'] else 0.0
+            name = '  ' * record['depth'] + record['stage']
+            lines.append(f"{name:<{width}}  {record['wall_s']:9.3f}  {record['cpu_s']:9.3f}  {share:6.1%}")
+        lines.append('-' * len(lines[0]))
+        lines.append(f"{'Total':<{width}}  {total['wall_s']:9.3f}  {total['cpu_s']:9.3f}  {1:6.0%}")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'label': self.label, 'stages': self.records, 'total': self.total()}
+
+    def write_report(self, path: Path) -> bool:
+        """Writes the timings as JSON. Returns True on success."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.to_dict(), indent=2))
+            logger.info(f"Timing report written: {path}")
+            return True
+        except OSError as e:
+            logger.error(f"Failed to write timing report '{path}': {e}")
+            return False
+
+    def dump_stats(self, path: Path) -> Optional[Path]:
+        """Writes the collected cProfile statistics (if profiling was enabled)."""
+        if self.profiler is None:
+            return None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.profiler.dump_stats(str(path))
+            logger.info(f"cProfile statistics written: {path} (inspect with `python -m pstats {path}`)")
+            return path
+        except OSError as e:
+            logger.error(f"Failed to write cProfile statistics '{path}': {e}")
+            return None
@@ -0,0 +1,50 @@
+# f1_analysis_dashboard/tests/fixtures.py
+import contextlib
+from typing import Dict, Optional
+from unittest import mock
+
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks.synthetic import TEAM_NAMES
+
+
+def laps_from_times(times: Dict[str, list], pit_stops: Optional[list] = None) -> pd.DataFrame:
+    """
+    Minimal laps frame from hand-picked lap completion times.
+
+    Args:
+        times: Driver -> session time (seconds) at which each lap was completed, from lap 1.
+        pit_stops: Optional (driver, in-lap) pairs. Adds PitInTime on the in-lap and
+                   PitOutTime on the following lap, as FastF1 does (NaT elsewhere).
+
+    Returns:
+        Laps with Driver, LapNumber, Time (timedelta) and Team ('Team <driver>').
+    """
+    rows = [(driver, lap, pd.Timedelta(seconds=time))
+            for driver, driver_times in times.items() for lap, time in enumerate(driver_times, start=1)]
+    laps = pd.DataFrame(rows, columns=[config.COL_DRIVER, config.COL_LAP_NUMBER, config.COL_TIME])
+    laps[config.COL_TEAM] = 'Team ' + laps[config.COL_DRIVER]
+    if pit_stops is not None:
+        lap_keys = laps.set_index([config.COL_DRIVER, config.COL_LAP_NUMBER]).index
+        in_laps = lap_keys.isin(list(pit_stops))
+        out_laps = lap_keys.isin([(driver, lap + 1) for driver, lap in pit_stops])
+        laps['PitInTime'] = laps[config.COL_TIME].where(in_laps)
+        laps['PitOutTime'] = laps[config.COL_TIME].where(out_laps)
+    return laps
+
+
+@contextlib.contextmanager
+def offline_colors():
+    """
+    Replaces FastF1's driver/team colour lookups with a fixed table.
+
+    The real lookups fetch the driver list of the session from the F1 API,
+    which tests must not need.
+    """
+    team_colors = {team: f"#{(i * 0x19a3f1) % 0xffffff:06x}" for i, team in enumerate(TEAM_NAMES)}
+    with mock.patch('fastf1.plotting.get_driver_color_mapping', return_value={}), \
+            mock.patch('fastf1.plotting.list_team_names', return_value=list(TEAM_NAMES)), \
+            mock.patch('fastf1.plotting.get_team_color', side_effect=lambda team, **kwargs: team_colors.get(team)), \
+            mock.patch('fastf1.plotting.get_driver_color', return_value=None):
+        yield
@@ -0,0 +1,166 @@
+# f1_analysis_dashboard/tests/test_analysis_logic.py
+import unittest
+import pandas as pd
+
+# Analysis modules import the package by name, so run from the directory
+# containing `f1_analysis_dashboard` (e.g. `python -m pytest f1_analysis_dashboard/tests`).
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import data_loader
+from f1_analysis_dashboard.src.analysis import lap_analysis, pace_analysis, results_analysis
+from f1_analysis_dashboard.src.utils import compact_schema, helpers, lap_cleaning
+
+
+class MockSession:
+    """Minimal stand-in for a loaded FastF1 Session (laps + results only)."""
+
+    def __init__(self, laps: pd.DataFrame, results: pd.DataFrame, name: str = 'Race'):
+        self.laps = laps
+        self.results = results
+        self.name = name
+
+
+def make_mock_session(n_laps: int = 10) -> MockSession:
+    drivers = {'VER': 'Red Bull Racing', 'PER': 'Red Bull Racing',
+               'ALO': 'Aston Martin', 'HAM': 'Mercedes'}
+    base = {'VER': 90.0, 'PER': 90.5, 'ALO': 91.0, 'HAM': 91.5}
+    rows = []
+    for driver in drivers:
+        for lap in range(1, n_laps + 1):
+            seconds = base[driver] + 0.01 * lap
+            if lap == 1:
+                seconds += 10.0 # Standing start
+            if driver == 'HAM' and lap == 5:
+                seconds = 130.0 # Pit lap outlier
+            rows.append({
+                config.COL_DRIVER: driver,
+                config.COL_LAP_NUMBER: float(lap),
+                config.COL_LAP_TIME: pd.Timedelta(seconds=seconds),
+                config.COL_SECTOR1: pd.Timedelta(seconds=seconds * 0.3),
+                config.COL_SECTOR2: pd.Timedelta(seconds=seconds * 0.4),
+                config.COL_SECTOR3: pd.Timedelta(seconds=seconds * 0.3),
+                config.COL_IS_ACCURATE: lap != 3,
+                config.COL_COMPOUND: 'MEDIUM',
+                config.COL_TYRE_LIFE: float(lap),
+            })
+    laps = pd.DataFrame(rows)
+    results = pd.DataFrame({
+        config.COL_ABBREVIATION: list(drivers),
+        config.COL_TEAM_NAME: list(drivers.values()),
+    })
+    return MockSession(laps, results)
+
+
+class TestPreparedLaps(unittest.TestCase):
+
+    def test_prepare_laps_fills_team_and_seconds(self):
+        session = make_mock_session()
+        prepared = helpers.prepare_laps(session)
+        self.assertIn(config.COL_TEAM, prepared.laps.columns)
+        self.assertNotIn(config.COL_TEAM, session.laps.columns) # Original untouched
+        self.assertAlmostEqual(prepared.laps[config.COL_LAP_TIME_SECONDS].iloc[1], 90.02)
+
+    def test_pace_mask_filters(self):
+        prepared = helpers.prepare_laps(make_mock_session())
+        pace_laps = prepared.pace_laps
+        self.assertTrue((pace_laps[config.COL_LAP_NUMBER] >= config.MIN_LAP_NUMBER_PACE).all())
+        self.assertTrue(pace_laps[config.COL_IS_ACCURATE].all())
+        self.assertLess(pace_laps[config.COL_LAP_TIME_SECONDS].max(), 100.0)
+
+    def test_analyses_share_prepared_laps(self):
+        session = make_mock_session()
+        prepared = helpers.prepare_laps(session)
+        shared = pace_analysis.get_constructor_race_pace(session, prepared)
+        standalone = pace_analysis.get_constructor_race_pace(session)
+        pd.testing.assert_series_equal(shared, standalone)
+        self.assertEqual(shared.index[0], 'Red Bull Racing')
+
+        fastest = lap_analysis.get_driver_fastest_laps(session, prepared)
+        self.assertEqual(fastest[config.COL_DRIVER].tolist(), ['VER', 'PER', 'ALO', 'HAM'])
+        overall = lap_analysis.get_overall_fastest_lap(session, prepared)
+        self.assertEqual(overall['LapTimeStr'], '01:30.020')
+
+        driver_laps = pace_analysis.get_driver_race_laps(session, prepared)
+        self.assertNotIn(130.0, driver_laps[config.COL_LAP_TIME_SECONDS].values)
+
+
+
+class TestLapCleaning(unittest.TestCase):
+
+    def setUp(self):
+        self.laps = helpers.prepare_laps(make_mock_session()).laps
+
+    def test_stats_account_for_every_lap(self):
+        mask, stats = lap_cleaning.clean_laps(self.laps)
+        removed = stats['below_min_lap'] + stats['inaccurate'] + stats['missing_time'] + stats['outliers']
+        self.assertEqual(stats['input'] - removed, stats['kept'])
+        self.assertEqual(stats['kept'], int(mask.sum()))
+        self.assertEqual(stats['below_min_lap'], 4)
+        self.assertEqual(stats['outliers'], 1) # HAM pit lap
+
+    def test_per_driver_strategies_remove_pit_lap(self):
+        for strategy in lap_cleaning.OUTLIER_STRATEGIES:
+            mask, _ = lap_cleaning.clean_laps(self.laps, strategy=strategy, scope='driver')
+            kept = self.laps[mask]
+            self.assertNotIn(130.0, kept[config.COL_LAP_TIME_SECONDS].values, strategy)
+            self.assertEqual(kept[config.COL_DRIVER].nunique(), 4, strategy)
+
+    def test_unknown_strategy_raises(self):
+        with self.assertRaises(ValueError):
+            lap_cleaning.clean_laps(self.laps, strategy='zscore')
+
+
+class TestCompactSchema(unittest.TestCase):
+
+    def test_compact_laps_are_smaller_and_give_same_results(self):
+        session = make_mock_session(n_laps=50)
+        for column in (config.COL_SECTOR1, config.COL_SECTOR2, config.COL_SECTOR3):
+            session.laps[column] = session.laps[column].dt.round('ms') # Millisecond timing, as from FastF1
+        compact = MockSession(compact_schema.compact_frame(session.laps, compact_schema.LAPS_SCHEMA),
+                              session.results)
+        self.assertEqual(compact.laps[config.COL_LAP_NUMBER].dtype, 'int16')
+        self.assertEqual(compact.laps[config.COL_LAP_TIME].dtype, 'float32')
+        self.assertIsInstance(compact.laps[config.COL_DRIVER].dtype, pd.CategoricalDtype)
+        self.assertLess(compact_schema.frame_memory_bytes(compact.laps),
+                        compact_schema.frame_memory_bytes(session.laps))
+
+        expected = lap_analysis.get_driver_fastest_laps(session)
+        actual = lap_analysis.get_driver_fastest_laps(compact)
+        self.assertEqual(actual['LapTimeStr'].tolist(), expected['LapTimeStr'].tolist())
+        time_strings = ['LapTimeStr', 'Sector1Str', 'Sector2Str', 'Sector3Str']
+        self.assertEqual(lap_analysis.get_overall_fastest_lap(compact)[time_strings].tolist(),
+                         lap_analysis.get_overall_fastest_lap(session)[time_strings].tolist())
+        self.assertEqual(list(pace_analysis.get_constructor_race_pace(compact).index),
+                         list(pace_analysis.get_constructor_race_pace(session).index))
+
+
+class TestRequiredComponents(unittest.TestCase):
+
+    def test_results_only_skips_laps(self):
+        load_config = data_loader.required_load_config([results_analysis.get_official_results])
+        self.assertEqual(load_config, {'laps': False, 'telemetry': False, 'weather': False, 'messages': False})
+
+    def test_union_of_analyses(self):
+        load_config = data_loader.required_load_config([
+            results_analysis.get_official_results, pace_analysis.get_constructor_race_pace])
+        self.assertTrue(load_config['laps'])
+        self.assertFalse(load_config['telemetry'])
+
+    def test_undeclared_analysis_loads_everything(self):
+        load_config = data_loader.required_load_config([lambda session: None])
+        self.assertTrue(all(load_config.values()))
+
+
+class TestSyntheticSession(unittest.TestCase):
+    """The benchmark sessions must stay usable by every analysis."""
+
+    def test_analyses_run_on_synthetic_session(self):
+        from f1_analysis_dashboard.benchmarks import synthetic
+        session = synthetic.make_session(n_drivers=22, n_laps=12)
+        self.assertEqual(len(results_analysis.get_official_results(session)), 22)
+        self.assertEqual(len(lap_analysis.get_driver_fastest_laps(session)), 22)
+        self.assertEqual(len(pace_analysis.get_constructor_race_pace(session)), len(synthetic.TEAM_NAMES))
+        self.assertIsNotNone(lap_analysis.get_overall_fastest_lap(session))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# f1_analysis_dashboard/tests/test_async_api.py
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src import async_api
+from f1_analysis_dashboard.src.analysis import lap_analysis, results_analysis
+
+
+class TestAsyncAPI(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.session = synthetic.make_session(n_drivers=20, n_laps=20)
+        self.calls = []
+
+        def slow_load(year, event, session_identifier, load_config=None):
+            self.calls.append((year, event, session_identifier, load_config))
+            self.release.wait(5)
+            return self.session
+
+        patch = mock.patch.object(async_api.data_loader, 'load_session_data', side_effect=slow_load)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(async_api.shutdown)
+        self.addCleanup(self.release.set)
+
+    def test_concurrent_loads_are_deduplicated(self):
+        async def scenario():
+            loads = [asyncio.ensure_future(async_api.load_session_async(2023, 'Jeddah', 'R')) for _ in range(3)]
+            other = asyncio.ensure_future(async_api.load_session_async(2023, 'Jeddah', 'Q'))
+            await asyncio.sleep(0.05)
+            self.release.set()
+            return await asyncio.gather(*loads, other)
+
+        results = asyncio.run(scenario())
+        self.assertTrue(all(session is self.session for session in results))
+        self.assertEqual(sorted(call[2] for call in self.calls), ['Q', 'R'])
+
+    def test_timeout_and_cancellation_leave_shared_load_running(self):
+        async def scenario():
+            waiter = asyncio.ensure_future(async_api.load_session_async(2023, 'Jeddah', 'R'))
+            cancelled = asyncio.ensure_future(async_api.load_session_async(2023, 'Jeddah', 'R'))
+            with self.assertRaises(asyncio.TimeoutError):
+                await async_api.load_session_async(2023, 'Jeddah', 'R', timeout=0.05)
+            cancelled.cancel()
+            self.release.set()
+            return await waiter
+
+        self.assertIs(asyncio.run(scenario()), self.session)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_analyse_session_async(self):
+        self.release.set()
+        analyses = {'driver_fastest': lap_analysis.get_driver_fastest_laps,
+                    'official_results': results_analysis.get_official_results}
+        results = asyncio.run(async_api.analyse_session_async(2023, 'Jeddah', 'R', analyses, timeout=30))
+        self.assertEqual(len(results['driver_fastest']), 20)
+        self.assertIsNotNone(results['official_results'])
+        self.assertEqual(self.calls[0][3], {'laps': True, 'telemetry': False, 'weather': False, 'messages': False})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# f1_analysis_dashboard/tests/test_degradation.py
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import degradation_analysis
+from f1_analysis_dashboard.src.utils import compact_schema, helpers
+
+
+class TestStints(unittest.TestCase):
+
+    def test_stints_from_compound_and_tyre_life(self):
+        laps = pd.DataFrame({
+            config.COL_DRIVER: ['AAA'] * 6 + ['BBB'] * 3,
+            config.COL_LAP_NUMBER: [1, 2, 3, 4, 5, 6, 1, 2, 3],
+            config.COL_COMPOUND: ['SOFT', 'SOFT', 'MEDIUM', 'MEDIUM', 'MEDIUM', 'MEDIUM', 'HARD', 'HARD', 'HARD'],
+            config.COL_TYRE_LIFE: [1, 2, 1, 2, 1, 2, 5, 6, np.nan], # AAA: fresh mediums on lap 5
+        }).sample(frac=1, random_state=1) # Order must not matter
+        stints = degradation_analysis.assign_stints(laps)
+        self.assertTrue(stints.index.equals(laps.index))
+        self.assertEqual(stints.sort_index().tolist(), [1, 1, 2, 2, 3, 3, 1, 1, 1])
+
+    def test_fastf1_stint_column_is_used(self):
+        laps = pd.DataFrame({config.COL_DRIVER: ['AAA'] * 2, config.COL_LAP_NUMBER: [1, 2],
+                             config.COL_COMPOUND: ['SOFT'] * 2, config.COL_TYRE_LIFE: [1, 2], 'Stint': [1.0, 2.0]})
+        self.assertEqual(degradation_analysis.assign_stints(laps).tolist(), [1, 2])
+
+
+class TestDegradationFit(unittest.TestCase):
+
+    def setUp(self):
+        self.session = synthetic.make_session(n_drivers=20, n_laps=57)
+        prepared = helpers.prepare_laps(self.session)
+        stints = degradation_analysis.assign_stints(prepared.laps)
+        self.pace_laps = prepared.pace_laps.assign(Stint=stints[prepared.pace_mask])
+
+    def _polyfit(self, row, degree):
+        stint = self.pace_laps[(self.pace_laps[config.COL_DRIVER] == row[config.COL_DRIVER])
+                               & (self.pace_laps['Stint'] == row['Stint'])]
+        tyre_life = stint[config.COL_TYRE_LIFE]
+        return np.polyfit(tyre_life - tyre_life.mean(), stint[config.COL_LAP_TIME_SECONDS], degree)[::-1]
+
+    def test_batched_fit_matches_per_stint_polyfit(self):
+        for degree in (1, 2):
+            fitted = degradation_analysis.fit_degradation(self.pace_laps, degree=degree)
+            self.assertEqual(len(fitted), 60) # 20 drivers x 3 stints
+            for _, row in fitted.sample(5, random_state=0).iterrows():
+                expected = self._polyfit(row, degree)
+                self.assertAlmostEqual(row['MeanLapTimeSeconds'], expected[0], places=6)
+                self.assertAlmostEqual(row['DegRate'], expected[1], places=6)
+                if degree == 2:
+                    self.assertAlmostEqual(row['Curvature'], expected[2], places=6)
+        # The synthetic tyres lose 0.05 s per lap
+        self.assertAlmostEqual(fitted['DegRate'].median(), 0.05, delta=0.01)
+
+    def test_underdetermined_stints_are_dropped(self):
+        laps = self.pace_laps.copy()
+        laps[config.COL_TYRE_LIFE] = 3.0 # No spread in tyre age: slope undefined
+        self.assertIsNone(degradation_analysis.fit_degradation(laps))
+
+    def test_analysis_with_compact_dtypes(self):
+        expected = degradation_analysis.get_tyre_degradation(self.session)
+        self.session.laps = compact_schema.compact_frame(self.session.laps, compact_schema.LAPS_SCHEMA)
+        compact = degradation_analysis.get_tyre_degradation(self.session)
+        self.assertEqual(compact[config.COL_DRIVER].tolist(), expected[config.COL_DRIVER].tolist())
+        np.testing.assert_allclose(compact['DegRate'], expected['DegRate'], atol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
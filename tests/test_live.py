@@ -0,0 +1,78 @@
+# f1_analysis_dashboard/tests/test_live.py
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from f1_analysis_dashboard import config, live
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import lap_analysis, pace_analysis
+from f1_analysis_dashboard.src.analysis.live_analysis import LiveLapAnalysis
+from f1_analysis_dashboard.src.utils import helpers
+
+
+class _PartialSession:
+    """The synthetic session cut to the laps completed so far."""
+
+    def __init__(self, session, laps):
+        self.laps = laps
+        self.results = session.results
+        self.event = session.event
+        self.name = session.name
+
+
+def _batch(session):
+    prepared = helpers.prepare_laps(session)
+    return (lap_analysis.get_driver_fastest_laps(session, prepared),
+            pace_analysis.get_constructor_race_pace(session, prepared))
+
+
+class TestLiveAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        self.session = synthetic.make_session(n_drivers=20, n_laps=30)
+        self.laps = self.session.laps.sort_values(config.COL_TIME, kind='stable')
+
+    def _assert_matches_batch(self, engine, session):
+        fastest, pace = _batch(session)
+        pd.testing.assert_frame_equal(engine.driver_fastest_laps(), fastest)
+        pd.testing.assert_series_equal(engine.constructor_pace(), pace, check_index_type=False)
+
+    def test_matches_batch_analyses_while_laps_arrive(self):
+        engine = LiveLapAnalysis()
+        midpoint = self.laps[config.COL_TIME].median()
+        engine.ingest_frame(self.laps[self.laps[config.COL_TIME] <= midpoint])
+        self._assert_matches_batch(engine, _PartialSession(self.session, self.laps[self.laps[config.COL_TIME] <= midpoint]))
+
+        engine.ingest_frame(self.laps[self.laps[config.COL_TIME] > midpoint])
+        self.assertEqual(engine.laps_ingested, len(self.laps))
+        self._assert_matches_batch(engine, self.session)
+
+    def test_feed_file_and_socket_replay(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            feed = Path(tmp) / 'feed.jsonl'
+            self.assertEqual(live.record_feed(self.session.laps, feed), len(self.laps))
+
+            updates = []
+            engine = live.run_live(live.read_feed(feed), LiveLapAnalysis(),
+                                   lambda engine: updates.append(engine.last_lap_number))
+            self.assertEqual(updates, list(range(1, 31)) + [30]) # Per leader lap, then the rest of the field
+            expected = _batch(self.session)[1]
+            pd.testing.assert_series_equal(engine.constructor_pace(), expected, check_index_type=False, atol=1e-6)
+
+            server = live.make_feed_server(feed, '127.0.0.1', 0)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self.addCleanup(server.server_close)
+            self.addCleanup(server.shutdown)
+            rows = list(live.read_socket(*server.server_address, timeout=10))
+            self.assertEqual(rows, list(live.read_feed(feed)))
+        socket_engine = LiveLapAnalysis()
+        socket_engine.ingest(rows)
+        pd.testing.assert_series_equal(socket_engine.constructor_pace(), engine.constructor_pace())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# f1_analysis_dashboard/tests/test_metrics.py
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from f1_analysis_dashboard import main
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import pace_analysis
+from f1_analysis_dashboard.src.utils import helpers, metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+
+    def test_prometheus_text(self):
+        with metrics.session_scope('2023_Jeddah_R'):
+            metrics.inc('plots_skipped_total', plot='pace')
+            metrics.observe('stage_seconds', 0.3, stage='load')
+            metrics.observe('stage_seconds', 7.0, stage='load')
+        text = metrics.to_prometheus()
+        self.assertIn('# TYPE f1_dashboard_plots_skipped_total counter', text)
+        self.assertIn('f1_dashboard_plots_skipped_total{plot="pace",session="2023_Jeddah_R"} 1', text)
+        self.assertIn('f1_dashboard_stage_seconds_bucket{session="2023_Jeddah_R",stage="load",le="0.5"} 1', text)
+        self.assertIn('f1_dashboard_stage_seconds_bucket{session="2023_Jeddah_R",stage="load",le="+Inf"} 2', text)
+        self.assertIn('f1_dashboard_stage_seconds_count{session="2023_Jeddah_R",stage="load"} 2', text)
+
+    def test_take_and_merge(self):
+        metrics.observe('plot_bytes', 2e5, buckets=metrics.BYTES_BUCKETS, plot='pace')
+        worker_state = metrics.take() # As returned by a worker process
+        self.assertEqual(list(metrics.to_records()), [])
+        metrics.merge(worker_state)
+        metrics.merge(worker_state)
+        record, = metrics.to_records()
+        self.assertEqual(record['count'], 2)
+
+    def test_lap_filters_record_rows(self):
+        session = synthetic.make_session(n_drivers=20, n_laps=30)
+        prepared = helpers.prepare_laps(session)
+        kept = len(prepared.pace_laps)
+        counters = {(r['metric'], r['labels']['stage']): r['value'] for r in metrics.to_records() if r['type'] == 'counter'}
+        self.assertEqual(counters[('f1_dashboard_rows_in_total', 'lap_filter:below_min_lap')], 600)
+        self.assertEqual(counters[('f1_dashboard_rows_out_total', 'lap_filter:outliers')], kept)
+
+    def test_constructor_pace_records_its_lap_filter(self):
+        session = synthetic.make_session(n_drivers=10, n_laps=30)
+        prepared = helpers.prepare_laps(session)
+        pace = pace_analysis.get_constructor_race_pace(session, prepared)
+        counters = {(r['metric'], r['labels']['stage']): r['value'] for r in metrics.to_records() if r['type'] == 'counter'}
+        self.assertEqual(counters[('f1_dashboard_rows_in_total', 'constructor_pace:pace_mask')], 300)
+        self.assertEqual(counters[('f1_dashboard_rows_out_total', 'constructor_pace:pace_mask')], len(prepared.pace_laps))
+        self.assertLess(len(pace), len(prepared.pace_laps)) # The median per team is not a lap filter
+        self.assertFalse(any(stage.startswith('constructor_pace:') and stage != 'constructor_pace:pace_mask'
+                             for _, stage in counters))
+
+    def test_metrics_format_requires_metrics_file(self):
+        with mock.patch('sys.argv', ['main', '--metrics-format', 'jsonl']), redirect_stderr(StringIO()):
+            with self.assertRaises(SystemExit):
+                main.parse_arguments()
+
+    def test_jsonl_export_appends(self):
+        metrics.inc('session_rows_loaded_total', 1140, frame='laps')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'metrics.jsonl'
+            self.assertTrue(metrics.export(path))
+            self.assertTrue(metrics.export(path))
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]['value'], 1140)
+        self.assertIn('timestamp', lines[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
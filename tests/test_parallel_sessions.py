@@ -0,0 +1,91 @@
+# f1_analysis_dashboard/tests/test_parallel_sessions.py
+import logging
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from itertools import groupby
+from pathlib import Path
+from unittest import mock
+
+from f1_analysis_dashboard import config, main
+from f1_analysis_dashboard.benchmarks import synthetic
+
+SESSION_NAMES = {'FP1': 'Practice 1', 'Q': 'Qualifying', 'R': 'Race'}
+# The first requested session loads slowest, so completion order is the reverse of the request
+LOAD_SECONDS = {'FP1': 0.4, 'Q': 0.2, 'R': 0.05}
+
+
+class SlowLoader:
+    """Stand-in for data_loader.load_session_data that records how many loads overlap."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, year, event, session_type, load_config=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            logging.getLogger(__name__).info(f"Loading {SESSION_NAMES[session_type]}")
+            time.sleep(LOAD_SECONDS[session_type])
+            session = synthetic.make_session(n_drivers=6, n_laps=10)
+            session.name = SESSION_NAMES[session_type]
+            return session
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestParallelSessions(unittest.TestCase):
+
+    def setUp(self):
+        for name, value in (('PLOT_ENABLED', False), ('RESULT_CACHE_ENABLED', False),
+                            ('OUTPUT_JSON', False), ('PROFILE_ENABLED', False)):
+            patch = mock.patch.object(config, name, value)
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_sessions_overlap_and_reports_stay_in_order(self):
+        loader = SlowLoader()
+        output = StringIO()
+        handler = logging.StreamHandler(output)
+        root = logging.getLogger()
+        root.addHandler(handler)
+        self.addCleanup(root.removeHandler, handler)
+        with mock.patch.object(root, 'level', logging.INFO), \
+                mock.patch.object(main.data_loader, 'load_session_data', loader), redirect_stdout(output):
+            main.run_sessions_parallel(2023, 'Synthetic', ['FP1', 'Q', 'R'], jobs=3,
+                                       analyses=['overall_fastest', 'driver_fastest'])
+
+        self.assertGreaterEqual(loader.max_in_flight, 2)
+        # Every log and report line naming a session, in output order: grouped per session, in the requested order
+        mentioned = [(session_type, line.startswith('Loading')) for line in output.getvalue().splitlines()
+                     for session_type, name in SESSION_NAMES.items() if name in line]
+        groups = [(session_type, [logged for _, logged in lines])
+                  for session_type, lines in groupby(mentioned, key=lambda item: item[0])]
+        self.assertEqual([session_type for session_type, _ in groups], ['FP1', 'Q', 'R'])
+        for session_type, logged in groups: # The session's load log, then its report
+            self.assertTrue(logged[0], session_type)
+            self.assertFalse(logged[-1], session_type)
+
+    def test_cache_enabled_once(self):
+        with tempfile.TemporaryDirectory() as cache_dir, \
+                mock.patch.object(config, 'CACHE_ENABLED', True), \
+                mock.patch.object(config, 'CACHE_DIR', Path(cache_dir)), \
+                mock.patch.object(main.data_loader, '_enabled_cache_dir', None), \
+                mock.patch.object(main.data_loader.ff1.Cache, 'enable_cache') as enable_cache:
+            threads = [threading.Thread(target=main.data_loader.setup_fastf1_cache) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        enable_cache.assert_called_once_with(cache_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
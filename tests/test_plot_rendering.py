@@ -0,0 +1,126 @@
+# f1_analysis_dashboard/tests/test_plot_rendering.py
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')
+import fastf1
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src.plotting import palette, plot_generator, render_pool
+from f1_analysis_dashboard.tests.test_session_store import make_event
+
+SESSION_INFO = {'EventName': 'Test Grand Prix', 'SessionName': 'Race', 'Year': 2023}
+PACE = pd.Series([92.5, 92.1, 93.0], index=pd.Index(['Red Bull Racing', 'Ferrari', 'Mercedes'], name=config.COL_TEAM))
+
+
+class TestPlotRendering(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        for name, value in (('OUTPUT_DIR', Path(self.tmp.name)), ('PLOT_SAVE', True),
+                            ('PLOT_SHOW', False), ('PLOT_FORMAT', 'png')):
+            patcher = mock.patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Team colors come from FastF1's driver list, which needs network access
+        patcher = mock.patch('fastf1.plotting.get_team_color', return_value='#123456')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def output_path(self) -> Path:
+        return Path(self.tmp.name) / '2023_TestGrandPrix_Race_ConstructorPaceDelta.png'
+
+    def test_inline_rendering_saves_plot(self):
+        plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        self.assertTrue(self.output_path().exists())
+
+    def test_payload_is_plain_data(self):
+        with mock.patch.object(plot_generator, 'render_payload') as render:
+            plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        kind, payload, digest = render.call_args.args
+        self.assertEqual(kind, 'constructor_pace_deltas')
+        self.assertEqual(payload['teams'], ['Red Bull Racing', 'Ferrari', 'Mercedes'])
+        self.assertAlmostEqual(payload['deltas'][1], 0.0)
+        self.assertAlmostEqual(payload['deltas'][2], 0.9)
+        self.assertEqual(payload['colors'], ['#123456'] * 3)
+        self.assertEqual(digest, plot_generator.payload_hash(kind, payload))
+
+    def test_unchanged_plot_is_skipped(self):
+        plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        with mock.patch.dict(plot_generator._RENDERERS, constructor_pace_deltas=mock.Mock(return_value=True)) as renderers:
+            plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+            renderers['constructor_pace_deltas'].assert_not_called()
+
+            with mock.patch.object(config, 'PLOT_DPI', 300): # Settings are part of the hash
+                plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+            self.assertEqual(renderers['constructor_pace_deltas'].call_count, 1)
+
+    def test_force_replot_renders_again(self):
+        plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        with mock.patch.object(config, 'PLOT_FORCE_REPLOT', True), \
+                mock.patch.dict(plot_generator._RENDERERS, constructor_pace_deltas=mock.Mock(return_value=True)) as renderers:
+            plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+            renderers['constructor_pace_deltas'].assert_called_once()
+
+    def test_missing_image_is_rendered_again(self):
+        plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        self.output_path().unlink()
+        plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+        self.assertTrue(self.output_path().exists())
+
+    def test_render_pool_saves_plot(self):
+        self.assertTrue(render_pool.start(1))
+        try:
+            self.assertTrue(render_pool.is_active())
+            plot_generator.plot_constructor_pace_deltas(PACE, SESSION_INFO, session=None)
+            self.assertEqual(render_pool.wait_all(), 0)
+        finally:
+            render_pool.shutdown()
+        self.assertFalse(render_pool.is_active())
+        self.assertTrue(self.output_path().exists())
+
+
+class TestSessionPalette(unittest.TestCase):
+
+    def setUp(self):
+        palette.clear_cache()
+        self.addCleanup(palette.clear_cache)
+        self.session = fastf1.core.Session(make_event(), 'Race', f1_api_support=True)
+        patches = {
+            'get_driver_color_mapping': mock.Mock(return_value={'VER': '#3671c6', 'XXX': '#ffffff'}),
+            'list_team_names': mock.Mock(return_value=['Red Bull Racing']),
+            'get_team_color': mock.Mock(side_effect=lambda team, **kwargs: '#3671c6' if team.startswith('Red Bull') else None),
+            'get_driver_color': mock.Mock(return_value=None),
+        }
+        for name, replacement in patches.items():
+            patcher = mock.patch(f'fastf1.plotting.{name}', replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.lookups = patches
+
+    def test_palette_is_resolved_once_per_session(self):
+        first = palette.get_palette(self.session)
+        second = palette.get_palette(fastf1.core.Session(make_event(), 'Race', f1_api_support=True))
+        self.assertIs(first, second)
+        self.assertEqual(first.driver_color('VER', 'Red Bull Racing'), '#3671c6')
+        self.lookups['get_driver_color_mapping'].assert_called_once()
+        self.lookups['get_driver_color'].assert_not_called()
+
+    def test_fallbacks(self):
+        session_palette = palette.get_palette(self.session)
+        # White driver color -> team color; unknown team -> grey
+        self.assertEqual(session_palette.driver_color('XXX', 'Red Bull Racing Honda'), '#3671c6')
+        self.assertEqual(session_palette.driver_color('UNK', 'Unknown Team'), palette.FALLBACK_COLOR)
+        session_palette.team_color('Unknown Team')
+        self.assertEqual(self.lookups['get_driver_color'].call_count, 1)
+        # One batch lookup for the session's team plus one memoized lookup per unknown name
+        self.assertEqual(self.lookups['get_team_color'].call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# f1_analysis_dashboard/tests/test_position_analysis.py
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import position_analysis
+from f1_analysis_dashboard.src.analysis.race_trace_analysis import RaceMatrix
+from f1_analysis_dashboard.tests import fixtures
+
+
+class TestPasses(unittest.TestCase):
+
+    def setUp(self):
+        # BBB passes AAA on lap 2 on track; CCC gets ahead of AAA on lap 4 while AAA pits (in-lap 3, out-lap 4)
+        self.laps = fixtures.laps_from_times({
+            'AAA': [100, 201, 302, 425, 525],
+            'BBB': [101, 200, 300, 400, 500],
+            'CCC': [102, 203, 305, 406, 507],
+        }, pit_stops=[('AAA', 3)])
+        self.matrix = RaceMatrix.from_laps(self.laps)
+
+    def test_on_track_and_pit_cycle_passes(self):
+        events = position_analysis.overtakes(self.matrix, position_analysis.pit_laps(self.matrix, self.laps))
+        self.assertEqual(list(events[[config.COL_LAP_NUMBER, config.COL_DRIVER, 'PassedDriver', 'PitCycle']]
+                              .itertuples(index=False, name=None)),
+                         [(2, 'BBB', 'AAA', False), (4, 'CCC', 'AAA', True)])
+
+    def test_stops_inferred_from_stints(self):
+        laps = self.laps.drop(columns=[position_analysis.COL_PIT_IN, position_analysis.COL_PIT_OUT])
+        laps[config.COL_COMPOUND] = 'SOFT'
+        laps[config.COL_TYRE_LIFE] = laps[config.COL_LAP_NUMBER]
+        laps.loc[(laps[config.COL_DRIVER] == 'AAA') & (laps[config.COL_LAP_NUMBER] >= 4), config.COL_COMPOUND] = 'HARD'
+        pitted = position_analysis.pit_laps(self.matrix, laps)
+        np.testing.assert_array_equal(pitted[0], [False, False, True, True, False])
+        self.assertFalse(pitted[1:].any())
+
+
+class TestPositionChanges(unittest.TestCase):
+
+    def test_counters_match_pairwise_loop(self):
+        session = synthetic.make_session(n_drivers=8, n_laps=25)
+        changes = position_analysis.get_position_changes(session)
+        self.assertEqual(len(changes), len(session.laps))
+        self.assertEqual(changes['OnTrackGained'].sum() + changes['PitCycleGained'].sum(),
+                         changes['OnTrackLost'].sum() + changes['PitCycleLost'].sum())
+
+        position = changes.pivot(index=config.COL_DRIVER, columns=config.COL_LAP_NUMBER, values=config.COL_POSITION)
+        gained = changes.pivot(index=config.COL_DRIVER, columns=config.COL_LAP_NUMBER,
+                               values='OnTrackGained') + changes.pivot(index=config.COL_DRIVER,
+                                                                       columns=config.COL_LAP_NUMBER,
+                                                                       values='PitCycleGained')
+        for lap in range(2, 26): # Every driver completes every lap: passes are the drivers newly behind
+            for driver in position.index:
+                before, after = position[lap - 1], position[lap]
+                expected = ((before < before[driver]) & (after > after[driver])).sum()
+                self.assertEqual(gained.loc[driver, lap], expected)
+
+        summary = position_analysis.summarize_position_changes(changes)
+        self.assertEqual(summary['NetChange'].sum(), 0)
+        windows = position_analysis.summarize_position_changes(changes, window=10)
+        self.assertEqual(sorted(windows['LapEnd'].unique()), [10, 20, 25])
+        self.assertEqual(windows['OnTrackGained'].sum(), changes['OnTrackGained'].sum())
+
+    def test_start_counted_from_grid(self):
+        session = synthetic.make_session(n_drivers=8, n_laps=25)
+        pit_lane = session.results[config.COL_ABBREVIATION].iloc[0]
+        session.results.loc[session.results[config.COL_ABBREVIATION] == pit_lane, config.COL_GRID_POSITION] = 0
+        changes = position_analysis.get_position_changes(session)
+        lap_one = changes[changes[config.COL_LAP_NUMBER] == 1].set_index(config.COL_DRIVER)
+        grid = session.results.set_index(config.COL_ABBREVIATION)[config.COL_GRID_POSITION]
+        started = lap_one.index != pit_lane
+        np.testing.assert_array_equal(lap_one['PositionChange'][started],
+                                      (grid[lap_one.index] - lap_one[config.COL_POSITION])[started])
+        self.assertEqual(lap_one.loc[pit_lane, 'PositionChange'], 0)
+
+        summary = position_analysis.summarize_position_changes(changes).set_index(config.COL_DRIVER)
+        expected_start = grid[summary.index].where(summary.index != pit_lane, lap_one.loc[pit_lane, config.COL_POSITION])
+        np.testing.assert_array_equal(summary['StartPosition'], expected_start)
+        net = changes.groupby(config.COL_DRIVER)['PositionChange'].sum()
+        np.testing.assert_array_equal(summary['NetChange'], net[summary.index]) # Every lap timed: the changes add up
+
+    def test_lap_without_timing(self):
+        session = synthetic.make_session(n_drivers=8, n_laps=25)
+        gap = (session.laps[config.COL_DRIVER] == 'AAA') & (session.laps[config.COL_LAP_NUMBER] == 10)
+        session.laps.loc[gap, config.COL_TIME] = pd.NaT
+        changes = position_analysis.get_position_changes(session)
+        self.assertEqual(len(changes), len(session.laps) - 1)
+        after_gap = changes[(changes[config.COL_DRIVER] == 'AAA') & (changes[config.COL_LAP_NUMBER] == 11)]
+        self.assertEqual(after_gap['PositionChange'].tolist(), [0])
+        self.assertTrue(changes['PositionChange'].abs().max() < 8)
+        summary = position_analysis.summarize_position_changes(changes)
+        self.assertTrue(summary['NetChange'].abs().max() < 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+# f1_analysis_dashboard/tests/test_prefetch.py
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import requests_cache
+import fastf1 as ff1
+import fastf1._api
+from fastf1.req import RateLimitExceededError
+
+from f1_analysis_dashboard import prefetch
+from f1_analysis_dashboard.src.utils import metrics
+
+
+class StandInAPI:
+    """Local HTTP server standing in for the livetiming API."""
+
+    def __init__(self, pages, transient_failures=None):
+        self.pages = pages # path -> body
+        self.transient_failures = dict(transient_failures or {}) # path -> number of 503s before success
+        self.requests = []
+        self.client_ports = set()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1' # Allows keep-alive
+
+            def do_GET(self):
+                api.requests.append(self.path)
+                api.client_ports.add(self.client_address[1])
+                if api.transient_failures.get(self.path, 0) > 0:
+                    api.transient_failures[self.path] -= 1
+                    self._reply(503, b'busy')
+                elif self.path in api.pages:
+                    self._reply(200, api.pages[self.path])
+                else:
+                    self._reply(404, b'not found')
+
+            def _reply(self, code, body):
+                self.send_response(code)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.http = requests_cache.CachedSession(backend='memory')
+        self.addCleanup(self.http.close)
+
+    def _api(self, pages, transient_failures=None):
+        api = StandInAPI(pages, transient_failures)
+        self.addCleanup(api.close)
+        return api
+
+    def test_session_targets(self):
+        targets = prefetch.session_targets('2023 R2 R', '/2023/x/', ['laps', 'messages'])
+        pages = [target.label.split()[-1] for target in targets]
+        self.assertEqual(pages[:2], ['session_info', 'driver_list'])
+        self.assertEqual(pages.count('race_control_messages'), 1)
+        self.assertEqual(targets[2].path, '/2023/x/TimingData.jsonStream')
+
+    def test_prefetch_retries_and_reuses_cache(self):
+        targets = prefetch.session_targets('2023 R2 R', '/2023/x/', ['laps'])
+        pages = {target.path: b'0' * 100 for target in targets if 'lap_count' not in target.label}
+        api = self._api(pages, transient_failures={targets[0].path: 2})
+
+        results = prefetch.prefetch(targets, http=self.http, base_urls=[api.url], workers=3, backoff=0.01)
+        summary = prefetch.summarize(results)
+        self.assertEqual(summary['miss'], {'requests': len(targets) - 1, 'bytes': 100 * (len(targets) - 1)})
+        self.assertEqual(summary['missing']['requests'], 1)
+        retried, = [r for r in results if r.target == targets[0]]
+        self.assertEqual((retried.status, retried.attempts), ('miss', 3))
+        self.assertLessEqual(len(api.client_ports), 3) # Connections are kept alive and reused
+
+        served = len(api.requests)
+        results = prefetch.prefetch(targets, http=self.http, base_urls=[api.url], workers=3, backoff=0.01)
+        self.assertEqual(prefetch.summarize(results)['hit']['requests'], len(targets) - 1)
+        self.assertEqual(len(api.requests), served + 1) # Only the missing page is requested again
+
+    def test_gives_up_after_retries_and_falls_back_to_mirror(self):
+        targets = prefetch.session_targets('2023 R2 R', '/2023/x/', [])
+        primary = self._api({}, transient_failures={targets[0].path: 10})
+        mirror = self._api({target.path: b'{}' for target in targets})
+        results = prefetch.prefetch(targets, http=self.http, base_urls=[primary.url], retries=1, backoff=0.01)
+        self.assertEqual(sorted(r.status for r in results), ['failed', 'missing'])
+
+        results = prefetch.prefetch(targets, http=self.http, base_urls=[primary.url, mirror.url],
+                                    retries=1, backoff=0.01)
+        self.assertEqual([r.status for r in results], ['miss', 'miss'])
+
+    def test_rate_limit_skips_remaining_pages(self):
+        targets = prefetch.session_targets('2023 R2 R', '/2023/x/', ['laps'])
+        with mock.patch.object(self.http, 'get', side_effect=RateLimitExceededError('Hard limit reached.')):
+            results = prefetch.prefetch(targets, http=self.http, base_urls=['http://127.0.0.1:9'], workers=1)
+        self.assertEqual(prefetch.summarize(results)['skipped']['requests'], len(targets))
+
+
+
+class TestStoreParsed(unittest.TestCase):
+
+    def setUp(self):
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        patch = mock.patch.object(ff1.Cache, '_CACHE_DIR', cache_dir.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.session = prefetch.PrefetchSession('2023 R2 R', 2023, 2, 'Race', '/static/2023/x/')
+        self.targets = prefetch.session_targets('2023 R2 R', self.session.api_path, ['laps'], self.session)
+
+    def _parsers(self):
+        """Stand-ins for the wrapped fastf1._api parsers, keeping their names."""
+        parsers = {}
+        for name in set(prefetch.PAGE_PARSERS.values()):
+            parsers[name] = mock.Mock(__name__=name)
+            patch = mock.patch.object(fastf1._api, name, parsers[name])
+            patch.start()
+            self.addCleanup(patch.stop)
+        return parsers
+
+    def test_downloaded_pages_are_parsed_once(self):
+        parsers = self._parsers()
+        results = [prefetch.FetchResult(target, 'miss') for target in self.targets]
+        results[-1] = results[-1]._replace(status='missing') # Not on the API: nothing to parse
+        # A page already stored parsed is not parsed again
+        timing = ff1.Cache._get_cache_file_path(self.session.api_path, '_extended_timing_data')
+        open(timing, 'wb').close()
+
+        with mock.patch.object(fastf1.ergast, 'Ergast') as ergast:
+            parsed = prefetch.store_parsed(results)
+        statuses = {result.label.split()[-1]: result.status for result in parsed}
+        self.assertEqual(statuses['timing_data'], 'cached')
+        self.assertEqual(statuses['session_info'], 'stored')
+        self.assertEqual(statuses['ergast'], 'stored')
+        self.assertNotIn(self.targets[-1].page, statuses)
+        parsers['session_info'].assert_called_once_with(self.session.api_path)
+        parsers['_extended_timing_data'].assert_not_called()
+        ergast.return_value.get_race_results.assert_called_once_with(2023, 2)
+        ergast.return_value.get_lap_times.assert_called_once_with(2023, 2, lap_number=1)
+
+    def test_parser_exit_does_not_end_the_run(self):
+        parsers = self._parsers()
+        parsers['driver_info'].side_effect = SystemExit # FastF1 exits when a parser returns no data
+        results = [prefetch.FetchResult(target, 'hit') for target in self.targets[:2]]
+        parsed = prefetch.store_parsed(results, ergast=False)
+        self.assertEqual([result.status for result in parsed], ['stored', 'failed'])
+        self.assertFalse(os.path.isfile(ff1.Cache._get_cache_file_path(self.session.api_path, 'driver_info')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# f1_analysis_dashboard/tests/test_profiling.py
+import contextlib
+import io
+import json
+import pstats
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')
+
+from f1_analysis_dashboard import config, main
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.utils import profiling
+from f1_analysis_dashboard.tests import fixtures
+
+
+class TestStageTimer(unittest.TestCase):
+
+    def test_nested_stages_are_not_double_counted(self):
+        timer = profiling.StageTimer('test')
+        with timer.stage('report'):
+            with timer.stage('plot:a'):
+                sum(range(10000))
+        with timer.stage('load'):
+            pass
+        self.assertEqual([(r['stage'], r['depth']) for r in timer.records],
+                         [('report', 0), ('plot:a', 1), ('load', 0)])
+        total = timer.total()
+        self.assertAlmostEqual(total['wall_s'], timer.records[0]['wall_s'] + timer.records[2]['wall_s'])
+        self.assertIn('  plot:a', timer.summary_table())
+
+    def test_cprofile_dump(self):
+        timer = profiling.StageTimer('test', cprofile=True)
+        with timer.stage('work'):
+            sorted(range(1000), reverse=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = timer.dump_stats(Path(tmp) / 'test.prof')
+            self.assertGreater(pstats.Stats(str(path)).total_calls, 0)
+
+
+class TestProfiledRun(unittest.TestCase):
+
+    def test_profile_writes_timing_report(self):
+        session = synthetic.make_session(n_drivers=20, n_laps=10)
+        with tempfile.TemporaryDirectory() as tmp, fixtures.offline_colors(), \
+                mock.patch.object(config, 'OUTPUT_DIR', Path(tmp)), \
+                mock.patch.object(config, 'PROFILE_ENABLED', True), \
+                mock.patch.object(main.data_loader, 'load_session_data', return_value=session), \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertTrue(main.run_session_analysis(2023, 'Synthetic', 'R'))
+            report = json.loads((Path(tmp) / '2023_SyntheticGrandPrix_Race_timings.json').read_text())
+
+        stages = [record['stage'] for record in report['stages']]
+        self.assertEqual(stages[:2], ['load', 'prepare_laps'])
+        self.assertIn('analysis:constructor_pace', stages)
+        self.assertIn('plot:driver_fastest', stages)
+        self.assertIn('--- Stage Timings (2023_SyntheticGrandPrix_Race) ---', output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# f1_analysis_dashboard/tests/test_race_trace.py
+import unittest
+
+import numpy as np
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import race_trace_analysis
+from f1_analysis_dashboard.tests import fixtures
+
+
+class TestRaceMatrix(unittest.TestCase):
+
+    def test_retirement_and_lapped_car(self):
+        matrix = race_trace_analysis.RaceMatrix.from_laps(fixtures.laps_from_times({
+            'AAA': [100, 200, 300, 400],
+            'BBB': [101, 203, 306, 409],
+            'CCC': [110, 250], # Retired after lap 2
+            'DDD': [150, 310, 470], # Lapped by AAA, flagged a lap down
+        }))
+        self.assertEqual(matrix.drivers.tolist(), ['AAA', 'BBB', 'CCC', 'DDD'])
+        self.assertTrue(np.isnan(matrix.race_time[2, 2:]).all())
+        np.testing.assert_array_equal(matrix.positions()[:, 1], [1, 2, 3, 4])
+        np.testing.assert_array_equal(matrix.positions()[:, 3], [1, 2, np.nan, np.nan])
+        np.testing.assert_allclose(matrix.interval()[:, 1], [0, 3, 47, 60])
+        np.testing.assert_array_equal(matrix.laps_down()[3], [0, 1, 1, np.nan]) # Leader a lap ahead from 310s on
+        np.testing.assert_array_equal(matrix.laps_down()[1], [0, 0, 0, 0])
+
+    def test_lap_time_fallback(self):
+        laps = fixtures.laps_from_times({'AAA': [100, 200], 'BBB': [102, 205]})
+        laps[config.COL_LAP_TIME] = laps.groupby(config.COL_DRIVER)[config.COL_TIME].diff().fillna(laps[config.COL_TIME])
+        from_time = race_trace_analysis.RaceMatrix.from_laps(laps)
+        from_lap_times = race_trace_analysis.RaceMatrix.from_laps(laps.drop(columns=config.COL_TIME))
+        np.testing.assert_allclose(from_lap_times.gap_to_leader(), from_time.gap_to_leader())
+
+
+class TestRaceTrace(unittest.TestCase):
+
+    def test_matches_per_lap_pandas(self):
+        session = synthetic.make_session(n_drivers=10, n_laps=20)
+        session.laps = session.laps[~((session.laps[config.COL_DRIVER] == 'AAA')
+                                      & (session.laps[config.COL_LAP_NUMBER] > 12))]
+        trace = race_trace_analysis.get_race_trace(session)
+        self.assertEqual(len(trace), len(session.laps))
+
+        laps = session.laps.assign(Seconds=session.laps[config.COL_TIME].dt.total_seconds())
+        expected_gap = laps['Seconds'] - laps.groupby(config.COL_LAP_NUMBER)['Seconds'].transform('min')
+        expected_position = laps.groupby(config.COL_LAP_NUMBER)['Seconds'].rank(method='first').astype(int)
+        expected = laps.assign(GapToLeader=expected_gap, Position=expected_position)
+        merged = trace.merge(expected, on=[config.COL_DRIVER, config.COL_LAP_NUMBER], suffixes=('', '_expected'))
+        np.testing.assert_allclose(merged['GapToLeader'], merged['GapToLeader_expected'], atol=1e-6)
+        self.assertTrue((merged[config.COL_POSITION] == merged['Position_expected']).all())
+        self.assertFalse(((trace[config.COL_DRIVER] == 'AAA') & (trace[config.COL_LAP_NUMBER] > 12)).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
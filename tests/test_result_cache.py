@@ -0,0 +1,118 @@
+# f1_analysis_dashboard/tests/test_result_cache.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+
+from f1_analysis_dashboard import config, main
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src import result_cache
+from f1_analysis_dashboard.src.analysis import race_trace_analysis
+from f1_analysis_dashboard.src.plotting import palette
+from f1_analysis_dashboard.src.utils import formatting
+from f1_analysis_dashboard.tests import fixtures
+
+
+def _dated_session():
+    session = synthetic.make_session(n_drivers=20, n_laps=20, telemetry=True) # Every analysis has a result
+    session.date = pd.Timestamp('2023-06-01 15:00') # Long finished
+    return session
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        for patch in (mock.patch.object(config, 'RESULT_CACHE_DIR', self.tmp / 'results'),
+                      mock.patch.object(config, 'OUTPUT_DIR', self.tmp / 'output'),
+                      mock.patch.object(config, 'CACHE_ENABLED', True),
+                      mock.patch.object(config, 'RESULT_CACHE_ENABLED', True)):
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.session = _dated_session()
+        self.session_info = {'Year': 2023, 'EventName': 'Synthetic Grand Prix', 'SessionName': 'Race'}
+
+    def _results(self):
+        prepared = main.helpers.prepare_laps(self.session)
+        return {name: func(self.session, prepared) if 'laps' in func.required_components else func(self.session)
+                for name, func in main.ANALYSES.items()}
+
+    def test_round_trip(self):
+        results = self._results()
+        written = result_cache.save_results(self.session, 2023, 'Synthetic', 'R', self.session_info,
+                                            main.ANALYSES, results)
+        self.assertEqual(written, len(main.ANALYSES))
+        meta, cached = result_cache.load_results(2023, 'Synthetic', 'R', main.ANALYSES)
+        self.assertEqual(meta['session_info'], self.session_info)
+        pd.testing.assert_frame_equal(cached['driver_fastest'], results['driver_fastest'])
+        pd.testing.assert_frame_equal(cached['official_results'], results['official_results'])
+        pd.testing.assert_series_equal(cached['constructor_pace'], results['constructor_pace'])
+        pd.testing.assert_frame_equal(cached['telemetry_comparison'], results['telemetry_comparison'])
+        self.assertEqual(cached['overall_fastest']['LapTime'], results['overall_fastest']['LapTime'])
+        self.assertEqual(cached['overall_fastest']['Driver'], results['overall_fastest']['Driver'])
+
+    def test_settings_and_recent_sessions_miss(self):
+        result_cache.save_results(self.session, 2023, 'Synthetic', 'R', self.session_info, main.ANALYSES, self._results())
+        with mock.patch.object(config, 'PACE_FILTER_THRESHOLD', 1.07):
+            self.assertIsNone(result_cache.load_results(2023, 'Synthetic', 'R', main.ANALYSES))
+        self.assertIsNotNone(result_cache.load_results(2023, 'Synthetic', 'R',
+                                                       {'official_results': main.ANALYSES['official_results']}))
+
+        self.session.date = pd.Timestamp.now()
+        self.assertEqual(result_cache.save_results(self.session, 2023, 'Live', 'R', self.session_info,
+                                                   main.ANALYSES, self._results()), 0)
+
+    def test_eviction_removes_least_recently_used(self):
+        result_cache.save_results(self.session, 2023, 'Synthetic', 'R', self.session_info, main.ANALYSES, self._results())
+        entries = sorted((config.RESULT_CACHE_DIR).glob('*.npz'))
+        for age, path in enumerate(entries):
+            os.utime(path, (1e9 + age, 1e9 + age))
+        budget = sum(path.stat().st_size for path in entries[1:])
+        self.assertEqual(result_cache.evict(budget), 1)
+        self.assertFalse(entries[0].exists())
+
+    def test_cached_run_skips_loading(self):
+        with fixtures.offline_colors(), contextlib.redirect_stdout(io.StringIO()), \
+                mock.patch.object(main.data_loader, 'load_session_data', return_value=self.session) as loader:
+            self.assertTrue(main.run_session_analysis(2023, 'Synthetic', 'R'))
+            palette.clear_cache()
+            plots = sorted(config.OUTPUT_DIR.glob('*.png'))
+            for plot in plots:
+                plot.unlink()
+            self.assertTrue(main.run_session_analysis(2023, 'Synthetic', 'R'))
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(sorted(config.OUTPUT_DIR.glob('*.png')), plots) # Re-rendered from cached results
+
+
+class TestCodeVersion(unittest.TestCase):
+
+    def test_dependency_change_changes_key(self):
+        func = main.ANALYSES['driver_fastest']
+        self.assertIn(formatting.__name__, result_cache.package_dependencies(func.__module__))
+        self.assertIn(race_trace_analysis.__name__,
+                      result_cache.package_dependencies(main.ANALYSES['position_changes'].__module__))
+
+        read_bytes = Path.read_bytes
+        edited = Path(formatting.__file__)
+
+        def edited_source(path):
+            return read_bytes(path) + (b'# edited' if path == edited else b'')
+
+        before = result_cache.code_version(func)
+        result_cache.code_version.cache_clear()
+        self.addCleanup(result_cache.code_version.cache_clear)
+        with mock.patch.object(Path, 'read_bytes', edited_source):
+            self.assertNotEqual(result_cache.code_version(func), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# f1_analysis_dashboard/tests/test_season.py
+import logging
+import multiprocessing
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+
+from f1_analysis_dashboard import season
+
+
+class MockEvent(pd.Series):
+    """Event stand-in that only knows its own session identifiers."""
+
+    def get_session_name(self, identifier):
+        if identifier not in self['Sessions']:
+            raise ValueError(f"No session '{identifier}'")
+        return identifier
+
+
+class MockSchedule(pd.DataFrame):
+
+    def get_event_by_round(self, round_number):
+        row = self[self['RoundNumber'] == round_number].iloc[0]
+        return MockEvent(row)
+
+
+class TestSeasonManifest(unittest.TestCase):
+
+    def test_manifest_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'manifest.json'
+            self.assertEqual(season.load_manifest(path), set())
+            season.write_manifest(path, 2023, {'1:R', '2:Q'})
+            self.assertEqual(season.load_manifest(path), {'1:R', '2:Q'})
+
+    def test_corrupt_manifest_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'manifest.json'
+            path.write_text('{not json')
+            self.assertEqual(season.load_manifest(path), set())
+
+    def test_plan_skips_missing_sessions_and_rounds(self):
+        schedule = MockSchedule({
+            'RoundNumber': [1, 2, 3],
+            'Sessions': [('Q', 'R'), ('Q', 'S', 'R'), ('Q', 'R')],
+        })
+        with mock.patch.object(season.ff1, 'get_event_schedule', return_value=schedule):
+            jobs = season.plan_season_jobs(2023, ['S', 'R'], first_round=2)
+        self.assertEqual(jobs, [(2, 'S'), (2, 'R'), (3, 'R')])
+
+
+class TestSeasonWorker(unittest.TestCase):
+
+    def test_spawned_worker_logs_info(self):
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=season._init_worker, initargs=(False,)) as pool:
+            root = logging.getLogger()
+            self.assertEqual(pool.submit(root.getEffectiveLevel).result(), logging.INFO)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# f1_analysis_dashboard/tests/test_server.py
+import json
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')
+
+from f1_analysis_dashboard import config, server
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.tests import fixtures
+
+
+def _make_session(year, event, session_identifier, load_config=None):
+    """load_session_data stand-in: a synthetic race named after the requested event."""
+    session = synthetic.make_session(n_drivers=20, n_laps=20, telemetry=bool(load_config and load_config['telemetry']))
+    session.event['EventName'] = f"{event} Grand Prix"
+    return session
+
+
+class TestAnalysisServer(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        colors = fixtures.offline_colors()
+        colors.__enter__()
+        self.addCleanup(colors.__exit__, None, None, None)
+        for patch in (mock.patch.object(config, 'OUTPUT_DIR', Path(tmp.name)),
+                      mock.patch.object(config, 'PLOT_SHOW', False),
+                      mock.patch.object(config, 'TELEMETRY_STORE_ENABLED', False),
+                      mock.patch.object(server.dashboard.data_loader, 'load_session_data', side_effect=_make_session)):
+            self.loader = patch.start()
+            self.addCleanup(patch.stop)
+
+    def _serve(self, cache):
+        httpd = server.make_server('127.0.0.1', 0, cache)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        self.addCleanup(httpd.server_close)
+        self.addCleanup(httpd.shutdown)
+        return f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    def _get(self, url):
+        with urllib.request.urlopen(url) as response:
+            return response.headers['Content-Type'], response.read()
+
+    def test_repeat_requests_are_served_from_memory(self):
+        url = self._serve(server.SessionCache())
+        content_type, body = self._get(f"{url}/sessions/2023/Synthetic/R")
+        document = json.loads(body)
+        self.assertEqual(content_type, 'application/json')
+        self.assertEqual(document['session']['EventName'], 'Synthetic Grand Prix')
+        self.assertEqual(len(document['driver_fastest']), 20)
+
+        _, table = self._get(f"{url}/sessions/2023/Synthetic/R/analyses/constructor_pace")
+        self.assertEqual(json.loads(table), document['constructor_pace'])
+        content_type, image = self._get(f"{url}/sessions/2023/Synthetic/R/plots/driver_fastest")
+        self.assertEqual(content_type, 'image/png')
+        self.assertTrue(image.startswith(b'\x89PNG'))
+
+        stats = json.loads(self._get(f"{url}/cache")[1])
+        self.assertEqual((stats['misses'], stats['hits']), (1, 2))
+        self.assertEqual(self.loader.call_count, 1)
+        self.assertGreater(stats['sessions'][0]['bytes'], len(image))
+
+    def test_opt_in_analysis_loaded_on_demand(self):
+        cache = server.SessionCache()
+        url = self._serve(cache)
+        document = json.loads(self._get(f"{url}/sessions/2023/Synthetic/R")[1])
+        self.assertIsNone(document['telemetry_comparison'])
+        self.assertFalse(self.loader.call_args.kwargs['load_config']['telemetry'])
+
+        content_type, image = self._get(f"{url}/sessions/2023/Synthetic/R/plots/minisector_dominance")
+        self.assertEqual(content_type, 'image/png')
+        self.assertTrue(self.loader.call_args.kwargs['load_config']['telemetry'])
+        self._get(f"{url}/sessions/2023/Synthetic/R/plots/telemetry_comparison")
+        traces = json.loads(self._get(f"{url}/sessions/2023/Synthetic/R/analyses/telemetry_comparison")[1])
+        self.assertEqual(len({row['Driver'] for row in traces}), 20)
+        document = json.loads(self._get(f"{url}/sessions/2023/Synthetic/R")[1])
+        self.assertEqual(document['telemetry_comparison'], traces)
+        self.assertEqual(self.loader.call_count, 2) # The telemetry load happens once
+
+    def test_errors(self):
+        url = self._serve(server.SessionCache())
+        for path, code in (('/sessions/2023/Synthetic/R/plots/unknown', 404),
+                           ('/sessions/20x3/Synthetic/R', 400), ('/nothing', 404)):
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                self._get(url + path)
+            self.assertEqual(context.exception.code, code)
+        self.loader.assert_not_called()
+
+    def test_eviction_by_size(self):
+        cache = server.SessionCache()
+        first = cache.get(2023, 'Bahrain', 'R')
+        cache.max_bytes = int(first.nbytes * 1.5) # Room for one session only
+        cache.get(2023, 'Jeddah', 'R')
+        self.assertEqual([s['event'] for s in cache.stats()['sessions']], ['jeddah'])
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.total_bytes, cache.stats()['sessions'][0]['bytes'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# f1_analysis_dashboard/tests/test_session_store.py
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import fastf1
+import fastf1.events
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import session_store
+
+
+def make_event() -> fastf1.events.Event:
+    data = {'RoundNumber': 2, 'Country': 'Saudi Arabia', 'Location': 'Jeddah',
+            'EventName': 'Saudi Arabian Grand Prix', 'EventDate': pd.Timestamp('2023-03-19'),
+            'EventFormat': 'conventional', 'F1ApiSupport': True}
+    names = ['Practice 1', 'Practice 2', 'Practice 3', 'Qualifying', 'Race']
+    for number, name in enumerate(names, start=1):
+        utc = pd.Timestamp('2023-03-17 13:30') + pd.Timedelta(hours=12 * number)
+        data[f'Session{number}'] = name
+        data[f'Session{number}DateUtc'] = utc
+        data[f'Session{number}Date'] = utc.tz_localize('UTC').tz_convert('Asia/Riyadh')
+    return fastf1.events.Event(data, year=2023)
+
+
+def make_session() -> fastf1.core.Session:
+    session = fastf1.core.Session(make_event(), 'Race', f1_api_support=True)
+    n_laps = 100
+    laps = pd.DataFrame({
+        config.COL_DRIVER: np.where(np.arange(n_laps) % 2 == 0, 'VER', 'PER'),
+        config.COL_LAP_TIME: pd.to_timedelta(90 + np.arange(n_laps) * 0.1, unit='s'),
+        config.COL_LAP_NUMBER: np.arange(n_laps, dtype=float),
+        config.COL_IS_ACCURATE: np.arange(n_laps) % 3 != 0,
+        config.COL_COMPOUND: pd.Series(['SOFT', None] * (n_laps // 2), dtype=object),
+        'Deleted': pd.Series([False, None] * (n_laps // 2), dtype=object),
+    })
+    laps.loc[3, config.COL_LAP_TIME] = pd.NaT
+    session._laps = fastf1.core.Laps(laps, session=session)
+    results = pd.DataFrame({
+        config.COL_ABBREVIATION: ['VER', 'PER'],
+        config.COL_TEAM_NAME: ['Red Bull Racing', 'Red Bull Racing'],
+        config.COL_POSITION: [1.0, 2.0],
+        config.COL_TIME: pd.to_timedelta([5000, 5005], unit='s'),
+    }, index=pd.Index(['1', '11'], name='DriverNumber'))
+    session._results = fastf1.core.SessionResults(results)
+    return session
+
+
+class TestSessionStore(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(config, 'SESSION_STORE_DIR', Path(self._tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def test_round_trip(self):
+        session = make_session()
+        self.assertTrue(session_store.save_session(session, 2023, 'Jeddah', 'R'))
+        loaded = session_store.load_session(2023, 'Jeddah', 'R')
+        pd.testing.assert_frame_equal(pd.DataFrame(loaded.laps), pd.DataFrame(session.laps))
+        pd.testing.assert_frame_equal(pd.DataFrame(loaded.results), pd.DataFrame(session.results))
+        self.assertEqual(loaded.name, 'Race')
+        self.assertEqual(loaded.event['EventName'], 'Saudi Arabian Grand Prix')
+        self.assertEqual(loaded.event.year, 2023)
+        self.assertIs(loaded.laps.session, loaded)
+
+    def test_miss_and_version_mismatch(self):
+        self.assertIsNone(session_store.load_session(2023, 'Jeddah', 'R'))
+        session_store.save_session(make_session(), 2023, 'Jeddah', 'R')
+        with mock.patch.object(session_store, 'STORE_VERSION', session_store.STORE_VERSION + 1):
+            self.assertIsNone(session_store.load_session(2023, 'Jeddah', 'R'))
+
+    def test_covers_only_laps_and_results(self):
+        self.assertTrue(session_store.covers({'laps': True, 'telemetry': False}))
+        self.assertFalse(session_store.covers({'laps': True, 'telemetry': True}))
+
+
+if __name__ == '__main__':
+    unittest.main()
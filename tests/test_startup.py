@@ -0,0 +1,36 @@
+# f1_analysis_dashboard/tests/test_startup.py
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+# Cold-start budget for importing the entry point without plotting. FastF1 and
+# pandas alone take well under a second on a typical machine; the plotting
+# stack roughly doubles that, so a generous fixed budget still catches it.
+IMPORT_BUDGET_SECONDS: float = 4.0
+
+_PROBE = (
+    "import sys\n"
+    "import f1_analysis_dashboard.main\n"
+    "heavy = [name for name in ('matplotlib', 'seaborn', 'fastf1.plotting') if name in sys.modules]\n"
+    "print('heavy=' + ','.join(heavy))\n"
+)
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_main_import_skips_plotting_stack(self):
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', _PROBE], capture_output=True, text=True, env=env, timeout=60)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        heavy = [line for line in result.stdout.splitlines() if line.startswith('heavy=')]
+        self.assertEqual(heavy, ['heavy='], f"Plotting modules imported at startup: {heavy}")
+        self.assertLess(elapsed, IMPORT_BUDGET_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# f1_analysis_dashboard/tests/test_telemetry_analysis.py
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.benchmarks import synthetic
+from f1_analysis_dashboard.src.analysis import lap_analysis, telemetry_analysis
+
+
+class TestResampling(unittest.TestCase):
+
+    def test_matches_per_lap_interp(self):
+        rng = np.random.default_rng(0)
+        distances = [np.cumsum(rng.uniform(0, 12, n)) for n in (400, 523, 61)]
+        distances[1][10:13] = distances[1][10] # Repeated distance samples (car stationary)
+        speeds = [rng.uniform(80, 320, len(distance)) for distance in distances]
+        grid = np.arange(0.0, min(distance[-1] for distance in distances), 5.0)
+
+        resampled = telemetry_analysis.resample_to_distance(distances, {'Speed': speeds}, grid)
+        self.assertEqual(resampled['Speed'].shape, (3, len(grid)))
+        for lap, (distance, speed) in enumerate(zip(distances, speeds)):
+            np.testing.assert_allclose(resampled['Speed'][lap], np.interp(grid, distance, speed))
+
+
+class TestMiniSectorDominance(unittest.TestCase):
+
+    def test_fastest_driver_per_mini_sector(self):
+        grid = np.arange(0.0, 100.0, 10.0) # 10 points
+        # AAA is quicker over the first half, BBB over the second
+        elapsed = {'AAA': np.r_[np.arange(5) * 1.0, 4 + np.arange(1, 6) * 1.2],
+                   'BBB': np.r_[np.arange(5) * 1.1, 4.4 + np.arange(1, 6) * 1.0]}
+        traces = pd.DataFrame({
+            config.COL_DRIVER: np.repeat(list(elapsed), len(grid)),
+            config.COL_TEAM: np.repeat(['Team A', 'Team B'], len(grid)),
+            'Distance': np.tile(grid, 2),
+            'Time': np.concatenate(list(elapsed.values())),
+        })
+        dominance = telemetry_analysis.minisector_dominance(traces, n_mini_sectors=3)
+        self.assertEqual(dominance[config.COL_DRIVER].tolist(), ['AAA', 'BBB', 'BBB'])
+        self.assertTrue((dominance['GapSeconds'] > 0).all())
+        self.assertEqual(dominance['StartDistance'].iloc[0], 0.0)
+        self.assertEqual(dominance['EndDistance'].iloc[-1], 90.0)
+
+
+class TestFastestLapTelemetry(unittest.TestCase):
+
+    def setUp(self):
+        self.session = synthetic.make_session(n_drivers=6, n_laps=10, telemetry=True)
+        patch = mock.patch.object(config, 'TELEMETRY_STORE_ENABLED', False)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_traces_share_distance_axis(self):
+        traces = telemetry_analysis.get_fastest_lap_telemetry(self.session)
+        fastest = lap_analysis.get_driver_fastest_laps(self.session)
+        self.assertEqual(traces[config.COL_DRIVER].unique().tolist(), fastest[config.COL_DRIVER].tolist())
+        distance = telemetry_analysis.trace_matrix(traces, 'Distance')
+        self.assertTrue((distance == distance[0]).all())
+        self.assertEqual(distance[0, 1] - distance[0, 0], config.TELEMETRY_DISTANCE_STEP)
+        elapsed = telemetry_analysis.trace_matrix(traces, 'Time')
+        self.assertTrue((np.diff(elapsed, axis=1) >= 0).all())
+
+    def test_without_telemetry(self):
+        self.session.car_data = {}
+        self.assertIsNone(telemetry_analysis.get_fastest_lap_telemetry(self.session))
+
+
+if __name__ == '__main__':
+    unittest.main()
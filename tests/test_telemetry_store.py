@@ -0,0 +1,73 @@
+# f1_analysis_dashboard/tests/test_telemetry_store.py
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import fastf1
+import numpy as np
+import pandas as pd
+
+from f1_analysis_dashboard import config
+from f1_analysis_dashboard.src import telemetry_store
+from f1_analysis_dashboard.tests.test_session_store import make_event
+
+T0 = pd.Timestamp('2023-03-19 17:00')
+
+
+def make_telemetry_session(n_samples: int = 400) -> fastf1.core.Session:
+    session = fastf1.core.Session(make_event(), 'Race', f1_api_support=True)
+    session_time = pd.to_timedelta(np.arange(n_samples) * 0.25, unit='s')
+    car = fastf1.core.Telemetry({
+        'Date': T0 + session_time, 'SessionTime': session_time,
+        'Time': session_time, 'Speed': np.full(n_samples, 180.0),
+        'RPM': np.full(n_samples, 11000.0), 'nGear': np.full(n_samples, 7),
+        'Throttle': np.full(n_samples, 100.0), 'Brake': np.zeros(n_samples, dtype=bool),
+        'DRS': np.zeros(n_samples), 'Source': 'car',
+    }, session=session)
+    pos_time = session_time + pd.Timedelta(milliseconds=110)
+    pos = fastf1.core.Telemetry({
+        'Date': T0 + pos_time, 'SessionTime': pos_time, 'Time': pos_time,
+        'X': np.arange(n_samples, dtype=float), 'Y': np.zeros(n_samples),
+        'Z': np.zeros(n_samples), 'Status': 'OnTrack', 'Source': 'pos',
+    }, session=session)
+    session._t0_date = T0
+    session._car_data = {'1': car}
+    session._pos_data = {'1': pos}
+    session._laps = fastf1.core.Laps({
+        'DriverNumber': ['1', '1'], config.COL_DRIVER: ['VER', 'VER'],
+        config.COL_LAP_NUMBER: [1.0, 2.0],
+        'LapStartTime': pd.to_timedelta([0.0, 50.0], unit='s'),
+        config.COL_TIME: pd.to_timedelta([50.0, 99.0], unit='s'),
+    }, session=session)
+    return session
+
+
+class TestTelemetryStore(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(config, 'TELEMETRY_STORE_DIR', Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_and_slice_lap(self):
+        session = make_telemetry_session()
+        self.assertFalse(telemetry_store.exists(session))
+        self.assertTrue(telemetry_store.write_session(session))
+        self.assertEqual(session.car_data, {}) # Released after writing
+
+        store = telemetry_store.open_session(session)
+        self.assertEqual(store.drivers, ['VER'])
+        lap = store.lap('VER', 2)
+        self.assertIsInstance(lap['Speed'].base, np.memmap) # Zero-copy view
+        self.assertEqual(lap['nGear'].dtype, np.int8)
+        seconds = lap['SessionTime'] / 1e9
+        self.assertGreaterEqual(seconds.min(), 50.0)
+        self.assertLessEqual(seconds.max(), 99.0)
+        self.assertIsNone(store.lap('VER', 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 # f1_analysis_dashboard/tests/test_utils.py
 import unittest
+import numpy as np
 import pandas as pd
 
 # Adjust import path based on how you run tests (e.g., from project root)
@@ -53,6 +54,45 @@ class TestFormatting(unittest.TestCase):
          self.assertEqual(formatting.format_timedelta(td_minute), "01:00.000")
 
 
+class TestFormattingSeries(unittest.TestCase):
+
+    def assert_matches_scalar(self, values: pd.Series):
+        expected = values.map(formatting.format_timedelta)
+        pd.testing.assert_series_equal(formatting.format_timedelta_series(values), expected)
+
+    def test_timedelta_series_matches_scalar(self):
+        rng = np.random.default_rng(42)
+        nanoseconds = np.concatenate([
+            rng.integers(0, 200 * 10**9, 1000), rng.integers(-10**13, 10**13, 1000),
+            [0, -1, 59_999_999_999, 59_999_999_999 + 1, 119_999_999_999, 6_000 * 10**9],
+        ])
+        values = pd.Series(pd.to_timedelta(nanoseconds, unit='ns'))
+        values[3] = pd.NaT
+        self.assert_matches_scalar(values)
+
+    def test_seconds_series_matches_scalar(self):
+        values = pd.Series([90.123, 125.0, 59.9995, -5.5, np.nan, np.inf, 1e20])
+        self.assert_matches_scalar(values)
+        self.assert_matches_scalar(pd.Series([0, 125, 6001]))
+
+    def test_float32_seconds_series_matches_scalar(self):
+        # Compact-schema lap times; many sit on a millisecond rounding boundary in float32
+        rng = np.random.default_rng(7)
+        values = pd.Series(rng.uniform(60, 130, 50_000).astype(np.float32))
+        values[:3] = [np.float32(115.005), np.float32(90.1), np.nan]
+        self.assert_matches_scalar(values)
+        # Scalars as they come out of a compact lap row (np.float32, not Python float)
+        self.assertEqual(formatting.format_timedelta_series(values).tolist(),
+                         [formatting.format_timedelta(value) for value in values.to_numpy()])
+        self.assertEqual(formatting.format_timedelta(np.float32(90.1)),
+                         formatting.format_timedelta_series(pd.Series([90.1], dtype='float32'))[0])
+
+    def test_object_series_falls_back(self):
+        values = pd.Series([pd.Timedelta(seconds=1), None, "invalid string", 5.0], dtype=object)
+        self.assertEqual(formatting.format_timedelta_series(values).tolist(),
+                         ["00:01.000", "N/A", "Invalid Time", "00:05.000"])
+
+
 # Example placeholder for helper tests (would need mocking)
 # class TestHelpers(unittest.TestCase):
 #     def test_ensure_team_info_missing_col(self):